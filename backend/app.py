@@ -1,4 +1,5 @@
 import os
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -6,14 +7,16 @@ from fastapi.responses import FileResponse
 import uvicorn
 from contextlib import asynccontextmanager
 from database import init_db
+from services import lunar, ai_queue, ai_client, code_registry, etag, index_check, serialization, search as search_service
 from dotenv import load_dotenv  # [추가 1] 환경변수 로드 라이브러리
 
 # 라우터들
 from routers import dashboard, cooking, review
 from routers.system import common_code
 from routers import travel, liquor, bucket, diary, calendar, family, culture, knitting
+from models import __all_models__
 from models.user import User
-from routers import auth, user as user_router
+from routers import auth, user as user_router, search
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -26,13 +29,46 @@ async def lifespan(app: FastAPI):
     else:
         print("✅ [성공] GEMINI_API_KEY 로드 완료! AI 소믈리에 대기 중.")
 
+    # 음력/양력 변환 테이블 미리 생성 (요청마다 라이브러리 계산 방지)
+    lunar.load_table()
+
     # 1. DB 초기화
     await init_db()
     print("✅ MongoDB Connected via Beanie!")
+    serialization.warm_up(__all_models__)  # 응답 직렬화용 TypeAdapter 미리 생성
+    etag.register(__all_models__)  # 문서 쓰기 시 컬렉션 버전 증가 (조건부 GET)
+    await code_registry.reload()  # 공통 코드 메모리 적재
+
+    # 1-1. 인덱스 점검 (선택): 대표 조회가 컬렉션 전체 스캔을 하면 경고
+    if os.getenv("DB_VERIFY_INDEXES") == "1":
+        collscans = await index_check.find_collscans()
+        if collscans:
+            print(f"⚠️ 인덱스를 쓰지 않는 조회: {', '.join(collscans)}")
+        else:
+            print("✅ 인덱스 점검 통과")
+
+    # 2. 캘린더 월별 조회용 파생 필드 보정 (기존 데이터)
+    await calendar.backfill_query_fields()
+
+    # 3. 캘린더 월별 표시 정보 사전 계산 + 주기적 윈도우 연장
+    occurrence_task = asyncio.create_task(calendar.occurrence_refresh_loop())
+
+    # 4. 통합 검색 색인 보정 (원본과 개수가 다른 종류만 재색인) + 이름/제목 메모리 색인
+    await search_service.sync_all()
+    await search_service.build_title_indexes()
+
+    # 5. 공유 AI 클라이언트 생성 + 분석 작업 큐 (중단된 작업 복구 + 워커 시작)
+    ai_client.init_client()
+    await ai_queue.start()
     yield
+    await ai_queue.stop()
+    occurrence_task.cancel()
 
 app = FastAPI(lifespan=lifespan)
 
+# 조건부 GET: 변경 없는 목록/상세 조회는 304 (CORS 보다 안쪽에 두어 304 에도 CORS 헤더가 붙도록 먼저 등록)
+app.add_middleware(etag.ConditionalGetMiddleware)
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -40,6 +76,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", "X-Code-Version"],  # 목록 API 다음 페이지 커서, 조건부 GET, 공통 코드 버전
 )
 
 # API 라우터 등록
@@ -57,6 +94,7 @@ app.include_router(culture.router)
 app.include_router(knitting.router)
 app.include_router(auth.router)
 app.include_router(user_router.router)
+app.include_router(search.router)
 
 # --- 프론트엔드 연결 ---
 # 정적 파일 경로 설정 (Render 빌드 시 backend/static 으로 복사됨)
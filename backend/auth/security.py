@@ -1,4 +1,8 @@
+import asyncio
 import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
@@ -22,6 +26,34 @@ def verify_password(plain_password, hashed_password):
 def get_password_hash(password):
     return pwd_context.hash(password)
 
+# bcrypt 전용 스레드 풀: 해시 한 번에 수십 ms 동안 이벤트 루프가 멈추지 않도록 async 핸들러는 아래 함수를 사용
+# (bcrypt 는 계산 중 GIL 을 놓으므로 스레드로 충분, 동시 계산 수는 PASSWORD_WORKERS 로 제한)
+PASSWORD_WORKERS = int(os.getenv("PASSWORD_WORKERS", "2"))
+PASSWORD_MAX_PENDING = int(os.getenv("PASSWORD_MAX_PENDING", "32"))  # 계산 중 + 대기 상한
+
+_password_executor = ThreadPoolExecutor(max_workers=PASSWORD_WORKERS, thread_name_prefix="bcrypt")
+_password_pending = 0
+
+async def _run_password_task(func, *args):
+    global _password_pending
+    if _password_pending >= PASSWORD_MAX_PENDING:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="요청이 많습니다. 잠시 후 다시 시도해 주세요.",
+            headers={"Retry-After": "1"},
+        )
+    _password_pending += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_password_executor, func, *args)
+    finally:
+        _password_pending -= 1
+
+async def verify_password_async(plain_password, hashed_password) -> bool:
+    return await _run_password_task(verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password) -> str:
+    return await _run_password_task(get_password_hash, password)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
@@ -32,6 +64,38 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+# 인증 사용자 캐시 (username → (User, 만료 시각)): 인증이 필요한 요청마다 users 를 조회하지 않도록
+# 권한/활성 상태 변경, 비밀번호 재설정, 삭제 시 invalidate_user 로 바로 비움 (TTL 은 그 밖의 변경 대비)
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", "60"))
+USER_CACHE_MAX = int(os.getenv("USER_CACHE_MAX", "256"))
+
+_user_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_user_cache_generation = 0  # invalidate 마다 증가 (조회 중에 무효화된 옛 값을 다시 넣지 않도록)
+
+def invalidate_user(username: str):
+    global _user_cache_generation
+    _user_cache_generation += 1
+    _user_cache.pop(username, None)
+
+async def get_cached_user(username: str) -> Optional[User]:
+    now = time.monotonic()
+    cached = _user_cache.get(username)
+    if cached and cached[1] > now:
+        _user_cache.move_to_end(username)
+        return cached[0].model_copy()  # 요청 안에서 바꿔도 캐시는 그대로
+
+    generation = _user_cache_generation
+    user = await User.find_one(User.username == username)
+    if user is None:
+        _user_cache.pop(username, None)
+        return None
+    if generation == _user_cache_generation:
+        _user_cache[username] = (user, now + USER_CACHE_TTL_SECONDS)
+        _user_cache.move_to_end(username)
+        while len(_user_cache) > USER_CACHE_MAX:
+            _user_cache.popitem(last=False)
+    return user.model_copy()
+
 # 현재 로그인한 사용자 가져오기 (라우터 보호용)
 async def get_current_user(token: str = Depends(oauth2_scheme)):
     credentials_exception = HTTPException(
@@ -47,7 +111,7 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
     except JWTError:
         raise credentials_exception
 
-    user = await User.find_one(User.username == username)
+    user = await get_cached_user(username)
     if user is None:
         raise credentials_exception
     return user
@@ -68,3 +132,45 @@ def assert_owner_or_admin(item, current_user: User):
     """Holango는 부부가 함께 쓰는 라이프로그라 작성자 본인이 아니어도 수정/삭제를 허용한다.
     (get_current_user 단계에서 로그인 여부는 이미 검증됨)"""
     return
+
+
+def _benchmark(logins: int = 10, interval_ms: float = 5):
+    """python -m auth.security : 로그인 폭주 중 다른 요청 지연 (루프에서 직접 bcrypt vs 전용 스레드 풀)
+
+    다른 요청이 interval_ms 마다 도착한다고 보고, 각 요청의 (처리 시각 - 도착 예정 시각) 을 지연으로 기록
+    """
+    hashed = get_password_hash("password")
+
+    async def inline_verify(plain, hashed_password):
+        return verify_password(plain, hashed_password)
+
+    async def storm(verify) -> tuple:
+        delays, stop = [], asyncio.Event()
+
+        async def other_requests():
+            started, i = time.perf_counter(), 0
+            while not stop.is_set():
+                await asyncio.sleep(max(0.0, started + i * interval_ms / 1000 - time.perf_counter()))
+                now = time.perf_counter()
+                # 루프가 막혀 있던 동안 도착한 요청은 모두 지금에서야 처리됨
+                while started + i * interval_ms / 1000 <= now:
+                    delays.append((now - (started + i * interval_ms / 1000)) * 1000)
+                    i += 1
+
+        probe = asyncio.create_task(other_requests())
+        await asyncio.sleep(0.05)
+        started = time.perf_counter()
+        await asyncio.gather(*(verify("password", hashed) for _ in range(logins)))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await probe
+        delays.sort()
+        return elapsed, delays[int(len(delays) * 0.99)], delays[-1]
+
+    for label, verify in (("이벤트 루프에서 직접", inline_verify), (f"스레드 풀 ({PASSWORD_WORKERS}개)", verify_password_async)):
+        elapsed, p99, worst = asyncio.run(storm(verify))
+        print(f"{label}: 로그인 {logins}건 {elapsed * 1000:.0f}ms, 다른 요청 지연 p99 {p99:.1f}ms / 최대 {worst:.1f}ms")
+
+
+if __name__ == "__main__":
+    _benchmark()
@@ -0,0 +1,74 @@
+"""
+로그인 시도 제한 (프로세스 메모리, 슬라이딩 윈도우).
+
+- username 별, 접속 IP 별로 최근 window 초 동안의 시도 수를 세고 한도를 넘으면 429
+- 비밀번호 검사(bcrypt) 전에 확인하므로, 한꺼번에 몰린 로그인 요청이 CPU 를 다 쓰지 못함
+- 로그인에 성공하면 그 username 의 기록은 지움 (오타 몇 번 뒤 성공한 사용자는 바로 정상)
+"""
+
+import os
+import time
+from collections import OrderedDict, deque
+from typing import Deque
+
+from fastapi import HTTPException, status
+
+LOGIN_WINDOW_SECONDS = float(os.getenv("LOGIN_WINDOW_SECONDS", "60"))
+LOGIN_MAX_PER_USERNAME = int(os.getenv("LOGIN_MAX_PER_USERNAME", "5"))
+LOGIN_MAX_PER_IP = int(os.getenv("LOGIN_MAX_PER_IP", "20"))
+MAX_TRACKED_KEYS = 10000  # 기록할 키 수 상한 (오래된 것부터 버림)
+
+
+class SlidingWindowLimiter:
+    def __init__(self, limit: int, window: float):
+        self.limit = limit
+        self.window = window
+        self.hits: "OrderedDict[str, Deque[float]]" = OrderedDict()
+
+    def _recent(self, key: str, now: float) -> Deque[float]:
+        hits = self.hits.get(key)
+        if hits is None:
+            hits = self.hits[key] = deque()
+            while len(self.hits) > MAX_TRACKED_KEYS:
+                self.hits.popitem(last=False)
+        self.hits.move_to_end(key)
+        while hits and hits[0] <= now - self.window:
+            hits.popleft()
+        return hits
+
+    def retry_after(self, key: str) -> float:
+        """한도 초과면 다시 시도할 수 있을 때까지 남은 초, 아니면 0"""
+        now = time.monotonic()
+        hits = self._recent(key, now)
+        if len(hits) < self.limit:
+            return 0
+        return hits[0] + self.window - now
+
+    def hit(self, key: str):
+        now = time.monotonic()
+        self._recent(key, now).append(now)
+
+    def reset(self, key: str):
+        self.hits.pop(key, None)
+
+
+username_limiter = SlidingWindowLimiter(LOGIN_MAX_PER_USERNAME, LOGIN_WINDOW_SECONDS)
+ip_limiter = SlidingWindowLimiter(LOGIN_MAX_PER_IP, LOGIN_WINDOW_SECONDS)
+
+
+def check_login_allowed(username: str, ip: str):
+    """한도를 넘었으면 429, 아니면 이번 시도를 기록"""
+    username = username.strip().lower()
+    wait = max(username_limiter.retry_after(username), ip_limiter.retry_after(ip))
+    if wait > 0:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="로그인 시도가 너무 많습니다. 잠시 후 다시 시도해 주세요.",
+            headers={"Retry-After": str(int(wait) + 1)},
+        )
+    username_limiter.hit(username)
+    ip_limiter.hit(ip)
+
+
+def login_succeeded(username: str):
+    username_limiter.reset(username.strip().lower())
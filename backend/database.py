@@ -20,5 +20,10 @@ async def init_db():
     # 2. 클라이언트 생성
     client = AsyncIOMotorClient(db_url)
     
-    # 3. Beanie 초기화
-    await init_beanie(database=client[db_name], document_models=__all_models__)
+    # 3. Beanie 초기화 (모델 Settings.indexes 에 선언된 인덱스가 없으면 생성)
+    #    DB_DROP_UNDECLARED_INDEXES=1 이면 선언에서 빠진 인덱스는 삭제해 선언과 똑같이 맞춤
+    await init_beanie(
+        database=client[db_name],
+        document_models=__all_models__,
+        allow_index_dropping=os.getenv("DB_DROP_UNDECLARED_INDEXES") == "1",
+    )
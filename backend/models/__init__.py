@@ -7,9 +7,12 @@ from .liquor import LiquorReview
 from .user import User
 from .bucket import BucketList
 from .diary import Diary
-from .calendar import CalendarEvent
+from .calendar import CalendarEvent, CalendarOccurrence
 from .family import FamilyMember
 from .culture import CultureReview
 from .knitting import KnittingRecord
+from .ai_job import AIJob
+from .ai_cache import AINoteCache
+from .search import SearchEntry
 
-__all_models__ = [Recipe, Review, CommonCode, Travel, Place, LiquorReview, User, BucketList, Diary, CalendarEvent, FamilyMember, CultureReview, KnittingRecord]
+__all_models__ = [Recipe, Review, CommonCode, Travel, Place, LiquorReview, User, BucketList, Diary, CalendarEvent, CalendarOccurrence, FamilyMember, CultureReview, KnittingRecord, AIJob, AINoteCache, SearchEntry]
@@ -0,0 +1,27 @@
+from beanie import Document
+from pydantic import Field
+from pymongo import IndexModel, ASCENDING
+from datetime import datetime
+import os
+
+from .liquor import AINote
+
+# 캐시 유효 기간 (일)
+AI_CACHE_TTL_DAYS = int(os.getenv("AI_CACHE_TTL_DAYS", "90"))
+
+
+class AINoteCache(Document):
+    """주류 AI 분석 결과 캐시 (정규화된 이름 + 프롬프트 버전의 해시가 키)"""
+    key: str                     # sha256(prompt_version|normalized_name)
+    name: str                    # 정규화된 이름 (확인용)
+    prompt_version: str
+    note: AINote
+    hits: int = 0                # 캐시 적중 횟수
+    created_at: datetime = Field(default_factory=datetime.now)
+
+    class Settings:
+        name = "ai_note_cache"
+        indexes = [
+            IndexModel([("key", ASCENDING)], unique=True),
+            IndexModel([("created_at", ASCENDING)], expireAfterSeconds=AI_CACHE_TTL_DAYS * 24 * 60 * 60),
+        ]
@@ -0,0 +1,24 @@
+from beanie import Document, PydanticObjectId
+from pydantic import Field
+from pymongo import IndexModel, ASCENDING
+from typing import Optional
+from datetime import datetime
+
+
+class AIJob(Document):
+    """주류 AI 분석 작업 (서버가 재시작되어도 남아 있는 작업 큐)"""
+    liquor_id: PydanticObjectId
+    liquor_name: str
+    status: str = "PENDING"           # PENDING / RUNNING / FAILED (완료된 작업은 삭제)
+    attempts: int = 0                 # 실패 횟수
+    next_run_at: datetime = Field(default_factory=datetime.now)  # 재시도 대기 (지수 백오프)
+    last_error: Optional[str] = None
+    created_at: datetime = Field(default_factory=datetime.now)
+    updated_at: datetime = Field(default_factory=datetime.now)
+
+    class Settings:
+        name = "ai_jobs"
+        indexes = [
+            IndexModel([("status", ASCENDING), ("next_run_at", ASCENDING)]),
+            IndexModel([("liquor_id", ASCENDING)]),
+        ]
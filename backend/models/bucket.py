@@ -1,4 +1,5 @@
 from beanie import Document, PydanticObjectId
+from pymongo import IndexModel, ASCENDING, DESCENDING
 from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import datetime
@@ -21,6 +22,7 @@ class BucketList(Document):
     completed_at: Optional[datetime] = None
     image_url: Optional[str] = None  # 이미지 URL
     comments: List[Comment] = []
+    comment_count: Optional[int] = None  # 목록 조회 시 프로젝션으로 계산 (comments 개수)
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
 
@@ -28,6 +30,12 @@ class BucketList(Document):
 
     class Settings:
         name = "bucketlist"
+        indexes = [
+            IndexModel([("created_at", DESCENDING), ("_id", DESCENDING)]),
+            # 상태 필터 목록 + 상태별 개수 (/stats)
+            IndexModel([("status", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+            IndexModel([("category", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+        ]
 
     class Config:
         json_encoders = {PydanticObjectId: str}
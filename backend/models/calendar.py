@@ -1,6 +1,7 @@
 from beanie import Document, PydanticObjectId
 from pydantic import Field
-from typing import Optional
+from pymongo import IndexModel, ASCENDING, DESCENDING
+from typing import Optional, Dict, Any
 from datetime import datetime
 
 class CalendarEvent(Document):
@@ -18,8 +19,34 @@ class CalendarEvent(Document):
 
     created_by: Optional[PydanticObjectId] = None  # 작성자 user_id
 
+    # 월별 조회용 파생 필드 (저장 시 서버에서 계산)
+    month_day: Optional[str] = None    # MM-DD (매년 반복 이벤트, 음력이면 음력 월/일)
+    solar_start: Optional[str] = None  # YYYY-MM-DD (반복 아님, 양력 기준 시작일)
+    solar_end: Optional[str] = None    # YYYY-MM-DD (반복 아님, 양력 기준 종료일)
+
     class Settings:
         name = "calendar_events"
+        indexes = [
+            IndexModel([("is_yearly", ASCENDING), ("is_lunar", ASCENDING), ("month_day", ASCENDING)]),
+            IndexModel([("is_yearly", ASCENDING), ("solar_start", ASCENDING), ("solar_end", ASCENDING)]),
+            IndexModel([("updated_at", DESCENDING)]),
+        ]
 
     class Config:
         json_encoders = {PydanticObjectId: str}
+
+
+class CalendarOccurrence(Document):
+    """이벤트가 특정 월에 표시되는 정보 (음력/반복 변환 결과를 미리 계산해 둔 조회용 문서)"""
+    event_id: PydanticObjectId
+    month: str                 # YYYY-MM (표시되는 달)
+    year: int                  # 표시 연도 (롤링 윈도우 관리용)
+    response: Dict[str, Any]   # 해당 월 기준 응답 데이터 (CalendarEventResponse)
+
+    class Settings:
+        name = "calendar_occurrences"
+        indexes = [
+            IndexModel([("month", ASCENDING), ("event_id", ASCENDING)], unique=True),
+            IndexModel([("event_id", ASCENDING)]),
+            IndexModel([("year", ASCENDING)]),
+        ]
@@ -1,4 +1,5 @@
 from beanie import Document, PydanticObjectId
+from pymongo import IndexModel, ASCENDING
 from typing import Optional
 from pydantic import Field
 
@@ -19,6 +20,11 @@ class Recipe(Document):
 
     class Settings:
         name = "recipes"
+        indexes = [
+            # 목록은 등록순(_id) 이므로 필터 + _id
+            IndexModel([("cooking_type", ASCENDING), ("_id", ASCENDING)]),
+            IndexModel([("created_by", ASCENDING), ("_id", ASCENDING)]),
+        ]
         
     class Config:
         populate_by_name = True
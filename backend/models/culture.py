@@ -1,4 +1,5 @@
 from beanie import Document, PydanticObjectId
+from pymongo import IndexModel, ASCENDING, DESCENDING
 from typing import Optional, List
 from datetime import datetime
 
@@ -26,3 +27,7 @@ class CultureReview(Document):
 
     class Settings:
         name = "culture_reviews"
+        indexes = [
+            IndexModel([("visit_date", DESCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+            IndexModel([("category", ASCENDING), ("visit_date", DESCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+        ]
@@ -1,4 +1,5 @@
 from beanie import Document, PydanticObjectId
+from pymongo import IndexModel, ASCENDING, DESCENDING
 from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import datetime
@@ -19,6 +20,7 @@ class Diary(Document):
     weather: Optional[str] = None  # sunny, cloudy, rainy, snowy
     image_url: Optional[str] = None
     comments: List[DiaryComment] = []
+    comment_count: Optional[int] = None  # 목록 조회 시 프로젝션으로 계산 (comments 개수)
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
 
@@ -26,6 +28,10 @@ class Diary(Document):
 
     class Settings:
         name = "diaries"
+        indexes = [
+            IndexModel([("date", DESCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+            IndexModel([("created_by", ASCENDING), ("date", DESCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+        ]
 
     class Config:
         json_encoders = {PydanticObjectId: str}
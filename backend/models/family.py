@@ -1,4 +1,5 @@
 from beanie import Document, PydanticObjectId
+from pymongo import IndexModel, ASCENDING, DESCENDING
 from pydantic import Field
 from typing import Optional
 
@@ -19,6 +20,13 @@ class FamilyMember(Document):
 
     class Settings:
         name = "family_members"
+        indexes = [
+            # side 별 조회, 부모/배우자/형제 연결 조회 (트리, 연쇄 삭제)
+            IndexModel([("side", ASCENDING), ("generation", DESCENDING)]),
+            IndexModel([("parent_id", ASCENDING)]),
+            IndexModel([("spouse_id", ASCENDING)]),
+            IndexModel([("sibling_of", ASCENDING)]),
+        ]
 
     class Config:
         populate_by_name = True
@@ -1,4 +1,5 @@
 from beanie import Document, PydanticObjectId
+from pymongo import IndexModel, ASCENDING, DESCENDING
 from typing import Optional, List
 from datetime import datetime
 from pydantic import BaseModel
@@ -96,3 +97,11 @@ class KnittingRecord(Document):
 
     class Settings:
         name = "knitting_records"
+        indexes = [
+            # 정렬 옵션별 (최근 등록순 / 시작일순 / 이름순)
+            IndexModel([("created_at", DESCENDING), ("_id", DESCENDING)]),
+            IndexModel([("start_date", ASCENDING), ("_id", ASCENDING)]),
+            IndexModel([("name", ASCENDING), ("_id", ASCENDING)]),
+            IndexModel([("status", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+            IndexModel([("category", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+        ]
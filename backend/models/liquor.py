@@ -1,4 +1,5 @@
 from beanie import Document, PydanticObjectId
+from pymongo import IndexModel, ASCENDING, DESCENDING
 from typing import Optional, List
 from datetime import datetime
 from pydantic import BaseModel
@@ -48,3 +49,10 @@ class LiquorReview(Document):
 
     class Settings:
         name = "liquor_reviews"
+        indexes = [
+            # 목록: 최근 방문순 (커서 페이지네이션은 _id 까지 정렬), 종류 필터 + 같은 정렬
+            IndexModel([("visit_date", DESCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+            IndexModel([("category", ASCENDING), ("visit_date", DESCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+            # AI 분석 대기/실패 복구
+            IndexModel([("ai_note.status", ASCENDING)]),
+        ]
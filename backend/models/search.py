@@ -0,0 +1,22 @@
+from beanie import Document, PydanticObjectId
+from pydantic import Field
+from pymongo import IndexModel, ASCENDING, TEXT
+from datetime import datetime
+
+
+class SearchEntry(Document):
+    """통합 검색용 문서 (각 컬렉션의 검색 대상 텍스트를 모아 text 인덱스 하나로 검색)"""
+    kind: str                    # liquor / diary / bucket / knitting / culture / recipe / review / travel
+    ref_id: PydanticObjectId     # 원본 문서 id
+    title: str = ""              # 이름/제목 (가중치 높음)
+    body: str = ""               # 내용/코멘트 등 나머지 검색 대상
+    updated_at: datetime = Field(default_factory=datetime.now)
+
+    class Settings:
+        name = "search_entries"
+        indexes = [
+            IndexModel([("kind", ASCENDING), ("ref_id", ASCENDING)], unique=True),
+            # 한국어 형태소 분석은 지원되지 않으므로 언어 처리 없이 공백 단위 토큰으로 색인
+            IndexModel([("title", TEXT), ("body", TEXT)], weights={"title": 10, "body": 1},
+                       default_language="none", name="search_text"),
+        ]
@@ -1,4 +1,5 @@
 from beanie import Document, PydanticObjectId
+from pymongo import IndexModel, ASCENDING
 from typing import Optional
 from pydantic import Field
 
@@ -14,6 +15,11 @@ class CommonCode(Document):
 
     class Settings:
         name = "common_codes"  # MongoDB 컬렉션명
+        indexes = [
+            # 그룹별 사용 코드 (드롭다운), 전체 목록 (관리자)
+            IndexModel([("group_code", ASCENDING), ("use_yn", ASCENDING), ("sort_order", ASCENDING)]),
+            IndexModel([("group_code", ASCENDING), ("sort_order", ASCENDING)]),
+        ]
         
     class Config:
         populate_by_name = True
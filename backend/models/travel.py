@@ -1,4 +1,5 @@
 from beanie import Document, PydanticObjectId
+from pymongo import IndexModel, DESCENDING
 from typing import Optional, List
 from pydantic import Field, BaseModel
 from datetime import datetime
@@ -55,6 +56,10 @@ class Travel(Document):
 
     class Settings:
         name = "travels"
+        indexes = [
+            IndexModel([("created_at", DESCENDING), ("_id", DESCENDING)]),
+            IndexModel([("start_date", DESCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+        ]
     
     class Config:
         populate_by_name = True
@@ -1,4 +1,5 @@
 from beanie import Document
+from pymongo import IndexModel, ASCENDING
 from pydantic import BaseModel
 from typing import Optional
 from datetime import datetime
@@ -14,6 +15,9 @@ class User(Document):
 
     class Settings:
         name = "users"
+        indexes = [
+            IndexModel([("username", ASCENDING)], unique=True),
+        ]
 
 
 class UserLogin(BaseModel):
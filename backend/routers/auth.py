@@ -1,22 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from models.user import User, UserLogin, Token
 from auth.security import (
-    verify_password,
-    get_password_hash,
+    verify_password_async,
     create_access_token,
     get_current_user,
     ACCESS_TOKEN_EXPIRE_MINUTES,
     REMEMBER_TOKEN_EXPIRE_MINUTES,
 )
+from auth.throttle import check_login_allowed, login_succeeded
 from datetime import timedelta
 
 router = APIRouter(prefix="/api/auth", tags=["Auth"])
 
 
 @router.post("/login", response_model=Token)
-async def login(user_data: UserLogin):
+async def login(user_data: UserLogin, request: Request):
+    # username/IP 별 시도 제한 (bcrypt 계산 전에 거름)
+    check_login_allowed(user_data.username, request.client.host if request.client else "unknown")
+
     user = await User.find_one(User.username == user_data.username)
-    if not user or not verify_password(user_data.password, user.password_hash):
+    if not user or not await verify_password_async(user_data.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -24,6 +27,7 @@ async def login(user_data: UserLogin):
         )
     if not getattr(user, "is_active", True):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="비활성화된 계정입니다.")
+    login_succeeded(user_data.username)
 
     expire_minutes = REMEMBER_TOKEN_EXPIRE_MINUTES if user_data.remember else ACCESS_TOKEN_EXPIRE_MINUTES
     access_token_expires = timedelta(minutes=expire_minutes)
@@ -1,19 +1,36 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from beanie import PydanticObjectId
 from typing import List, Optional
 from datetime import datetime
 from models.bucket import BucketList, Comment
 from models.user import User
 from auth.security import get_current_user, assert_owner_or_admin
+from services import search
+from services.pagination import paginate, LimitQuery, CursorQuery
+from services.projection import build_projection, FieldsQuery, COMMENT_COUNT
+from services.serialization import fast_response
+from services.resolve import ResolveQuery, parse_resolve, resolve_names
 
 router = APIRouter(prefix="/api/bucket", tags=["BucketList"])
 
+# 목록 요약 프로젝션 (설명 제외, 코멘트는 개수만)
+LIST_SUMMARY = {
+    "title": 1, "category": 1, "target_date": 1, "progress": 1, "status": 1, "completed_at": 1,
+    "image_url": 1, "created_at": 1, "created_by": 1, "comment_count": COMMENT_COUNT,
+}
+LIST_COMPUTED = {"comment_count": COMMENT_COUNT}
+
 # 1. 목록 조회 (검색/필터 지원)
-@router.get("", response_model=List[BucketList])
+@router.get("", response_model=List[BucketList], response_model_exclude_unset=True)
 async def get_buckets(
+    response: Response,
     keyword: Optional[str] = None,
     category: Optional[str] = None,
     status: Optional[str] = None,  # all, not_started, active, completed
+    limit: Optional[int] = LimitQuery,
+    cursor: Optional[str] = CursorQuery,
+    fields: Optional[str] = FieldsQuery,
+    resolve: Optional[str] = ResolveQuery,
 ):
     query = {}
 
@@ -29,7 +46,10 @@ async def get_buckets(
     if status and status != "all":
         query["status"] = status
 
-    return await BucketList.find(query).sort("-created_at").to_list()
+    projection = build_projection(BucketList, fields, LIST_SUMMARY, LIST_COMPUTED)
+    items = await paginate(BucketList, query, ["-created_at"], limit, cursor, response, projection)
+    items = await resolve_names(items, BucketList, parse_resolve(resolve))
+    return fast_response(items, BucketList, response)
 
 # 2. 통계 조회
 @router.get("/stats")
@@ -43,11 +63,12 @@ async def get_stats():
 
 # 3. 상세 조회
 @router.get("/{id}", response_model=BucketList)
-async def get_bucket(id: PydanticObjectId):
+async def get_bucket(id: PydanticObjectId, resolve: Optional[str] = ResolveQuery):
+    options = parse_resolve(resolve)
     bucket = await BucketList.get(id)
     if not bucket:
         raise HTTPException(status_code=404, detail="Not found")
-    return bucket
+    return fast_response(await resolve_names(bucket, BucketList, options), BucketList)
 
 # 4. 등록
 @router.post("", response_model=BucketList)
@@ -56,6 +77,7 @@ async def create_bucket(bucket: BucketList, current_user: User = Depends(get_cur
     bucket.created_at = datetime.now()
     bucket.updated_at = datetime.now()
     await bucket.insert()
+    await search.index_document("bucket", bucket)
     return bucket
 
 # 5. 수정
@@ -80,6 +102,7 @@ async def update_bucket(
     update_data = data.model_dump(exclude_unset=True)
     update_data.pop("created_by", None)
     await bucket.update({"$set": update_data})
+    await search.index_document("bucket", bucket)
     return await BucketList.get(id)
 
 # 6. 삭제
@@ -93,6 +116,7 @@ async def delete_bucket(
         raise HTTPException(status_code=404, detail="Not found")
     assert_owner_or_admin(bucket, current_user)
     await bucket.delete()
+    await search.remove_document("bucket", bucket.id)
     return {"message": "Deleted"}
 
 # 7. 코멘트 추가
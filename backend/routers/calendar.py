@@ -1,35 +1,32 @@
-from fastapi import APIRouter, Depends, HTTPException
+import asyncio
+import hashlib
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from beanie import PydanticObjectId
-from typing import List, Optional
-from datetime import datetime, date
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime, date, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from calendar import monthrange
 from pydantic import BaseModel
-from models.calendar import CalendarEvent
+from pymongo.errors import BulkWriteError
+from models.calendar import CalendarEvent, CalendarOccurrence
 from models.user import User
 from auth.security import get_current_user, assert_owner_or_admin
+from services import etag, lunar
+from services.holidays import Holiday, get_year_holidays, get_range_holidays
 
 router = APIRouter(prefix="/api/calendar", tags=["Calendar"])
 
 # 음력→양력 변환 함수
 def lunar_to_solar(year: int, month: int, day: int) -> Optional[date]:
-    """음력 날짜를 양력으로 변환"""
-    try:
-        from korean_lunar_calendar import KoreanLunarCalendar
-        calendar = KoreanLunarCalendar()
-        calendar.setLunarDate(year, month, day, False)
-        return date(calendar.solarYear, calendar.solarMonth, calendar.solarDay)
-    except Exception:
-        return None
+    """음력 날짜를 양력으로 변환 (변환 테이블 조회)"""
+    return lunar.lunar_to_solar(year, month, day)
 
 # 양력→음력 변환 함수
 def solar_to_lunar(year: int, month: int, day: int) -> Optional[tuple]:
     """양력 날짜를 음력으로 변환. (year, month, day) 튜플 반환"""
-    try:
-        from korean_lunar_calendar import KoreanLunarCalendar
-        calendar = KoreanLunarCalendar()
-        calendar.setSolarDate(year, month, day)
-        return (calendar.lunarYear, calendar.lunarMonth, calendar.lunarDay)
-    except Exception:
-        return None
+    result = lunar.solar_to_lunar(year, month, day)
+    return result[:3] if result else None
 
 # 응답용 모델 (양력 변환 날짜 포함)
 class CalendarEventResponse(BaseModel):
@@ -93,157 +90,523 @@ def event_to_response(event: CalendarEvent, target_year: int) -> CalendarEventRe
 
     return response
 
+# 양력 기간에 걸치는 음력 월/일 구간 (음력 반복 이벤트 후보 검색용)
+def lunar_window(start_year: int, start_month: int, end_year: int, end_month: int) -> Optional[tuple]:
+    """양력 start월 1일~end월 말일에 해당하는 음력 (MM-DD, MM-DD) 구간 반환"""
+    first = lunar.solar_to_lunar(start_year, start_month, 1)
+    last = lunar.solar_to_lunar(end_year, end_month, monthrange(end_year, end_month)[1])
+    if not first or not last:
+        return None
+    _, first_month, first_day, _ = first
+    _, last_month, last_day, last_is_leap = last
+    # 윤달에서 끝나면 같은 번호의 평달은 통째로 지나간 것이므로 그 달 끝까지 포함
+    end_day = 30 if last_is_leap else last_day
+    return (f"{first_month:02d}-{first_day:02d}", f"{last_month:02d}-{end_day:02d}")
+
+def month_day_condition(start: str, end: str) -> List[dict]:
+    """MM-DD 구간 조건 (12월→1월처럼 해를 넘기면 둘로 나눔)"""
+    if start <= end:
+        return [{"month_day": {"$gte": start, "$lte": end}}]
+    return [{"month_day": {"$gte": start}}, {"month_day": {"$lte": end}}]
+
+def derive_query_fields(event: CalendarEvent) -> dict:
+    """월별 조회 쿼리가 사용하는 파생 필드(month_day, solar_start, solar_end) 계산"""
+    fields = {"month_day": None, "solar_start": None, "solar_end": None}
+    try:
+        parts = event.date.split('-')
+        if event.is_yearly:
+            # 반복 이벤트: 연도와 무관하게 월/일만 비교 (음력이면 음력 월/일)
+            fields["month_day"] = f"{int(parts[1]):02d}-{int(parts[2]):02d}"
+        elif event.is_lunar:
+            # 음력 일반 이벤트: 시작일의 양력 변환값 기준
+            solar = lunar_to_solar(int(parts[0]), int(parts[1]), int(parts[2]))
+            if solar:
+                fields["solar_start"] = fields["solar_end"] = solar.strftime('%Y-%m-%d')
+        elif event.is_range:
+            fields["solar_start"] = event.date
+            fields["solar_end"] = event.end_date or "9999-12-31"  # 미정이면 무한대로 처리
+        else:
+            fields["solar_start"] = fields["solar_end"] = event.date
+    except Exception:
+        pass
+    return fields
+
+def build_range_query(start_year: int, start_month: int, end_year: int, end_month: int) -> dict:
+    """해당 기간(월 단위)에 표시될 수 있는 이벤트 후보만 고르는 MongoDB 쿼리"""
+    range_start = f"{start_year}-{start_month:02d}-01"
+    range_end = f"{end_year}-{end_month:02d}-31"
+    month_count = (end_year - start_year) * 12 + end_month - start_month + 1
+
+    conditions = [
+        # 반복 아님 (일반/기간/음력): 양력 범위가 기간과 겹치는 것
+        {"is_yearly": False, "solar_start": {"$lte": range_end}, "solar_end": {"$gte": range_start}},
+    ]
+
+    # 1년 이상이면 반복 이벤트는 전부 후보
+    if month_count >= 12:
+        conditions.append({"is_yearly": True})
+        return {"$or": conditions}
+
+    # 양력 반복: 월/일만 비교
+    for cond in month_day_condition(f"{start_month:02d}-01", f"{end_month:02d}-31"):
+        conditions.append({"is_yearly": True, "is_lunar": False, **cond})
+
+    # 음력 반복: 기간에 걸치는 음력 월/일 구간
+    window = lunar_window(start_year, start_month, end_year, end_month)
+    if window:
+        for cond in month_day_condition(*window):
+            conditions.append({"is_yearly": True, "is_lunar": True, **cond})
+    else:
+        conditions.append({"is_yearly": True, "is_lunar": True})
+
+    return {"$or": conditions}
+
+def match_event(event: CalendarEvent, year: int, month: int) -> Optional[CalendarEventResponse]:
+    """이벤트가 해당 월에 표시되면 응답 모델을, 아니면 None 반환"""
+    month_start = f"{year}-{month:02d}-01"
+    month_end = f"{year}-{month:02d}-31"
+
+    # 매년 반복 이벤트
+    if event.is_yearly:
+        if event.is_lunar:
+            # 음력 반복: 해당 연도와 전년도 모두 확인
+            # (음력 12월은 양력으로 다음 해 1~2월이 되므로)
+            try:
+                parts = event.date.split('-')
+                lunar_month = int(parts[1])
+                lunar_day = int(parts[2])
+
+                # 현재 연도와 전년도 모두 확인
+                for check_year in [year, year - 1]:
+                    solar = lunar_to_solar(check_year, lunar_month, lunar_day)
+                    if solar and solar.year == year and solar.month == month:
+                        resp = event_to_response(event, check_year)
+                        resp.solar_date = solar.strftime('%Y-%m-%d')
+                        return resp
+            except Exception:
+                pass
+        else:
+            # 양력 반복: 월만 비교
+            try:
+                parts = event.date.split('-')
+                event_month = int(parts[1])
+                if event_month == month:
+                    resp = event_to_response(event, year)
+                    # 연도를 현재로 변경
+                    resp.date = f"{year}{event.date[4:]}"
+                    if event.end_date:
+                        resp.end_date = f"{year}{event.end_date[4:]}"
+                    return resp
+            except Exception:
+                pass
+    else:
+        # 일반 이벤트 (반복 아님)
+        if event.is_lunar:
+            # 음력 일반 이벤트
+            try:
+                parts = event.date.split('-')
+                event_year = int(parts[0])
+                lunar_month = int(parts[1])
+                lunar_day = int(parts[2])
+                solar = lunar_to_solar(event_year, lunar_month, lunar_day)
+                if solar and solar.year == year and solar.month == month:
+                    return event_to_response(event, event_year)
+            except Exception:
+                pass
+        elif event.is_range:
+            # 기간 이벤트: 범위가 해당 월과 겹치는지 확인
+            event_start = event.date
+            event_end = event.end_date or "9999-12-31"  # 미정이면 무한대로 처리
+
+            # 범위가 겹치는지 확인
+            if event_start <= month_end and event_end >= month_start:
+                return event_to_response(event, year)
+        else:
+            # 일반 단일 이벤트
+            if month_start <= event.date <= month_end:
+                return event_to_response(event, year)
+
+    return None
+
+async def backfill_query_fields():
+    """파생 필드가 없는 기존 이벤트를 채움 (서버 시작 시 1회)"""
+    events = await CalendarEvent.find({"month_day": None, "solar_start": None}).to_list()
+    filled = 0
+    for event in events:
+        fields = derive_query_fields(event)
+        if fields["month_day"] or fields["solar_start"]:
+            await event.set(fields)
+            filled += 1
+    if filled:
+        print(f"✅ 캘린더 파생 필드 {filled}건 갱신")
+
+# 월별 표시 정보 사전 계산 (calendar_occurrences)
+# - 롤링 윈도우(올해 기준 앞뒤 몇 년) 안의 월은 미리 계산된 결과를 인덱스 조회만으로 반환
+# - 윈도우 밖의 월은 파생 필드 쿼리 + match_event 로 즉석 계산
+OCCURRENCE_YEARS_BACK = 2
+OCCURRENCE_YEARS_AHEAD = 3
+OCCURRENCE_REFRESH_SECONDS = 60 * 60 * 6
+
+_occurrence_window: Optional[tuple] = None  # 현재 계산되어 있는 (시작 연도, 종료 연도)
+
+def desired_occurrence_window() -> tuple:
+    this_year = date.today().year
+    return (this_year - OCCURRENCE_YEARS_BACK, this_year + OCCURRENCE_YEARS_AHEAD)
+
+def month_keys(start_year: int, start_month: int, end_year: int, end_month: int) -> List[tuple]:
+    """시작 월~종료 월의 (year, month) 목록"""
+    months = []
+    year, month = start_year, start_month
+    while (year, month) <= (end_year, end_month):
+        months.append((year, month))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+def build_occurrences(event: CalendarEvent, start_year: int, end_year: int) -> List[CalendarOccurrence]:
+    """이벤트의 연도 구간 내 월별 표시 정보 계산"""
+    first, last = (start_year, 1), (end_year, 12)
+    # 반복 아닌 이벤트는 양력 범위가 겹치는 달만 확인
+    if not event.is_yearly:
+        if not event.solar_start or not event.solar_end:
+            return []
+        try:
+            first = max(first, (int(event.solar_start[:4]), int(event.solar_start[5:7])))
+            last = min(last, (int(event.solar_end[:4]), int(event.solar_end[5:7])))
+        except ValueError:
+            return []
+
+    occurrences = []
+    for year, month in month_keys(*first, *last):
+        resp = match_event(event, year, month)
+        if resp:
+            occurrences.append(CalendarOccurrence(
+                event_id=event.id,
+                month=f"{year}-{month:02d}",
+                year=year,
+                response=resp.model_dump(),
+            ))
+    return occurrences
+
+async def insert_occurrences(occurrences: List[CalendarOccurrence]):
+    """월별 표시 정보 저장 (동시에 재생성되어 이미 있는 (month, event_id)는 무시)"""
+    if not occurrences:
+        return
+    try:
+        await CalendarOccurrence.insert_many(occurrences, ordered=False)
+    except BulkWriteError as e:
+        if any(err.get("code") != 11000 for err in e.details.get("writeErrors", [])):
+            raise
+
+async def refresh_event_occurrences(event: CalendarEvent):
+    """이벤트 등록/수정 시 해당 이벤트의 월별 표시 정보만 재생성"""
+    await CalendarOccurrence.find(CalendarOccurrence.event_id == event.id).delete()
+    window = _occurrence_window or desired_occurrence_window()
+    await insert_occurrences(build_occurrences(event, *window))
+    etag.bump(CalendarOccurrence)  # 쿼리 단위 쓰기는 문서 이벤트가 없으므로 직접 갱신
+
+async def sync_occurrence_window():
+    """윈도우를 올해 기준으로 맞춤 (서버 시작 시 전체 생성, 이후 연도가 바뀐 만큼만 추가/삭제)"""
+    global _occurrence_window
+    start_year, end_year = desired_occurrence_window()
+    if _occurrence_window == (start_year, end_year):
+        return
+
+    if _occurrence_window is None:
+        # 서버 시작: 전체 재생성
+        await CalendarOccurrence.find_all().delete()
+        new_years = [(start_year, end_year)]
+    else:
+        old_start, old_end = _occurrence_window
+        await CalendarOccurrence.find({"$or": [{"year": {"$lt": start_year}}, {"year": {"$gt": end_year}}]}).delete()
+        new_years = []
+        if start_year < old_start:
+            new_years.append((start_year, min(old_start - 1, end_year)))
+        if end_year > old_end:
+            new_years.append((max(old_end + 1, start_year), end_year))
+
+    total = 0
+    async for event in CalendarEvent.find_all():
+        occurrences = []
+        for years in new_years:
+            occurrences.extend(build_occurrences(event, *years))
+        await insert_occurrences(occurrences)
+        total += len(occurrences)
+
+    _occurrence_window = (start_year, end_year)
+    etag.bump(CalendarOccurrence)
+    print(f"✅ 캘린더 월별 표시 정보 {start_year}~{end_year}년 준비 완료 ({total}건 생성)")
+
+async def occurrence_refresh_loop():
+    """주기적으로 윈도우를 연장하는 백그라운드 작업 (app lifespan 에서 시작)"""
+    while True:
+        try:
+            await sync_occurrence_window()
+        except Exception as e:
+            print(f"❌ 캘린더 월별 표시 정보 갱신 실패: {e}")
+        await asyncio.sleep(OCCURRENCE_REFRESH_SECONDS)
+
+async def load_month_events(months: List[tuple]) -> Dict[str, List[CalendarEventResponse]]:
+    """여러 달의 표시 이벤트를 "YYYY-MM" 별로 반환"""
+    grouped: Dict[str, List[CalendarEventResponse]] = {f"{y}-{m:02d}": [] for y, m in months}
+
+    window = _occurrence_window
+    if window and all(window[0] <= y <= window[1] for y, _ in months):
+        # 미리 계산된 결과 (변환 없이 인덱스 조회만)
+        occurrences = await CalendarOccurrence.find(
+            {"month": {"$in": list(grouped)}}
+        ).sort("+month", "+event_id").to_list()
+        for occ in occurrences:
+            grouped[occ.month].append(CalendarEventResponse(**occ.response))
+        return grouped
+
+    # 윈도우 밖: 후보만 조회한 뒤 즉석 계산
+    (start_year, start_month), (end_year, end_month) = months[0], months[-1]
+    candidates = await CalendarEvent.find(build_range_query(start_year, start_month, end_year, end_month)).to_list()
+    for event in candidates:
+        for y, m in months:
+            resp = match_event(event, y, m)
+            if resp:
+                grouped[f"{y}-{m:02d}"].append(resp)
+    return grouped
+
+# 조회 가능한 연도 (datetime.date 가 표현하는 범위, 밖이면 날짜 계산에서 500 대신 422)
+MIN_YEAR, MAX_YEAR = 1, 9999
+
 # 1. 월별 이벤트 조회 (반복 이벤트, 음력, 기간 이벤트 포함)
 @router.get("", response_model=List[CalendarEventResponse])
-async def get_events(year: int, month: int):
+async def get_events(
+    year: int = Query(..., ge=MIN_YEAR, le=MAX_YEAR),
+    month: int = Query(..., ge=1, le=12),
+):
     """
     해당 월의 이벤트 조회
     - 일반 이벤트: date가 해당 월에 속하는 것
     - 반복 이벤트: is_yearly=True이고 월/일이 일치하는 것
     - 음력 이벤트: 양력으로 변환하여 표시
     - 기간 이벤트: 시작일~종료일 범위가 해당 월과 겹치는 것
+
+    롤링 윈도우 안이면 calendar_occurrences 조회, 밖이면 후보 조회 후 즉석 계산
     """
-    month_start = f"{year}-{month:02d}-01"
-    month_end = f"{year}-{month:02d}-31"
+    grouped = await load_month_events([(year, month)])
+    return grouped[f"{year}-{month:02d}"]
 
-    result = []
+# 1-1. 기간(여러 달) 이벤트 조회 - 연간/일정 목록 화면용
+MAX_RANGE_MONTHS = 24
 
-    # 모든 이벤트 조회
-    all_events = await CalendarEvent.find_all().to_list()
+class CalendarRangeResponse(BaseModel):
+    months: Dict[str, List[CalendarEventResponse]]  # "YYYY-MM" → 이벤트 목록
+    holidays: List[Holiday]
 
-    for event in all_events:
-        # 매년 반복 이벤트
-        if event.is_yearly:
-            if event.is_lunar:
-                # 음력 반복: 해당 연도와 전년도 모두 확인
-                # (음력 12월은 양력으로 다음 해 1~2월이 되므로)
-                try:
-                    parts = event.date.split('-')
-                    lunar_month = int(parts[1])
-                    lunar_day = int(parts[2])
-
-                    # 현재 연도와 전년도 모두 확인
-                    for check_year in [year, year - 1]:
-                        solar = lunar_to_solar(check_year, lunar_month, lunar_day)
-                        if solar and solar.year == year and solar.month == month:
-                            resp = event_to_response(event, check_year)
-                            resp.solar_date = solar.strftime('%Y-%m-%d')
-                            result.append(resp)
-                            break
-                except Exception:
-                    pass
-            else:
-                # 양력 반복: 월만 비교
-                try:
-                    parts = event.date.split('-')
-                    event_month = int(parts[1])
-                    if event_month == month:
-                        resp = event_to_response(event, year)
-                        # 연도를 현재로 변경
-                        resp.date = f"{year}{event.date[4:]}"
-                        if event.end_date:
-                            resp.end_date = f"{year}{event.end_date[4:]}"
-                        result.append(resp)
-                except Exception:
-                    pass
-        else:
-            # 일반 이벤트 (반복 아님)
-            if event.is_lunar:
-                # 음력 일반 이벤트
-                try:
-                    parts = event.date.split('-')
-                    event_year = int(parts[0])
-                    lunar_month = int(parts[1])
-                    lunar_day = int(parts[2])
-                    solar = lunar_to_solar(event_year, lunar_month, lunar_day)
-                    if solar and solar.year == year and solar.month == month:
-                        resp = event_to_response(event, event_year)
-                        result.append(resp)
-                except Exception:
-                    pass
-            elif event.is_range:
-                # 기간 이벤트: 범위가 해당 월과 겹치는지 확인
-                event_start = event.date
-                event_end = event.end_date or "9999-12-31"  # 미정이면 무한대로 처리
-
-                # 범위가 겹치는지 확인
-                if event_start <= month_end and event_end >= month_start:
-                    result.append(event_to_response(event, year))
-            else:
-                # 일반 단일 이벤트
-                if month_start <= event.date <= month_end:
-                    result.append(event_to_response(event, year))
-
-    return result
-
-# 2. 한국 공휴일 조회 (/{id} 보다 먼저 정의해야 함)
-class Holiday(BaseModel):
-    date: str
-    name: str
-    is_lunar: bool = False
+def parse_year_month(value: str) -> tuple:
+    """'YYYY-MM' 문자열을 (year, month)로 변환"""
+    try:
+        year, month = (int(part) for part in value.split('-'))
+        if MIN_YEAR <= year <= MAX_YEAR and 1 <= month <= 12:
+            return (year, month)
+    except Exception:
+        pass
+    raise HTTPException(status_code=400, detail=f"잘못된 월 형식입니다: {value} (YYYY-MM)")
+
+@router.get("/range", response_model=CalendarRangeResponse)
+async def get_events_range(
+    range_from: str = Query(..., alias="from"),
+    range_to: str = Query(..., alias="to"),
+):
+    """
+    여러 달의 이벤트를 한 번에 조회 (예: ?from=2025-01&to=2025-12)
+    - 한 번의 쿼리로 기간 전체를 조회, 월별 판정은 get_events와 동일
+    - 기간 내 공휴일 포함
+    """
+    start_year, start_month = parse_year_month(range_from)
+    end_year, end_month = parse_year_month(range_to)
+    months = month_keys(start_year, start_month, end_year, end_month)
+    if not months:
+        raise HTTPException(status_code=400, detail="to는 from보다 같거나 이후여야 합니다.")
+    if len(months) > MAX_RANGE_MONTHS:
+        raise HTTPException(status_code=400, detail=f"최대 {MAX_RANGE_MONTHS}개월까지 조회할 수 있습니다.")
+
+    grouped = await load_month_events(months)
+
+    range_start = f"{start_year}-{start_month:02d}-01"
+    range_end = f"{end_year}-{end_month:02d}-31"
+    holidays = [h for h in get_range_holidays(start_year, end_year) if range_start <= h.date <= range_end]
+
+    return CalendarRangeResponse(months=grouped, holidays=holidays)
+
+# 2. 한국 공휴일 조회 (/{id} 보다 먼저 정의해야 함, 연도별 계산 결과는 메모리 캐시)
+MAX_HOLIDAY_YEARS = 20
 
 @router.get("/holidays/{year}", response_model=List[Holiday])
-async def get_holidays(year: int):
-    """해당 연도의 한국 공휴일 반환"""
-    holidays = []
-
-    # 고정 공휴일 (양력)
-    fixed_holidays = [
-        (1, 1, "신정"),
-        (3, 1, "삼일절"),
-        (5, 5, "어린이날"),
-        (6, 6, "현충일"),
-        (8, 15, "광복절"),
-        (10, 3, "개천절"),
-        (10, 9, "한글날"),
-        (12, 25, "크리스마스"),
-    ]
+async def get_holidays(year: int = Path(..., ge=MIN_YEAR, le=MAX_YEAR)):
+    """해당 연도의 한국 공휴일 반환 (대체공휴일 포함)"""
+    return get_year_holidays(year)
+
+@router.get("/holidays", response_model=List[Holiday])
+async def get_holidays_range(
+    year_from: int = Query(..., alias="from", ge=MIN_YEAR, le=MAX_YEAR),
+    year_to: int = Query(..., alias="to", ge=MIN_YEAR, le=MAX_YEAR),
+):
+    """여러 연도의 공휴일을 한 번에 반환 (예: ?from=2025&to=2027)"""
+    if year_to < year_from:
+        raise HTTPException(status_code=400, detail="to는 from보다 크거나 같아야 합니다.")
+    if year_to - year_from + 1 > MAX_HOLIDAY_YEARS:
+        raise HTTPException(status_code=400, detail=f"최대 {MAX_HOLIDAY_YEARS}년까지 조회할 수 있습니다.")
+    return get_range_holidays(year_from, year_to)
+
+# 2-1. iCalendar(ICS) 구독 피드 (/{id} 보다 먼저 정의해야 함)
+FEED_YEARS_BACK = 1
+FEED_YEARS_AHEAD = 3
+FEED_MAX_YEARS = 10
+
+class FeedStamp(BaseModel):
+    updated_at: Optional[datetime] = None
 
-    for month, day, name in fixed_holidays:
-        holidays.append(Holiday(
-            date=f"{year}-{month:02d}-{day:02d}",
-            name=name,
-            is_lunar=False
-        ))
-
-    # 음력 공휴일
-    lunar_holidays = [
-        (1, 1, "설날"),
-        (4, 8, "석가탄신일"),
-        (8, 15, "추석"),
-    ]
+def ics_escape(text: str) -> str:
+    return (text or "").replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+def ics_fold(line: str) -> str:
+    """RFC 5545: 한 줄 75 octet 초과 시 접기 (UTF-8 한글이 잘리지 않도록 문자 단위)"""
+    parts, current, size = [], "", 0
+    for ch in line:
+        width = len(ch.encode("utf-8"))
+        if size + width > 75:
+            parts.append(current)
+            current, size = " ", 1
+        current += ch
+        size += width
+    parts.append(current)
+    return "\r\n".join(parts) + "\r\n"
+
+def as_utc(value: datetime) -> datetime:
+    """MongoDB에서 읽은 naive datetime은 UTC로 간주"""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+def ics_date(value: date) -> str:
+    return value.strftime("%Y%m%d")
+
+def parse_date(value: Optional[str]) -> Optional[date]:
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except (TypeError, ValueError):
+        return None
 
-    for lunar_month, lunar_day, name in lunar_holidays:
-        solar = lunar_to_solar(year, lunar_month, lunar_day)
-        if solar:
-            holidays.append(Holiday(
-                date=solar.strftime('%Y-%m-%d'),
-                name=name,
-                is_lunar=True
-            ))
+def parse_ymd(value: Optional[str]) -> Optional[Tuple[int, int, int]]:
+    """'YYYY-MM-DD' → (연, 월, 일). 음력 날짜(2월 30일 등)도 그대로 숫자로"""
+    try:
+        year, month, day = (int(part) for part in value.split('-'))
+        return year, month, day
+    except (AttributeError, ValueError):
+        return None
 
-            # 설날, 추석은 전날/다음날도 공휴일
-            if name in ["설날", "추석"]:
-                # 전날
-                prev_day = lunar_to_solar(year, lunar_month, lunar_day - 1) if lunar_day > 1 else None
-                if prev_day:
-                    holidays.append(Holiday(
-                        date=prev_day.strftime('%Y-%m-%d'),
-                        name=f"{name} 연휴",
-                        is_lunar=True
-                    ))
-                # 다음날
-                next_day = lunar_to_solar(year, lunar_month, lunar_day + 1)
-                if next_day:
-                    holidays.append(Holiday(
-                        date=next_day.strftime('%Y-%m-%d'),
-                        name=f"{name} 연휴",
-                        is_lunar=True
-                    ))
-
-    # 날짜순 정렬
-    holidays.sort(key=lambda h: h.date)
-    return holidays
+def expand_event(event: CalendarEvent, start_year: int, end_year: int) -> List[tuple]:
+    """이벤트의 양력 (시작일, 종료일) 목록. 반복/음력 이벤트는 연도 구간만큼 펼침"""
+    if event.is_lunar:
+        # 음력 날짜 문자열은 양력으로 없는 날(2월 30일 등)일 수 있어 date 로 파싱하지 않음
+        start = parse_ymd(event.date)
+        end = parse_ymd(event.end_date)
+        if not start:
+            return []
+        if not event.is_yearly:
+            solar = lunar.lunar_to_solar(*start)
+            return [(solar, None)] if solar else []
+        occurrences = []
+        # 음력 12월은 양력으로 다음 해가 되므로 전년도부터 확인
+        for year in range(start_year - 1, end_year + 1):
+            solar = lunar.lunar_to_solar(year, start[1], start[2])
+            solar_end = lunar.lunar_to_solar(year, end[1], end[2]) if end else None
+            if solar and start_year <= solar.year <= end_year:
+                occurrences.append((solar, solar_end if solar_end and solar_end >= solar else None))
+        return occurrences
+
+    start = parse_date(event.date)
+    end = parse_date(event.end_date)
+    if not start:
+        return []
+
+    if event.is_yearly:
+        occurrences = []
+        for year in range(start_year, end_year + 1):
+            try:
+                solar = start.replace(year=year)
+                solar_end = end.replace(year=year) if end else None
+            except ValueError:  # 2월 29일
+                continue
+            occurrences.append((solar, solar_end if solar_end and solar_end >= solar else None))
+        return occurrences
+
+    if event.is_range and end and end >= start:
+        return [(start, end)]
+    return [(start, None)]
+
+async def feed_lines(start_year: int, end_year: int):
+    yield ics_fold("BEGIN:VCALENDAR")
+    yield ics_fold("VERSION:2.0")
+    yield ics_fold("PRODID:-//Holango//Calendar//KO")
+    yield ics_fold("CALSCALE:GREGORIAN")
+    yield ics_fold("X-WR-CALNAME:Holango")
+    yield ics_fold("X-WR-TIMEZONE:Asia/Seoul")
+
+    # 커서로 하나씩 읽어 바로 내보냄 (전체 목록을 메모리에 올리지 않음)
+    async for event in CalendarEvent.find_all():
+        stamp = as_utc(event.updated_at or event.created_at or datetime.now())
+        for solar, solar_end in expand_event(event, start_year, end_year):
+            lines = [
+                "BEGIN:VEVENT",
+                f"UID:{event.id}-{ics_date(solar)}@holango",
+                f"DTSTAMP:{stamp.strftime('%Y%m%dT%H%M%SZ')}",
+                f"DTSTART;VALUE=DATE:{ics_date(solar)}",
+                # 종일 일정의 DTEND는 마지막 날 다음 날
+                f"DTEND;VALUE=DATE:{ics_date((solar_end or solar) + timedelta(days=1))}",
+                f"SUMMARY:{ics_escape(event.title)}",
+            ]
+            if event.memo:
+                lines.append(f"DESCRIPTION:{ics_escape(event.memo)}")
+            lines.append("END:VEVENT")
+            yield "".join(ics_fold(line) for line in lines)
+
+    yield ics_fold("END:VCALENDAR")
+
+@router.get("/feed.ics")
+async def get_feed(
+    request: Request,
+    years_back: int = Query(FEED_YEARS_BACK, ge=0, le=FEED_MAX_YEARS),
+    years_ahead: int = Query(FEED_YEARS_AHEAD, ge=0, le=FEED_MAX_YEARS),
+):
+    """
+    휴대폰 캘린더 구독용 ICS 피드
+    - 반복/음력 이벤트는 올해 기준 years_back ~ years_ahead 년 범위로 펼침
+    - 가장 최근 updated_at + 이벤트 수로 ETag / Last-Modified 생성, 변경 없으면 304
+    """
+    latest = await CalendarEvent.find_all().sort(-CalendarEvent.updated_at).project(FeedStamp).first_or_none()
+    count = await CalendarEvent.count()
+    last_modified = as_utc(latest.updated_at if latest and latest.updated_at else datetime(2000, 1, 1))
+
+    this_year = date.today().year
+    start_year, end_year = this_year - years_back, this_year + years_ahead
+    etag = '"{}"'.format(hashlib.md5(f"{last_modified.isoformat()}|{count}|{start_year}|{end_year}".encode()).hexdigest())
+    headers = {
+        "ETag": etag,
+        "Last-Modified": format_datetime(last_modified.replace(microsecond=0), usegmt=True),
+        "Cache-Control": "no-cache",
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_none_match:
+        if etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*":
+            return Response(status_code=304, headers=headers)
+    elif if_modified_since:
+        try:
+            if last_modified.replace(microsecond=0) <= parsedate_to_datetime(if_modified_since):
+                return Response(status_code=304, headers=headers)
+        except (TypeError, ValueError):
+            pass
+
+    return StreamingResponse(
+        feed_lines(start_year, end_year),
+        media_type="text/calendar; charset=utf-8",
+        headers={**headers, "Content-Disposition": 'inline; filename="holango.ics"'},
+    )
 
 # 3. 상세 조회
 @router.get("/{id}", response_model=CalendarEventResponse)
@@ -282,10 +645,14 @@ async def create_event(event: CalendarEvent, current_user: User = Depends(get_cu
             if lunar_end:
                 event.end_date = lunar_end
 
+    for key, value in derive_query_fields(event).items():
+        setattr(event, key, value)
+
     event.created_by = current_user.id
     event.created_at = datetime.now()
     event.updated_at = datetime.now()
     await event.insert()
+    await refresh_event_occurrences(event)
     return event
 
 # 4. 수정
@@ -313,8 +680,12 @@ async def update_event(
     data.updated_at = datetime.now()
     update_data = data.model_dump(exclude_unset=True)
     update_data.pop("created_by", None)
+    # 파생 필드는 기존 값과 합친 최종 상태 기준으로 재계산
+    update_data.update(derive_query_fields(event.model_copy(update=update_data)))
     await event.update({"$set": update_data})
-    return await CalendarEvent.get(id)
+    updated = await CalendarEvent.get(id)
+    await refresh_event_occurrences(updated)
+    return updated
 
 # 5. 삭제
 @router.delete("/{id}")
@@ -327,4 +698,6 @@ async def delete_event(
         raise HTTPException(status_code=404, detail="Not found")
     assert_owner_or_admin(event, current_user)
     await event.delete()
+    await CalendarOccurrence.find(CalendarOccurrence.event_id == id).delete()
+    etag.bump(CalendarOccurrence)
     return {"message": "Deleted"}
@@ -1,10 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from typing import List, Optional
 from beanie import PydanticObjectId
 from beanie.operators import RegEx
 from models.cooking import Recipe
 from models.user import User
 from auth.security import get_current_user, assert_owner_or_admin
+from services import search
+from services.pagination import paginate, LimitQuery, CursorQuery
+from services.projection import build_projection, FieldsQuery
+from services.serialization import fast_response
+from services.resolve import ResolveQuery, parse_resolve, resolve_names
 
 router = APIRouter(
     prefix="/api/cooking",
@@ -12,17 +17,26 @@ router = APIRouter(
 )
 
 
-@router.get("", response_model=List[Recipe])
+# 목록 요약 프로젝션
+LIST_SUMMARY = {"name": 1, "description": 1, "cooking_type": 1, "image_url": 1, "created_by": 1}
+
+
+@router.get("", response_model=List[Recipe], response_model_exclude_unset=True)
 async def get_all_recipes(
+    response: Response,
     name: Optional[str] = None,
     description: Optional[str] = None,
     created_by: Optional[str] = None,
     cooking_type: Optional[str] = None,
+    limit: Optional[int] = LimitQuery,
+    cursor: Optional[str] = CursorQuery,
+    fields: Optional[str] = FieldsQuery,
+    resolve: Optional[str] = ResolveQuery,
 ):
     expressions = []
 
     if name:
-        expressions.append(RegEx(Recipe.name, name, "i"))
+        expressions.append(search.title_condition("recipe", name))  # 부분 글자/초성 검색
     if description:
         expressions.append(RegEx(Recipe.description, description, "i"))
     if created_by and created_by != 'all':
@@ -33,24 +47,28 @@ async def get_all_recipes(
     if cooking_type and cooking_type != "전체":
         expressions.append(Recipe.cooking_type == cooking_type)
 
-    if expressions:
-        return await Recipe.find(*expressions).to_list()
-    return await Recipe.find_all().to_list()
+    query = {"$and": expressions} if expressions else {}
+    projection = build_projection(Recipe, fields, LIST_SUMMARY)
+    items = await paginate(Recipe, query, ["+_id"], limit, cursor, response, projection)  # 등록순
+    items = await resolve_names(items, Recipe, parse_resolve(resolve))
+    return fast_response(items, Recipe, response)
 
 
 @router.post("", response_model=Recipe)
 async def add_recipe(recipe: Recipe, current_user: User = Depends(get_current_user)):
     recipe.created_by = current_user.id
     await recipe.insert()
+    await search.index_document("recipe", recipe)
     return recipe
 
 
 @router.get("/{id}", response_model=Recipe)
-async def get_recipe(id: PydanticObjectId):
+async def get_recipe(id: PydanticObjectId, resolve: Optional[str] = ResolveQuery):
+    options = parse_resolve(resolve)
     recipe = await Recipe.get(id)
     if not recipe:
         raise HTTPException(status_code=404, detail="Recipe not found")
-    return recipe
+    return fast_response(await resolve_names(recipe, Recipe, options), Recipe)
 
 
 @router.put("/{id}", response_model=Recipe)
@@ -67,6 +85,7 @@ async def update_recipe(
     update_query = recipe_data.dict(exclude_unset=True)
     update_query.pop("created_by", None)  # 작성자 보존
     await recipe.set(update_query)
+    await search.index_document("recipe", recipe)
     return recipe
 
 
@@ -80,4 +99,5 @@ async def delete_recipe(
         raise HTTPException(status_code=404, detail="Recipe not found")
     assert_owner_or_admin(recipe, current_user)
     await recipe.delete()
+    await search.remove_document("recipe", recipe.id)
     return {"message": "Successfully deleted"}
@@ -1,17 +1,33 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from beanie import PydanticObjectId
 from typing import List, Optional
 from models.culture import CultureReview
 from models.user import User
 from auth.security import get_current_user, assert_owner_or_admin
+from services import search
+from services.pagination import paginate, LimitQuery, CursorQuery
+from services.projection import build_projection, FieldsQuery, FIRST_IMAGE
+from services.serialization import fast_response
+from services.resolve import ResolveQuery, parse_resolve, resolve_names
 from datetime import datetime
 
 router = APIRouter(prefix="/api/culture", tags=["Culture"])
 
 
+# 목록 요약 프로젝션 (코멘트 제외 / 이미지는 첫 장만)
+LIST_SUMMARY = {
+    "title": 1, "category": 1, "visit_date": 1, "location": 1, "image_urls": FIRST_IMAGE,
+    "rating_husband": 1, "rating_wife": 1, "rating": 1, "created_at": 1, "created_by": 1,
+}
+
+# resolve=codes 로 이름을 붙일 코드값 필드 → 공통 코드 그룹
+CODE_FIELDS = {"category": "CULTURE"}
+
+
 # 1. 목록 조회 (필터 지원)
-@router.get("", response_model=List[CultureReview])
+@router.get("", response_model=List[CultureReview], response_model_exclude_unset=True)
 async def get_cultures(
+    response: Response,
     title: Optional[str] = None,
     category: Optional[str] = None,
     location: Optional[str] = None,
@@ -20,11 +36,15 @@ async def get_cultures(
     end_date: Optional[str] = None,
     min_rating: Optional[float] = None,
     max_rating: Optional[float] = None,
+    limit: Optional[int] = LimitQuery,
+    cursor: Optional[str] = CursorQuery,
+    fields: Optional[str] = FieldsQuery,
+    resolve: Optional[str] = ResolveQuery,
 ):
     query = {}
 
     if title:
-        query["title"] = {"$regex": title, "$options": "i"}
+        query.update(search.title_condition("culture", title))  # 부분 글자/초성 검색
     if category:
         query["category"] = category
     if location:
@@ -54,7 +74,10 @@ async def get_cultures(
             rating_query["$lte"] = max_rating
         query["rating"] = rating_query
 
-    return await CultureReview.find(query).sort("-visit_date", "-created_at").to_list()
+    projection = build_projection(CultureReview, fields, LIST_SUMMARY)
+    items = await paginate(CultureReview, query, ["-visit_date", "-created_at"], limit, cursor, response, projection)
+    items = await resolve_names(items, CultureReview, parse_resolve(resolve), CODE_FIELDS)
+    return fast_response(items, CultureReview, response)
 
 
 # 2. 등록
@@ -73,16 +96,18 @@ async def create_culture(culture: CultureReview, current_user: User = Depends(ge
     culture.rating = round(sum(scores) / len(scores), 1) if scores else 0.0
 
     await culture.insert()
+    await search.index_document("culture", culture)
     return culture
 
 
 # 3. 상세 조회
 @router.get("/{id}", response_model=CultureReview)
-async def get_culture(id: PydanticObjectId):
+async def get_culture(id: PydanticObjectId, resolve: Optional[str] = ResolveQuery):
+    options = parse_resolve(resolve)
     culture = await CultureReview.get(id)
     if not culture:
         raise HTTPException(status_code=404, detail="Not found")
-    return culture
+    return fast_response(await resolve_names(culture, CultureReview, options, CODE_FIELDS), CultureReview)
 
 
 # 4. 수정
@@ -112,6 +137,7 @@ async def update_culture(
     update_data["rating"] = round(sum(scores) / len(scores), 1) if scores else 0.0
 
     await culture.update({"$set": update_data})
+    await search.index_document("culture", culture)
     return await CultureReview.get(id)
 
 
@@ -126,4 +152,5 @@ async def delete_culture(
         raise HTTPException(status_code=404, detail="Not found")
     assert_owner_or_admin(culture, current_user)
     await culture.delete()
+    await search.remove_document("culture", culture.id)
     return {"message": "Deleted"}
@@ -1,27 +1,44 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from beanie import PydanticObjectId
 from typing import List, Optional
 from datetime import datetime
 from models.diary import Diary, DiaryComment
 from models.user import User
 from auth.security import get_current_user, assert_owner_or_admin
+from services import search
+from services.pagination import paginate, LimitQuery, CursorQuery
+from services.projection import build_projection, FieldsQuery, COMMENT_COUNT, preview
+from services.serialization import fast_response
+from services.resolve import ResolveQuery, parse_resolve, resolve_names
 
 router = APIRouter(prefix="/api/diary", tags=["Diary"])
 
+# 목록 요약 프로젝션 (본문은 앞부분만, 코멘트는 개수만)
+LIST_SUMMARY = {
+    "title": 1, "date": 1, "mood": 1, "weather": 1, "image_url": 1, "created_at": 1, "created_by": 1,
+    "content": preview("content", 100), "comment_count": COMMENT_COUNT,
+}
+LIST_COMPUTED = {"comment_count": COMMENT_COUNT}
+
 # 1. 목록 조회 (검색/필터 지원)
-@router.get("", response_model=List[Diary])
+@router.get("", response_model=List[Diary], response_model_exclude_unset=True)
 async def get_diaries(
+    response: Response,
     keyword: Optional[str] = None,
     created_by: Optional[str] = None,
     mood: Optional[str] = None,
     date_from: Optional[str] = None,
     date_to: Optional[str] = None,
+    limit: Optional[int] = LimitQuery,
+    cursor: Optional[str] = CursorQuery,
+    fields: Optional[str] = FieldsQuery,
+    resolve: Optional[str] = ResolveQuery,
 ):
     query = {}
 
     if keyword:
         query["$or"] = [
-            {"title": {"$regex": keyword, "$options": "i"}},
+            search.title_condition("diary", keyword),  # 제목은 부분 글자/초성 검색
             {"content": {"$regex": keyword, "$options": "i"}}
         ]
 
@@ -41,15 +58,19 @@ async def get_diaries(
         if date_to:
             query["date"]["$lte"] = date_to
 
-    return await Diary.find(query).sort("-date", "-created_at").to_list()
+    projection = build_projection(Diary, fields, LIST_SUMMARY, LIST_COMPUTED)
+    items = await paginate(Diary, query, ["-date", "-created_at"], limit, cursor, response, projection)
+    items = await resolve_names(items, Diary, parse_resolve(resolve))
+    return fast_response(items, Diary, response)
 
 # 2. 상세 조회
 @router.get("/{id}", response_model=Diary)
-async def get_diary(id: PydanticObjectId):
+async def get_diary(id: PydanticObjectId, resolve: Optional[str] = ResolveQuery):
+    options = parse_resolve(resolve)
     diary = await Diary.get(id)
     if not diary:
         raise HTTPException(status_code=404, detail="Not found")
-    return diary
+    return fast_response(await resolve_names(diary, Diary, options), Diary)
 
 # 3. 등록
 @router.post("", response_model=Diary)
@@ -58,6 +79,7 @@ async def create_diary(diary: Diary, current_user: User = Depends(get_current_us
     diary.created_at = datetime.now()
     diary.updated_at = datetime.now()
     await diary.insert()
+    await search.index_document("diary", diary)
     return diary
 
 # 4. 수정
@@ -76,6 +98,7 @@ async def update_diary(
     update_data = data.model_dump(exclude_unset=True)
     update_data.pop("created_by", None)
     await diary.update({"$set": update_data})
+    await search.index_document("diary", diary)
     return await Diary.get(id)
 
 # 5. 삭제
@@ -89,6 +112,7 @@ async def delete_diary(
         raise HTTPException(status_code=404, detail="Not found")
     assert_owner_or_admin(diary, current_user)
     await diary.delete()
+    await search.remove_document("diary", diary.id)
     return {"message": "Deleted"}
 
 # 6. 코멘트 추가
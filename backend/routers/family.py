@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from typing import List, Optional
 from beanie import PydanticObjectId
 from pydantic import BaseModel
 from models.family import FamilyMember
 from models.user import User
 from auth.security import get_current_user, assert_owner_or_admin
+from services import family_cascade, family_tree
+from services.serialization import fast_response
+from services.resolve import ResolveQuery, parse_resolve, resolve_names
 
 # 부분 업데이트용 모델
 class FamilyMemberUpdate(BaseModel):
@@ -25,57 +28,39 @@ router = APIRouter(
 )
 
 @router.get("", response_model=List[FamilyMember])
-async def get_all_members(side: Optional[str] = None):
+async def get_all_members(side: Optional[str] = None, resolve: Optional[str] = ResolveQuery):
     """전체 가족 구성원 목록 조회 (side 필터 지원)"""
-    if side:
-        return await FamilyMember.find(FamilyMember.side == side).to_list()
-    return await FamilyMember.find_all().to_list()
-
-@router.get("/tree")
-async def get_family_tree(side: Optional[str] = None):
-    """트리 구조로 가족 구성원 반환"""
+    options = parse_resolve(resolve)
     if side:
         members = await FamilyMember.find(FamilyMember.side == side).to_list()
     else:
         members = await FamilyMember.find_all().to_list()
+    return fast_response(await resolve_names(members, FamilyMember, options), FamilyMember)
 
-    # 세대별로 그룹화
-    generations = {}
-    for member in members:
-        gen = member.generation
-        if gen not in generations:
-            generations[gen] = []
-        generations[gen].append(member)
-
-    # 세대 순으로 정렬 (높은 세대 = 조상부터)
-    sorted_generations = dict(sorted(generations.items(), key=lambda x: -x[0]))
-
-    return {
-        "members": members,
-        "generations": sorted_generations
-    }
+@router.get("/tree")
+async def get_family_tree(side: Optional[str] = None):
+    """
+    side 별 중첩 트리 (parent_id/sibling_of/spouse_id 연결, 세대는 본인 기준으로 계산)
+    - 노드: {member, spouse, generation, children: [노드]}
+    - generations: {세대: [멤버 ID]} (높은 세대 = 조상부터)
+    """
+    return Response(content=await family_tree.get_tree_json(side), media_type="application/json")
 
 @router.post("", response_model=FamilyMember)
 async def add_member(member: FamilyMember, current_user: User = Depends(get_current_user)):
-    """가족 구성원 등록"""
+    """가족 구성원 등록 (배우자 연결이 있으면 상대방도 연결)"""
     member.created_by = current_user.id
-    await member.insert()
-
-    # 배우자 연결이 있으면 상대방도 업데이트
-    if member.spouse_id:
-        spouse = await FamilyMember.get(PydanticObjectId(member.spouse_id))
-        if spouse and not spouse.spouse_id:
-            await spouse.set({"spouse_id": str(member.id)})
-
+    await family_cascade.add_member(member)
     return member
 
 @router.get("/{id}", response_model=FamilyMember)
-async def get_member(id: PydanticObjectId):
+async def get_member(id: PydanticObjectId, resolve: Optional[str] = ResolveQuery):
     """가족 구성원 상세 조회"""
+    options = parse_resolve(resolve)
     member = await FamilyMember.get(id)
     if not member:
         raise HTTPException(status_code=404, detail="Family member not found")
-    return member
+    return fast_response(await resolve_names(member, FamilyMember, options), FamilyMember)
 
 @router.put("/{id}", response_model=FamilyMember)
 async def update_member(
@@ -116,42 +101,11 @@ async def delete_member(
     id: PydanticObjectId,
     current_user: User = Depends(get_current_user),
 ):
-    """가족 구성원 삭제 (본인 세대 삭제 시 해당 side 전체 연쇄 삭제)"""
+    """가족 구성원 삭제 (본인 세대 삭제 시 해당 side 전체 연쇄 삭제, 부모/배우자 연결 해제)"""
     member = await FamilyMember.get(id)
     if not member:
         raise HTTPException(status_code=404, detail="Family member not found")
     assert_owner_or_admin(member, current_user)
 
-    # 본인 세대(generation 0) 삭제 시 해당 side 가족 전체 삭제
-    if member.generation == 0:
-        side_members = await FamilyMember.find(
-            FamilyMember.side == member.side,
-            FamilyMember.id != member.id
-        ).to_list()
-        for m in side_members:
-            # 다른 side 멤버의 배우자 연결 해제
-            if m.spouse_id:
-                try:
-                    spouse = await FamilyMember.get(PydanticObjectId(m.spouse_id))
-                    if spouse and spouse.side != member.side:
-                        await spouse.set({"spouse_id": None})
-                except Exception:
-                    pass
-            await m.delete()
-
-    # 배우자 연결 해제
-    if member.spouse_id:
-        try:
-            spouse = await FamilyMember.get(PydanticObjectId(member.spouse_id))
-            if spouse and spouse.spouse_id == str(member.id):
-                await spouse.set({"spouse_id": None})
-        except Exception:
-            pass
-
-    # 자녀의 parent_id 연결 해제
-    children = await FamilyMember.find(FamilyMember.parent_id == str(member.id)).to_list()
-    for child in children:
-        await child.set({"parent_id": None})
-
-    await member.delete()
+    await family_cascade.delete_member(member)
     return {"message": "Successfully deleted"}
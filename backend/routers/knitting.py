@@ -2,11 +2,16 @@ from datetime import datetime
 from typing import List, Optional
 
 from beanie import PydanticObjectId
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 
 from models.knitting import KnittingRecord
 from models.user import User
 from auth.security import get_current_user, assert_owner_or_admin
+from services import search
+from services.pagination import paginate, LimitQuery, CursorQuery
+from services.projection import build_projection, FieldsQuery, FIRST_IMAGE
+from services.serialization import fast_response
+from services.resolve import ResolveQuery, parse_resolve, resolve_names
 
 
 router = APIRouter(
@@ -15,12 +20,27 @@ router = APIRouter(
 )
 
 
-@router.get("", response_model=List[KnittingRecord])
+# 목록 요약 프로젝션 (작업 일지, 실, 게이지, 도안 등 상세 정보 제외 / 이미지는 첫 장만)
+LIST_SUMMARY = {
+    "name": 1, "category": 1, "status": 1, "size": 1, "start_date": 1, "end_date": 1,
+    "image_urls": FIRST_IMAGE, "created_at": 1, "created_by": 1,
+}
+
+# resolve=codes 로 이름을 붙일 코드값 필드 → 공통 코드 그룹
+CODE_FIELDS = {"status": "KNITTING_STATUS", "category": "KNITTING_CATEGORY", "techniques": "KNITTING_TECHNIQUE"}
+
+
+@router.get("", response_model=List[KnittingRecord], response_model_exclude_unset=True)
 async def get_all_records(
+    response: Response,
     q: Optional[str] = None,             # 작품 이름 / 실 / 태그 통합 검색
     status: Optional[str] = None,        # WAIT / CO / WIP / FO
     category: Optional[str] = None,      # KNITTING_CATEGORY 코드값
     sort: Optional[str] = "recent",      # recent / oldest / name
+    limit: Optional[int] = LimitQuery,
+    cursor: Optional[str] = CursorQuery,
+    fields: Optional[str] = FieldsQuery,
+    resolve: Optional[str] = ResolveQuery,
 ):
     # raw mongo 쿼리로 작성 (배열/중첩 필드 검색 안전성 확보)
     mongo_query: dict = {}
@@ -28,7 +48,7 @@ async def get_all_records(
     if q:
         rx = {"$regex": q, "$options": "i"}
         mongo_query["$or"] = [
-            {"name": rx},
+            search.title_condition("knitting", q),  # 작품 이름은 부분 글자/초성 검색
             {"yarns.name": rx},
             {"tags": rx},
         ]
@@ -37,16 +57,17 @@ async def get_all_records(
     if category and category != "all":
         mongo_query["category"] = category
 
-    query = KnittingRecord.find(mongo_query) if mongo_query else KnittingRecord.find_all()
-
     if sort == "oldest":
-        query = query.sort("+start_date")
+        sort_keys = ["+start_date"]
     elif sort == "name":
-        query = query.sort("+name")
+        sort_keys = ["+name"]
     else:  # recent
-        query = query.sort("-created_at")
+        sort_keys = ["-created_at"]
 
-    return await query.to_list()
+    projection = build_projection(KnittingRecord, fields, LIST_SUMMARY)
+    items = await paginate(KnittingRecord, mongo_query, sort_keys, limit, cursor, response, projection)
+    items = await resolve_names(items, KnittingRecord, parse_resolve(resolve), CODE_FIELDS)
+    return fast_response(items, KnittingRecord, response)
 
 
 @router.post("", response_model=KnittingRecord)
@@ -56,15 +77,17 @@ async def add_record(record: KnittingRecord, current_user: User = Depends(get_cu
     record.created_at = now
     record.updated_at = now
     await record.insert()
+    await search.index_document("knitting", record)
     return record
 
 
 @router.get("/{id}", response_model=KnittingRecord)
-async def get_record(id: PydanticObjectId):
+async def get_record(id: PydanticObjectId, resolve: Optional[str] = ResolveQuery):
+    options = parse_resolve(resolve)
     record = await KnittingRecord.get(id)
     if not record:
         raise HTTPException(status_code=404, detail="Knitting record not found")
-    return record
+    return fast_response(await resolve_names(record, KnittingRecord, options, CODE_FIELDS), KnittingRecord)
 
 
 @router.put("/{id}", response_model=KnittingRecord)
@@ -82,6 +105,7 @@ async def update_record(
     update_query.pop("created_by", None)
     update_query["updated_at"] = datetime.now()
     await record.set(update_query)
+    await search.index_document("knitting", record)
     return record
 
 
@@ -95,4 +119,5 @@ async def delete_record(
         raise HTTPException(status_code=404, detail="Knitting record not found")
     assert_owner_or_admin(record, current_user)
     await record.delete()
+    await search.remove_document("knitting", record.id)
     return {"message": "Successfully deleted"}
@@ -1,107 +1,37 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from beanie import PydanticObjectId
 from typing import List, Optional
-from models.liquor import LiquorReview, AINote
+from models.liquor import LiquorReview
+from models.ai_cache import AINoteCache
 from models.user import User
 from auth.security import get_current_user, assert_owner_or_admin
+from services import ai_queue, ai_client, liquor_ai, pubsub, search
+from services.pagination import paginate, LimitQuery, CursorQuery
+from services.projection import build_projection, FieldsQuery, FIRST_IMAGE
+from services.serialization import fast_response
+from services.resolve import ResolveQuery, parse_resolve, resolve_names
 from datetime import datetime
-import google.generativeai as genai
-import os
-import json
-import re
 
 router = APIRouter(prefix="/api/liquor", tags=["Liquor"])
 
 
-async def analyze_liquor_background(liquor_id: str, liquor_name: str):
-    """
-    백그라운드에서 Gemini API를 호출하여 술 정보를 분석하고 DB를 업데이트합니다.
-    (Model: gemini-2.5-flash)
-    """
-    try:
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            print("❌ GEMINI_API_KEY가 설정되지 않아 AI 분석을 건너뜁니다.")
-            return
-
-        genai.configure(api_key=api_key)
-        
-        # 안전 필터 해제
-        safety_settings = [
-            {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
-            {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_NONE"},
-            {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_NONE"},
-            {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_NONE"},
-        ]
-
-        model = genai.GenerativeModel('gemini-2.5-flash', safety_settings=safety_settings)
-        
-        prompt = f"""
-        당신은 전문 소믈리에입니다. 다음 술에 대한 정보를 분석해주세요.
-        술 이름: {liquor_name}
-        
-        다음 5가지 항목을 JSON 형식으로만 답해주세요. 다른 말은 절대 하지 말고 오직 JSON 객체만 반환하세요.
-        키 이름: description, taste, aroma, variety, pairing
-        
-        {{
-            "description": "이 술에 대한 흥미로운 1~2문장 소개 (한국어)",
-            "taste": "맛의 특징 (단맛, 쓴맛, 바디감 등)",
-            "aroma": "향의 특징 (과일, 오크, 바닐라 등)",
-            "variety": "품종 또는 원료 (모르면 '정보 없음'이라 적으세요)",
-            "pairing": "잘 어울리는 음식 추천 1~2개"
-        }}
-        """
-        
-        response = await model.generate_content_async(prompt)
-        
-        raw_text = response.text
-        
-        # [핵심] 정규식으로 JSON 부분({ ... })만 추출
-        # re.DOTALL: 줄바꿈이 포함되어 있어도 매칭되도록 함
-        json_match = re.search(r'\{.*\}', raw_text, re.DOTALL)
-        
-        if json_match:
-            json_str = json_match.group()
-        else:
-            # 매칭 실패 시 수동 정제 시도
-            json_str = raw_text.replace("``````", "").strip()
-        
-        try:
-            data = json.loads(json_str)
-        except json.JSONDecodeError:
-            print(f"⚠️ JSON 파싱 실패. 원본: {raw_text}")
-            # 파싱 실패 시 원본 텍스트라도 description에 넣어서 DB 저장
-            data = {
-                "description": raw_text[:300], # 너무 길면 자름
-                "taste": "-", "aroma": "-", "variety": "-", "pairing": "-"
-            }
-
-        # DB 업데이트
-        liquor = await LiquorReview.get(PydanticObjectId(liquor_id))
-        if liquor:
-            liquor.ai_note = AINote(
-                status="COMPLETED",
-                description=data.get("description", ""),
-                taste=data.get("taste", ""),
-                aroma=data.get("aroma", ""),
-                variety=data.get("variety", ""),
-                pairing=data.get("pairing", "")
-            )
-            await liquor.save()
-            print(f"✅ AI Analysis Completed for {liquor_name} (Model: gemini-2.5-flash)")
-            
-    except Exception as e:
-        print(f"❌ AI Background Error: {e}")
-        liquor = await LiquorReview.get(PydanticObjectId(liquor_id))
-        if liquor:
-            liquor.ai_note.status = "FAILED"
-            await liquor.save()
+# 1. 목록 조회
+# 목록 요약 프로젝션 (ai_note, 코멘트 제외 / 이미지는 첫 장만)
+LIST_SUMMARY = {
+    "name": 1, "category": 1, "wine_type": 1, "price": 1, "visit_date": 1,
+    "image_urls": FIRST_IMAGE, "image_url": 1, "pairing_foods": 1,
+    "rating_husband": 1, "rating_wife": 1, "rating": 1, "created_at": 1, "created_by": 1,
+}
 
+# resolve=codes 로 이름을 붙일 코드값 필드 → 공통 코드 그룹
+CODE_FIELDS = {"category": "SUL", "wine_type": "WINE_C"}
 
 
-# 1. 목록 조회
-@router.get("", response_model=List[LiquorReview])
+@router.get("", response_model=List[LiquorReview], response_model_exclude_unset=True)
 async def get_liquors(
+    response: Response,
     name: Optional[str] = None,
     category: Optional[str] = None,
      wine_type: Optional[str] = None,  # [추가] 와인 종류 필터
@@ -116,10 +46,14 @@ async def get_liquors(
     max_rating_husband: Optional[float] = None,
     min_rating_wife: Optional[float] = None,
     max_rating_wife: Optional[float] = None,
+    limit: Optional[int] = LimitQuery,
+    cursor: Optional[str] = CursorQuery,
+    fields: Optional[str] = FieldsQuery,
+    resolve: Optional[str] = ResolveQuery,
 ):
     query = {}
     
-    if name: query["name"] = {"$regex": name, "$options": "i"}
+    if name: query.update(search.title_condition("liquor", name))  # 부분 글자/초성 검색
     if category: query["category"] = category
     if wine_type: query["wine_type"] = wine_type  # [추가]
     if purchase_place: query["purchase_place"] = {"$regex": purchase_place, "$options": "i"}
@@ -159,14 +93,16 @@ async def get_liquors(
         if max_rating_wife is not None: rating_w_query["$lte"] = max_rating_wife
         query["rating_wife"] = rating_w_query
 
-    return await LiquorReview.find(query).sort("-visit_date", "-created_at").to_list()
+    projection = build_projection(LiquorReview, fields, LIST_SUMMARY)
+    items = await paginate(LiquorReview, query, ["-visit_date", "-created_at"], limit, cursor, response, projection)
+    items = await resolve_names(items, LiquorReview, parse_resolve(resolve), CODE_FIELDS)
+    return fast_response(items, LiquorReview, response)
 
 
 # 2. 등록 (AI 분석 자동 요청)
 @router.post("", response_model=LiquorReview)
 async def create_liquor(
     liquor: LiquorReview,
-    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
 ):
     liquor.created_by = current_user.id
@@ -182,24 +118,104 @@ async def create_liquor(
     else:
         liquor.rating = 0.0
 
-    # 초기 AI 상태는 PENDING
-    liquor.ai_note.status = "PENDING"
+    # 같은 술의 분석 결과가 캐시에 있으면 바로 붙이고, 없으면 PENDING
+    cached_note = await liquor_ai.get_cached_note(liquor.name, count_miss=False)
+    if cached_note:
+        liquor.ai_note = cached_note
+    else:
+        liquor.ai_note.status = "PENDING"
     
     await liquor.insert()
+    await search.index_document("liquor", liquor)
 
-    # 백그라운드에서 AI 분석 시작
-    background_tasks.add_task(analyze_liquor_background, str(liquor.id), liquor.name)
+    # AI 분석 작업 큐에 등록 (워커가 순서대로 처리)
+    if not cached_note:
+        await ai_queue.enqueue(liquor.id, liquor.name)
 
     return liquor
 
 
+# AI 분석 캐시 통계 (/{id} 보다 먼저 정의해야 함)
+@router.get("/ai-cache/stats")
+async def get_ai_cache_stats():
+    return {
+        **liquor_ai.cache_stats,
+        "entries": await AINoteCache.count(),
+        "prompt_version": liquor_ai.PROMPT_VERSION,
+    }
+
+
+# AI 호출 지표 (지연 시간, 토큰, 오류, 서킷 브레이커 상태)
+@router.get("/ai/metrics")
+async def get_ai_metrics():
+    return ai_client.metrics()
+
+
+# AI 분석 실패 건 일괄 재시도 (배치 프롬프트로 처리)
+@router.post("/ai/retry-failed")
+async def retry_failed_ai(current_user: User = Depends(get_current_user)):
+    count = await ai_queue.retry_failed()
+    return {"message": f"{count}건을 다시 분석합니다.", "count": count}
+
+
 # 3. 상세 조회
 @router.get("/{id}", response_model=LiquorReview)
-async def get_liquor(id: PydanticObjectId):
+async def get_liquor(id: PydanticObjectId, resolve: Optional[str] = ResolveQuery):
+    options = parse_resolve(resolve)
     liquor = await LiquorReview.get(id)
     if not liquor:
         raise HTTPException(status_code=404, detail="Not found")
-    return liquor
+    return fast_response(await resolve_names(liquor, LiquorReview, options, CODE_FIELDS), LiquorReview)
+
+
+# 3-1. AI 분석 상태 스트림 (SSE) - 분석이 끝나는 즉시 한 번 보내고 종료
+AI_STATUS_STREAM_SECONDS = 120
+AI_STATUS_HEARTBEAT_SECONDS = 15
+
+def sse_event(event: str, data: str) -> str:
+    return f"event: {event}\ndata: {data}\n\n"
+
+@router.get("/{id}/ai-status/stream")
+async def stream_ai_status(id: PydanticObjectId):
+    """
+    ai_note.status 가 PENDING 에서 바뀌면 `ai_note` 이벤트로 전달 (폴링 대체)
+    - 이미 끝난 상태면 바로 전달 후 종료
+    - AI_STATUS_STREAM_SECONDS 동안 결과가 없으면 종료 (브라우저 EventSource 가 재연결)
+    """
+    if not await LiquorReview.get(id):
+        raise HTTPException(status_code=404, detail="Not found")
+    topic = liquor_ai.status_topic(id)
+
+    async def events():
+        # 구독은 스트림 안에서 (시작 전에 연결이 끊겨도 구독이 남지 않도록 try/finally 안에서 해제)
+        queue = pubsub.subscribe(topic)
+        try:
+            yield "retry: 3000\n\n"
+            # 구독 뒤에 다시 조회 (조회와 구독 사이에 끝난 경우를 놓치지 않음)
+            liquor = await LiquorReview.get(id)
+            if not liquor:
+                return
+            if liquor.ai_note.status != "PENDING":
+                yield sse_event("ai_note", liquor.ai_note.model_dump_json())
+                return
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + AI_STATUS_STREAM_SECONDS
+            while loop.time() < deadline:
+                try:
+                    note = await asyncio.wait_for(queue.get(), AI_STATUS_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield sse_event("ai_note", note.model_dump_json())
+                return
+        finally:
+            pubsub.unsubscribe(topic, queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 # 4. 수정 (이름 변경 시 AI 재분석)
@@ -207,7 +223,6 @@ async def get_liquor(id: PydanticObjectId):
 async def update_liquor(
     id: PydanticObjectId,
     liquor_data: LiquorReview,
-    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
 ):
     liquor = await LiquorReview.get(id)
@@ -242,10 +257,16 @@ async def update_liquor(
     new_name = update_data.get("name", old_name)
     if new_name != old_name:
         print(f"🔄 술 이름 변경됨 ({old_name} -> {new_name}). AI 재분석 요청...")
-        updated_liquor.ai_note.status = "PENDING"
-        await updated_liquor.save()
-        background_tasks.add_task(analyze_liquor_background, str(id), new_name)
-        
+        cached_note = await liquor_ai.get_cached_note(new_name, count_miss=False)
+        if cached_note:
+            updated_liquor.ai_note = cached_note
+            await updated_liquor.save()
+        else:
+            updated_liquor.ai_note.status = "PENDING"
+            await updated_liquor.save()
+            await ai_queue.enqueue(id, new_name)
+
+    await search.index_document("liquor", updated_liquor)
     return updated_liquor
 
 
@@ -260,4 +281,5 @@ async def delete_liquor(
         raise HTTPException(status_code=404, detail="Not found")
     assert_owner_or_admin(liquor, current_user)
     await liquor.delete()
+    await search.remove_document("liquor", liquor.id)
     return {"message": "Deleted"}
@@ -1,9 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Response
+from typing import List, Optional
 from beanie import PydanticObjectId
 from models.review import Review
 from models.user import User
 from auth.security import get_current_user, assert_owner_or_admin
+from services import search
+from services.pagination import paginate, LimitQuery, CursorQuery
+from services.projection import build_projection, FieldsQuery, FIRST_IMAGE
+from services.serialization import fast_response
+from services.resolve import ResolveQuery, parse_resolve, resolve_names
 
 router = APIRouter(
     prefix="/api/review",
@@ -11,24 +16,48 @@ router = APIRouter(
 )
 
 
-@router.get("", response_model=List[Review])
-async def get_all_reviews():
-    return await Review.find_all().to_list()
+# 목록 요약 프로젝션 (이미지는 첫 장만, 한줄평은 필수 필드라 항상 포함)
+LIST_SUMMARY = {
+    "restaurant_name": 1, "location": 1, "category": 1, "visit_date": 1,
+    "husband_rating": 1, "wife_rating": 1, "image_urls": FIRST_IMAGE, "created_by": 1,
+}
+
+# resolve=codes 로 이름을 붙일 코드값 필드 → 공통 코드 그룹
+CODE_FIELDS = {"category": "FOOD"}
+
+
+@router.get("", response_model=List[Review], response_model_exclude_unset=True)
+async def get_all_reviews(
+    response: Response,
+    q: Optional[str] = None,
+    limit: Optional[int] = LimitQuery,
+    cursor: Optional[str] = CursorQuery,
+    fields: Optional[str] = FieldsQuery,
+    resolve: Optional[str] = ResolveQuery,
+):
+    # 식당 이름 검색 (부분 글자/초성)
+    query = search.title_condition("review", q) if q else {}
+    projection = build_projection(Review, fields, LIST_SUMMARY)
+    items = await paginate(Review, query, ["+_id"], limit, cursor, response, projection)  # 등록순
+    items = await resolve_names(items, Review, parse_resolve(resolve), CODE_FIELDS)
+    return fast_response(items, Review, response)
 
 
 @router.post("", response_model=Review)
 async def add_review(review: Review, current_user: User = Depends(get_current_user)):
     review.created_by = current_user.id
     await review.insert()
+    await search.index_document("review", review)
     return review
 
 
 @router.get("/{id}", response_model=Review)
-async def get_review(id: PydanticObjectId):
+async def get_review(id: PydanticObjectId, resolve: Optional[str] = ResolveQuery):
+    options = parse_resolve(resolve)
     review = await Review.get(id)
     if not review:
         raise HTTPException(status_code=404, detail="Review not found")
-    return review
+    return fast_response(await resolve_names(review, Review, options, CODE_FIELDS), Review)
 
 
 @router.put("/{id}", response_model=Review)
@@ -45,6 +74,7 @@ async def update_review(
     update_query = review_data.dict(exclude_unset=True)
     update_query.pop("created_by", None)
     await review.set(update_query)
+    await search.index_document("review", review)
     return review
 
 
@@ -58,4 +88,5 @@ async def delete_review(
         raise HTTPException(status_code=404, detail="Review not found")
     assert_owner_or_admin(review, current_user)
     await review.delete()
+    await search.remove_document("review", review.id)
     return {"message": "Deleted"}
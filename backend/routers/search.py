@@ -0,0 +1,37 @@
+from fastapi import APIRouter, HTTPException, Query
+from pydantic import BaseModel
+from typing import List, Optional
+
+from services import search as search_service
+
+router = APIRouter(prefix="/api/search", tags=["Search"])
+
+
+class SearchHit(BaseModel):
+    kind: str       # liquor / diary / bucket / knitting / culture / recipe / review / travel
+    id: str
+    title: str
+    snippet: str
+    score: float
+    path: str       # 프론트엔드 상세 화면 경로
+
+
+class SearchResponse(BaseModel):
+    q: str
+    hits: List[SearchHit]
+
+
+# 1. 통합 검색 (text 인덱스 한 번 조회, 점수순)
+@router.get("", response_model=SearchResponse)
+async def search(
+    q: str = Query(..., min_length=1),
+    kinds: Optional[str] = None,    # 쉼표 구분 (예: liquor,diary)
+    limit: int = Query(20, ge=1, le=100),
+):
+    kind_list = [k.strip() for k in kinds.split(",") if k.strip()] if kinds else None
+    unknown = [k for k in kind_list or [] if k not in search_service.SOURCES]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 검색 대상: {', '.join(unknown)}")
+
+    hits = await search_service.search(q.strip(), kind_list, limit)
+    return SearchResponse(q=q, hits=hits)
@@ -1,30 +1,56 @@
-from fastapi import APIRouter, HTTPException
-from typing import List
+from fastapi import APIRouter, HTTPException, Query, Response
+from typing import Dict, List, Optional
 from beanie import PydanticObjectId
 from models import CommonCode
+from services import code_registry
 
 router = APIRouter(
     prefix="/api/code",
     tags=["Common Code"]
 )
 
+CODE_VERSION_HEADER = "X-Code-Version"
+MAX_GROUPS = 30
+
 # 1. 전체 코드 목록 조회 (관리자용)
 @router.get("", response_model=List[CommonCode])
 async def get_all_codes():
-    return await CommonCode.find_all().sort(+CommonCode.group_code, +CommonCode.sort_order).to_list()
+    return await code_registry.all_codes()
 
 # 2. 특정 그룹의 코드만 조회 (일반 사용자용 - 드롭다운 등에 사용)
 @router.get("/group/{group_code}", response_model=List[CommonCode])
 async def get_codes_by_group(group_code: str):
-    return await CommonCode.find(
-        CommonCode.group_code == group_code,
-        CommonCode.use_yn == "Y"
-    ).sort(+CommonCode.sort_order).to_list()
+    return await code_registry.group(group_code)
+
+# 2-1. 여러 그룹 한 번에 조회 (예: ?g=SUL,WINE_C)
+@router.get("/groups", response_model=Dict[str, List[CommonCode]])
+async def get_code_groups(
+    response: Response,
+    g: str = Query(..., description="그룹 코드 (쉼표 구분)"),
+    v: Optional[str] = Query(None, description="코드 버전 (이전 응답의 X-Code-Version)"),
+):
+    """
+    여러 그룹의 사용 중인 코드를 그룹별로 반환 (없는 그룹은 빈 목록)
+    - 응답 헤더 X-Code-Version: 현재 코드 버전
+    - v 가 현재 버전과 같으면 오래 캐시해도 되는 응답 (버전이 바뀌면 URL 이 달라짐)
+    """
+    group_codes = list(dict.fromkeys(code.strip() for code in g.split(",") if code.strip()))
+    if not group_codes:
+        raise HTTPException(status_code=400, detail="그룹 코드를 하나 이상 지정하세요.")
+    if len(group_codes) > MAX_GROUPS:
+        raise HTTPException(status_code=400, detail=f"최대 {MAX_GROUPS}개 그룹까지 조회할 수 있습니다.")
+
+    result = await code_registry.groups(group_codes)
+    response.headers[CODE_VERSION_HEADER] = code_registry.version
+    if v == code_registry.version:
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    return result
 
 # 3. 코드 등록
 @router.post("", response_model=CommonCode)
 async def add_code(code: CommonCode):
     await code.insert()
+    await code_registry.reload()
     return code
 
 # 4. 코드 수정
@@ -33,9 +59,10 @@ async def update_code(id: PydanticObjectId, code_data: CommonCode):
     code = await CommonCode.get(id)
     if not code:
         raise HTTPException(status_code=404, detail="Code not found")
-    
+
     update_query = code_data.dict(exclude_unset=True)
     await code.set(update_query)
+    await code_registry.reload()
     return code
 
 # 5. 코드 삭제
@@ -44,8 +71,9 @@ async def delete_code(id: PydanticObjectId):
     code = await CommonCode.get(id)
     if not code:
         raise HTTPException(status_code=404, detail="Code not found")
-    
+
     await code.delete()
+    await code_registry.reload()
     return {"message": "Deleted"}
 
 @router.get("/{id}", response_model=CommonCode)
@@ -53,4 +81,4 @@ async def get_code(id: PydanticObjectId):
     code = await CommonCode.get(id)
     if not code:
         raise HTTPException(status_code=404, detail="Code not found")
-    return code
\ No newline at end of file
+    return code
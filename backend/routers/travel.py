@@ -1,9 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Response
+from typing import List, Optional
 from beanie import PydanticObjectId
 from models import Travel
 from models.user import User
 from auth.security import get_current_user, assert_owner_or_admin
+from services import search
+from services.pagination import paginate, LimitQuery, CursorQuery
+from services.projection import build_projection, FieldsQuery
+from services.serialization import fast_response
+from services.resolve import ResolveQuery, parse_resolve, resolve_names
 from datetime import datetime
 
 router = APIRouter(
@@ -11,19 +16,38 @@ router = APIRouter(
     tags=["Travel"]
 )
 
+# 목록 요약 프로젝션 (벤토 그리드용: 일정/설명 제외)
+LIST_SUMMARY = {
+    "title": 1, "destination": 1, "start_date": 1, "end_date": 1, "days": 1, "thumbnail": 1,
+    "title_color": 1, "status": 1, "is_featured": 1, "created_at": 1, "created_by": 1,
+}
+
+
 # 1. 여행 목록 조회 (벤토 그리드용)
-@router.get("/", response_model=List[Travel])
-async def get_all_travels():
+@router.get("/", response_model=List[Travel], response_model_exclude_unset=True)
+async def get_all_travels(
+    response: Response,
+    sort: Optional[str] = "recent",      # recent(등록순) / start_date(출발일순)
+    limit: Optional[int] = LimitQuery,
+    cursor: Optional[str] = CursorQuery,
+    fields: Optional[str] = FieldsQuery,
+    resolve: Optional[str] = ResolveQuery,
+):
     """모든 여행 목록을 최신순으로 조회"""
-    return await Travel.find_all().sort(-Travel.created_at).to_list()
+    sort_keys = ["-start_date", "-created_at"] if sort == "start_date" else ["-created_at"]
+    projection = build_projection(Travel, fields, LIST_SUMMARY)
+    items = await paginate(Travel, {}, sort_keys, limit, cursor, response, projection)
+    items = await resolve_names(items, Travel, parse_resolve(resolve))
+    return fast_response(items, Travel, response)
 
 # 2. 여행 상세 조회
 @router.get("/{id}", response_model=Travel)
-async def get_travel(id: PydanticObjectId):
+async def get_travel(id: PydanticObjectId, resolve: Optional[str] = ResolveQuery):
+    options = parse_resolve(resolve)
     travel = await Travel.get(id)
     if not travel:
         raise HTTPException(status_code=404, detail="Travel not found")
-    return travel
+    return fast_response(await resolve_names(travel, Travel, options), Travel)
 
 # 3. 여행 등록
 @router.post("/", response_model=Travel)
@@ -31,6 +55,7 @@ async def create_travel(travel: Travel, current_user: User = Depends(get_current
     """새 여행 등록"""
     travel.created_by = current_user.id
     await travel.insert()
+    await search.index_document("travel", travel)
     return travel
 
 # 4. 여행 수정
@@ -49,6 +74,7 @@ async def update_travel(
     update_query = travel_data.dict(exclude_unset=True)
     update_query.pop("created_by", None)
     await travel.set(update_query)
+    await search.index_document("travel", travel)
     return travel
 
 # 5. 여행 삭제
@@ -62,6 +88,7 @@ async def delete_travel(
         raise HTTPException(status_code=404, detail="Travel not found")
     assert_owner_or_admin(travel, current_user)
     await travel.delete()
+    await search.remove_document("travel", travel.id)
     return {"message": "Travel deleted successfully"}
 
 # 6. 일정에 장소 추가
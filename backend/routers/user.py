@@ -1,12 +1,14 @@
+import re
 from datetime import datetime
 from typing import List, Optional
 
 from beanie import PydanticObjectId
-from beanie.operators import RegEx
+from beanie.operators import Or, RegEx
 from fastapi import APIRouter, Depends, HTTPException
 
 from models.user import User, UserCreate, UserUpdate, PasswordReset
-from auth.security import get_current_admin, get_current_user, get_password_hash
+from auth.security import get_current_admin, get_current_user, get_password_hash_async, invalidate_user
+from services.resolve import forget_nickname
 
 
 router = APIRouter(
@@ -33,9 +35,11 @@ async def get_users(
     _user: User = Depends(get_current_user),  # 닉네임 매핑용 - 인증된 사용자 누구나 조회 가능
 ):
     expressions = []
+    # username/nickname 부분 일치 검색 (현재 사용자 수가 적어 추가 인덱싱 불필요)
     if q:
+        pattern = re.escape(q)
         expressions.append(
-            RegEx(User.username, q, "i")
+            Or(RegEx(User.username, pattern, "i"), RegEx(User.nickname, pattern, "i"))
         )
     if role and role != "all":
         expressions.append(User.role == role)
@@ -45,12 +49,6 @@ async def get_users(
     else:
         users = await User.find_all().to_list()
 
-    # nickname 검색은 클라이언트단에서 가능하지만, 간단히 username 검색만 서버에서.
-    # (현재 사용자 수가 적어 추가 인덱싱 불필요)
-    if q:
-        ql = q.lower()
-        users = [u for u in users if ql in u.username.lower() or ql in (getattr(u, "nickname", "") or "").lower()]
-
     return [to_view(u) for u in users]
 
 
@@ -72,7 +70,7 @@ async def create_user(
 
     user = User(
         username=payload.username,
-        password_hash=get_password_hash(payload.password),
+        password_hash=await get_password_hash_async(payload.password),
         nickname=payload.nickname or "",
         role=payload.role,
         is_active=True,
@@ -123,6 +121,8 @@ async def update_user(
 
     if update_data:
         await user.set(update_data)
+        invalidate_user(user.username)  # 권한/활성 상태 변경 즉시 반영
+        forget_nickname(user.id)
     return to_view(user)
 
 
@@ -137,7 +137,8 @@ async def reset_password(
     user = await User.get(id)
     if not user:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
-    await user.set({"password_hash": get_password_hash(payload.new_password)})
+    await user.set({"password_hash": await get_password_hash_async(payload.new_password)})
+    invalidate_user(user.username)
     return {"message": "비밀번호가 재설정되었습니다."}
 
 
@@ -152,4 +153,6 @@ async def delete_user(
     if not user:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
     await user.delete()
+    invalidate_user(user.username)
+    forget_nickname(user.id)
     return {"message": "삭제되었습니다."}
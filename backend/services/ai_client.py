@@ -0,0 +1,245 @@
+"""
+공유 AI 클라이언트 (Gemini / 로컬 스텁).
+
+- 서버 시작 시 init_client() 로 한 번만 생성 (genai.configure / GenerativeModel 재사용)
+- 호출마다 AI_CALL_TIMEOUT_SECONDS 데드라인
+- 연속 AI_BREAKER_FAILURES 회 실패하면 AI_BREAKER_RESET_SECONDS 동안 호출하지 않고 즉시 실패 (서킷 브레이커)
+  시간이 지나면 한 건만 시험 호출해 성공하면 다시 닫힘
+- 지연 시간 / 토큰 / 오류 카운터 (metrics())
+- AI_PROVIDER=stub 이면 모델 대신 프롬프트에서 결정적인 응답을 만드는 스텁 사용 (오프라인 부하 테스트용)
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+MODEL_NAME = "gemini-2.5-flash"
+CALL_TIMEOUT_SECONDS = float(os.getenv("AI_CALL_TIMEOUT_SECONDS", "45"))
+BREAKER_FAILURES = int(os.getenv("AI_BREAKER_FAILURES", "5"))
+BREAKER_RESET_SECONDS = float(os.getenv("AI_BREAKER_RESET_SECONDS", "60"))
+STUB_LATENCY_MS = float(os.getenv("AI_STUB_LATENCY_MS", "50"))
+LATENCY_WINDOW = 200  # 백분위 계산에 쓰는 최근 호출 수
+
+# 안전 필터 해제
+SAFETY_SETTINGS = [
+    {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
+    {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_NONE"},
+    {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_NONE"},
+    {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_NONE"},
+]
+
+
+class AIUnavailableError(Exception):
+    """API 키가 없어 분석을 시작할 수 없음 (재시도 대상 아님)"""
+
+
+class AICircuitOpenError(Exception):
+    """모델이 연속 실패 중이라 호출하지 않음 (재시도 대상 아님)"""
+
+
+class AITimeoutError(Exception):
+    """호출 데드라인 초과"""
+
+
+@dataclass
+class AIResult:
+    text: str
+    prompt_tokens: int = 0
+    output_tokens: int = 0
+
+
+class GeminiProvider:
+    name = "gemini"
+
+    def __init__(self, api_key: str):
+        import google.generativeai as genai
+
+        genai.configure(api_key=api_key)
+        self.model = genai.GenerativeModel(MODEL_NAME, safety_settings=SAFETY_SETTINGS)
+
+    async def generate(self, prompt: str) -> AIResult:
+        response = await self.model.generate_content_async(prompt)
+        usage = getattr(response, "usage_metadata", None)
+        return AIResult(
+            text=response.text,
+            prompt_tokens=getattr(usage, "prompt_token_count", 0) or 0,
+            output_tokens=getattr(usage, "candidates_token_count", 0) or 0,
+        )
+
+
+class StubProvider:
+    """프롬프트의 술 이름으로 항상 같은 응답을 만드는 로컬 스텁 (네트워크 호출 없음)"""
+    name = "stub"
+
+    TASTES = ["단맛이 도드라짐", "드라이하고 깔끔함", "묵직한 바디감", "산미가 산뜻함"]
+    AROMAS = ["과일 향", "오크와 바닐라 향", "꽃 향", "곡물 향"]
+    PAIRINGS = ["치즈", "회", "구운 고기", "과일 디저트"]
+
+    def __init__(self, latency_ms: float = STUB_LATENCY_MS):
+        self.latency_ms = latency_ms
+
+    def _item(self, name: str) -> dict:
+        seed = int(hashlib.sha256(name.encode("utf-8")).hexdigest(), 16)
+        return {
+            "name": name,
+            "description": f"{name}에 대한 스텁 분석 결과입니다.",
+            "taste": self.TASTES[seed % len(self.TASTES)],
+            "aroma": self.AROMAS[(seed >> 8) % len(self.AROMAS)],
+            "variety": "정보 없음",
+            "pairing": self.PAIRINGS[(seed >> 16) % len(self.PAIRINGS)],
+        }
+
+    async def generate(self, prompt: str) -> AIResult:
+        if self.latency_ms:
+            await asyncio.sleep(self.latency_ms / 1000)
+        single = re.search(r"술 이름: (.+)", prompt)
+        if single:
+            payload = self._item(single.group(1).strip())
+        else:
+            payload = [self._item(name.strip()) for name in re.findall(r"^\s*\d+\. (.+)$", prompt, re.MULTILINE)]
+        text = json.dumps(payload, ensure_ascii=False)
+        # 토큰 수는 대략 글자 수 / 4 로 흉내
+        return AIResult(text=text, prompt_tokens=len(prompt) // 4, output_tokens=len(text) // 4)
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = BREAKER_FAILURES, reset_seconds: float = BREAKER_RESET_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_running = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "CLOSED"
+        if time.monotonic() - self.opened_at >= self.reset_seconds:
+            return "HALF_OPEN"
+        return "OPEN"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "CLOSED":
+            return True
+        if state == "HALF_OPEN" and not self.trial_running:
+            self.trial_running = True  # 시험 호출은 한 건만
+            return True
+        return False
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self.trial_running = False
+
+    def record_failure(self):
+        self.failures += 1
+        if self.trial_running or self.failures >= self.failure_threshold:
+            print(f"🚨 AI 서킷 브레이커 열림 ({self.failures}회 연속 실패, {self.reset_seconds:.0f}초간 호출 중단)")
+            self.opened_at = time.monotonic()
+        self.trial_running = False
+
+
+class AIClient:
+    def __init__(self, provider, timeout: float = CALL_TIMEOUT_SECONDS, breaker: Optional[CircuitBreaker] = None):
+        self.provider = provider
+        self.timeout = timeout
+        self.breaker = breaker or CircuitBreaker()
+        self.counters = {
+            "calls": 0, "successes": 0, "errors": 0, "timeouts": 0, "rejected": 0,
+            "prompt_tokens": 0, "output_tokens": 0,
+        }
+        self.latency_total_ms = 0.0
+        self.latency_max_ms = 0.0
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+
+    async def generate(self, prompt: str, timeout: Optional[float] = None) -> str:
+        """프롬프트 호출 후 응답 텍스트 반환. 데드라인 초과/브레이커 열림 시 예외"""
+        if not self.breaker.allow():
+            self.counters["rejected"] += 1
+            raise AICircuitOpenError("AI 모델 응답 장애로 잠시 호출을 중단했습니다.")
+
+        self.counters["calls"] += 1
+        started = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(self.provider.generate(prompt), timeout or self.timeout)
+        except asyncio.TimeoutError:
+            self.counters["timeouts"] += 1
+            self.breaker.record_failure()
+            raise AITimeoutError(f"AI 호출이 {timeout or self.timeout:.0f}초 안에 끝나지 않았습니다.")
+        except asyncio.CancelledError:
+            self.breaker.trial_running = False
+            raise
+        except Exception:
+            self.counters["errors"] += 1
+            self.breaker.record_failure()
+            raise
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.counters["successes"] += 1
+        self.counters["prompt_tokens"] += result.prompt_tokens
+        self.counters["output_tokens"] += result.output_tokens
+        self.latency_total_ms += elapsed_ms
+        self.latency_max_ms = max(self.latency_max_ms, elapsed_ms)
+        self.latencies.append(elapsed_ms)
+        self.breaker.record_success()
+        return result.text
+
+    def metrics(self) -> dict:
+        recent = sorted(self.latencies)
+
+        def percentile(p: float) -> Optional[float]:
+            if not recent:
+                return None
+            return round(recent[min(len(recent) - 1, int(len(recent) * p))], 1)
+
+        successes = self.counters["successes"]
+        return {
+            "provider": self.provider.name,
+            "model": MODEL_NAME if self.provider.name == "gemini" else None,
+            "breaker": self.breaker.state,
+            "consecutive_failures": self.breaker.failures,
+            **self.counters,
+            "latency_ms": {
+                "avg": round(self.latency_total_ms / successes, 1) if successes else None,
+                "p50": percentile(0.5),
+                "p95": percentile(0.95),
+                "max": round(self.latency_max_ms, 1),
+            },
+        }
+
+
+_client: Optional[AIClient] = None
+
+
+def init_client() -> Optional[AIClient]:
+    """서버 시작 시 한 번 호출. AI_PROVIDER=stub 이 아니고 키도 없으면 None"""
+    global _client
+    if os.getenv("AI_PROVIDER", "gemini").lower() == "stub":
+        _client = AIClient(StubProvider())
+        print("🧪 AI 스텁 프로바이더 사용 (AI_PROVIDER=stub)")
+    elif os.getenv("GEMINI_API_KEY"):
+        _client = AIClient(GeminiProvider(os.getenv("GEMINI_API_KEY")))
+    else:
+        _client = None
+    return _client
+
+
+def get_client() -> AIClient:
+    if _client is None:
+        raise AIUnavailableError("GEMINI_API_KEY가 설정되지 않았습니다.")
+    return _client
+
+
+def is_available() -> bool:
+    return _client is not None
+
+
+def metrics() -> dict:
+    return _client.metrics() if _client else {"provider": None}
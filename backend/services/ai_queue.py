@@ -0,0 +1,173 @@
+"""
+AI 분석 작업 큐 (MongoDB ai_jobs 컬렉션 + 고정 크기 asyncio 워커 풀).
+
+- enqueue: 작업을 DB에 기록하고 워커를 깨움 (요청 처리와 분리)
+- 워커 AI_WORKERS 개가 find_one_and_update 로 작업을 가져가 처리 (동시 호출 수 제한)
+- 대기 작업이 여러 개면 최대 AI_BATCH_SIZE 개를 한 번의 배치 프롬프트로 분석하고,
+  결과가 파싱되지 않은 항목만 개별 호출로 처리
+- 실패 시 지수 백오프로 재시도, AI_JOB_MAX_ATTEMPTS 회 실패하면 FAILED
+- 작업 1회 실행은 AI_JOB_TIMEOUT_SECONDS 안에 끝나야 함 (모델 호출 자체는 ai_client 데드라인)
+- 서킷 브레이커가 열려 있으면(모델 장애) 재시도하지 않고 바로 FAILED (/api/liquor/ai/retry-failed 로 재등록)
+- 서버 시작 시 RUNNING 으로 남은 작업과, 작업 없이 PENDING 인 주류를 다시 큐에 넣음
+"""
+
+import asyncio
+import os
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from beanie import PydanticObjectId
+from beanie.operators import Set
+from pymongo import ReturnDocument
+
+from models.ai_job import AIJob
+from models.liquor import LiquorReview
+from services import liquor_ai, ai_client
+
+WORKER_COUNT = int(os.getenv("AI_WORKERS", "2"))
+MAX_ATTEMPTS = int(os.getenv("AI_JOB_MAX_ATTEMPTS", "5"))
+JOB_TIMEOUT_SECONDS = float(os.getenv("AI_JOB_TIMEOUT_SECONDS", "60"))
+BACKOFF_BASE_SECONDS = 10
+BACKOFF_MAX_SECONDS = 60 * 30
+POLL_SECONDS = 5
+
+_wakeup = asyncio.Event()
+_workers: List[asyncio.Task] = []
+
+
+async def enqueue(liquor_id: PydanticObjectId, liquor_name: str):
+    """분석 작업 등록 (같은 주류의 대기 중인 작업은 새 이름으로 교체)"""
+    await AIJob.find(AIJob.liquor_id == liquor_id, AIJob.status == "PENDING").delete()
+    await AIJob(liquor_id=liquor_id, liquor_name=liquor_name).insert()
+    _wakeup.set()
+
+
+async def _claim() -> Optional[AIJob]:
+    """실행할 작업 하나를 원자적으로 RUNNING 으로 바꾸며 가져옴"""
+    now = datetime.now()
+    raw = await AIJob.get_pymongo_collection().find_one_and_update(
+        {"status": "PENDING", "next_run_at": {"$lte": now}},
+        {"$set": {"status": "RUNNING", "updated_at": now}},
+        sort=[("next_run_at", 1)],
+        return_document=ReturnDocument.AFTER,
+    )
+    return AIJob.model_validate(raw) if raw else None
+
+
+def backoff_seconds(attempts: int) -> float:
+    return min(BACKOFF_BASE_SECONDS * (2 ** (attempts - 1)), BACKOFF_MAX_SECONDS)
+
+
+async def _run(job: AIJob):
+    try:
+        note = await asyncio.wait_for(liquor_ai.analyze_liquor(job.liquor_name), JOB_TIMEOUT_SECONDS)
+        await liquor_ai.apply_note(job.liquor_id, job.liquor_name, note)
+        await job.delete()
+    except Exception as e:
+        attempts = job.attempts + 1
+        error = f"{type(e).__name__}: {e}"
+        final = isinstance(e, (ai_client.AIUnavailableError, ai_client.AICircuitOpenError))
+        if attempts >= MAX_ATTEMPTS or final:
+            print(f"❌ AI 분석 최종 실패 ({job.liquor_name}): {error}")
+            await job.update(Set({AIJob.status: "FAILED", AIJob.attempts: attempts,
+                                  AIJob.last_error: error, AIJob.updated_at: datetime.now()}))
+            await liquor_ai.mark_failed(job.liquor_id, job.liquor_name)
+        else:
+            delay = backoff_seconds(attempts)
+            print(f"⚠️ AI 분석 실패 ({job.liquor_name}), {delay:.0f}초 후 재시도 [{attempts}/{MAX_ATTEMPTS}]: {error}")
+            await job.update(Set({AIJob.status: "PENDING", AIJob.attempts: attempts, AIJob.last_error: error,
+                                  AIJob.next_run_at: datetime.now() + timedelta(seconds=delay),
+                                  AIJob.updated_at: datetime.now()}))
+
+
+async def _claim_batch() -> List[AIJob]:
+    jobs = []
+    while len(jobs) < liquor_ai.BATCH_SIZE:
+        job = await _claim()
+        if not job:
+            break
+        jobs.append(job)
+    return jobs
+
+
+async def _run_batch(jobs: List[AIJob]):
+    if len(jobs) == 1:
+        await _run(jobs[0])
+        return
+
+    try:
+        notes = await asyncio.wait_for(
+            liquor_ai.analyze_liquors([job.liquor_name for job in jobs]), JOB_TIMEOUT_SECONDS
+        )
+    except Exception as e:
+        print(f"⚠️ AI 배치 분석 실패 ({len(jobs)}건), 개별 분석으로 전환: {type(e).__name__}: {e}")
+        notes = {}
+
+    for job in jobs:
+        note = notes.get(job.liquor_name)
+        if note:
+            await liquor_ai.apply_note(job.liquor_id, job.liquor_name, note)
+            await job.delete()
+        else:
+            await _run(job)  # 개별 호출 (재시도 규칙 동일)
+
+
+async def _worker():
+    while True:
+        try:
+            jobs = await _claim_batch()
+        except Exception as e:
+            print(f"❌ AI 작업 조회 실패: {e}")
+            jobs = []
+        if jobs:
+            await _run_batch(jobs)
+            continue
+        # 할 일이 없으면 새 작업 등록 또는 재시도 시각까지 대기
+        try:
+            await asyncio.wait_for(_wakeup.wait(), POLL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+        _wakeup.clear()
+
+
+async def recover():
+    """중단된 작업 복구: RUNNING → PENDING, 작업 없이 PENDING 으로 남은 주류는 새로 등록"""
+    await AIJob.find(AIJob.status == "RUNNING").update(Set({AIJob.status: "PENDING"}))
+
+    queued = {job.liquor_id for job in await AIJob.find(AIJob.status == "PENDING").to_list()}
+    stuck = await LiquorReview.find({"ai_note.status": "PENDING"}).to_list()
+    recovered = 0
+    for liquor in stuck:
+        if liquor.id not in queued:
+            await AIJob(liquor_id=liquor.id, liquor_name=liquor.name).insert()
+            recovered += 1
+    if recovered:
+        print(f"🔄 AI 분석 대기 주류 {recovered}건을 작업 큐에 다시 등록했습니다.")
+
+
+async def retry_failed() -> int:
+    """FAILED 로 끝난 주류를 다시 PENDING 으로 돌려 큐에 등록 (배치로 처리됨)"""
+    failed = await LiquorReview.find({"ai_note.status": "FAILED"}).to_list()
+    for liquor in failed:
+        await liquor.set({"ai_note.status": "PENDING"})
+        await AIJob.find(AIJob.liquor_id == liquor.id).delete()
+        await AIJob(liquor_id=liquor.id, liquor_name=liquor.name).insert()
+    if failed:
+        _wakeup.set()
+    return len(failed)
+
+
+async def start():
+    """서버 시작 시 호출: 복구 후 워커 풀 시작 (API 키가 없으면 작업만 쌓아둠)"""
+    await recover()
+    if not liquor_ai.is_available():
+        return
+    for _ in range(WORKER_COUNT):
+        _workers.append(asyncio.create_task(_worker()))
+
+
+async def stop():
+    for task in _workers:
+        task.cancel()
+    await asyncio.gather(*_workers, return_exceptions=True)
+    _workers.clear()
@@ -0,0 +1,61 @@
+"""
+공통 코드 메모리 레지스트리.
+
+common_codes 는 작고 거의 바뀌지 않으므로 서버 시작 시 전부 읽어 두고,
+코드 조회 API 와 코드 이름 변환은 DB 대신 여기서 처리한다.
+
+- 코드 등록/수정/삭제 후 reload() 로 다시 읽음
+- names(): 코드값 → 코드명 (사용 안 함(N) 코드 포함, 예전 기록의 이름 표시용)
+- version: 전체 코드 내용의 해시 (내용이 같으면 재시작해도 같은 값) → /api/code/groups 캐시 키
+"""
+
+import hashlib
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from models.system.common_code import CommonCode
+
+_codes: List[CommonCode] = []
+_by_group: Dict[str, List[CommonCode]] = {}   # 사용 중(use_yn=Y)인 코드만, sort_order 순
+_names: Dict[str, Dict[str, str]] = {}         # 그룹 → {코드값: 코드명}
+version: Optional[str] = None
+
+
+async def reload():
+    global _codes, _by_group, _names, version
+    codes = await CommonCode.find_all().sort(+CommonCode.group_code, +CommonCode.sort_order).to_list()
+    by_group = defaultdict(list)
+    names = defaultdict(dict)
+    for code in codes:
+        if code.use_yn == "Y":
+            by_group[code.group_code].append(code)
+        names[code.group_code][code.code_id] = code.code_name
+    digest = hashlib.md5()
+    for code in codes:
+        digest.update(code.model_dump_json().encode("utf-8"))
+    _codes, _by_group, _names, version = codes, dict(by_group), dict(names), digest.hexdigest()[:12]
+
+
+async def ensure_loaded():
+    if version is None:
+        await reload()
+
+
+async def all_codes() -> List[CommonCode]:
+    await ensure_loaded()
+    return _codes
+
+
+async def group(group_code: str) -> List[CommonCode]:
+    await ensure_loaded()
+    return _by_group.get(group_code, [])
+
+
+async def groups(group_codes: List[str]) -> Dict[str, List[CommonCode]]:
+    await ensure_loaded()
+    return {g: _by_group.get(g, []) for g in group_codes}
+
+
+async def names(group_code: str) -> Dict[str, str]:
+    await ensure_loaded()
+    return _names.get(group_code, {})
@@ -0,0 +1,141 @@
+"""
+조건부 GET (ETag / If-None-Match).
+
+컬렉션마다 쓰기 때 올라가는 버전 번호를 메모리에 두고, GET 응답의 ETag 를
+(프로세스 시작 토큰, 경로+쿼리, 그 API 가 읽는 컬렉션들의 버전) 으로 만든다.
+If-None-Match 가 현재 ETag 와 같으면 엔드포인트를 호출하지 않고 바로 304 (조회 쿼리, 직렬화 모두 생략).
+
+- 버전 증가: Beanie 문서 이벤트 (insert/save/replace/update/delete, init_db 에서 register)
+  쿼리 단위 쓰기 (find().delete(), insert_many, upsert 등) 는 bump() 를 직접 호출
+- 버전은 요청 처리 전에 읽으므로, 처리 중 쓰기가 끼어들어도 새 데이터에 옛 ETag 가 붙을 뿐 (다음 요청에서 200)
+- 단일 프로세스 기준 (메모리 색인/분석 큐와 같음). 재시작하면 시작 토큰이 바뀌어 모든 ETag 가 무효
+"""
+
+import hashlib
+import secrets
+from typing import Dict, List, Optional
+
+from beanie.odm.actions import ActionDirections, ActionRegistry, EventTypes
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import Response
+
+from models.bucket import BucketList
+from models.calendar import CalendarEvent, CalendarOccurrence
+from models.cooking import Recipe
+from models.culture import CultureReview
+from models.diary import Diary
+from models.family import FamilyMember
+from models.knitting import KnittingRecord
+from models.liquor import LiquorReview
+from models.review import Review
+from models.search import SearchEntry
+from models.system.common_code import CommonCode
+from models.travel import Travel
+from models.user import User
+
+# API 경로 접두사 → 응답이 읽는 컬렉션 (없는 경로는 조건부 GET 대상 아님: 인증/사용자, 대시보드 등)
+ROUTE_MODELS: Dict[str, List[type]] = {
+    "/api/liquor": [LiquorReview],
+    "/api/culture": [CultureReview],
+    "/api/diary": [Diary],
+    "/api/bucket": [BucketList],
+    "/api/knitting": [KnittingRecord],
+    "/api/cooking": [Recipe],
+    "/api/review": [Review],
+    "/api/travel": [Travel],
+    "/api/family": [FamilyMember],
+    "/api/code": [CommonCode],
+    "/api/calendar": [CalendarEvent, CalendarOccurrence],
+    "/api/search": [SearchEntry],
+}
+
+# resolve= 로 이름을 붙이는 응답이 추가로 읽는 컬렉션 (코드명/닉네임이 바뀌면 ETag 도 바뀌어야 함)
+RESOLVE_MODELS: List[type] = [CommonCode, User]
+
+# 컬렉션 버전과 무관하게 바뀌는 응답 (실시간 지표, 스트림)
+EXCLUDED_SUFFIXES = ("/ai-cache/stats", "/ai/metrics", "/ai-status/stream")
+
+WRITE_EVENTS = [
+    EventTypes.INSERT, EventTypes.REPLACE, EventTypes.SAVE,
+    EventTypes.SAVE_CHANGES, EventTypes.UPDATE, EventTypes.DELETE,
+]
+
+_epoch = secrets.token_hex(4)
+_versions: Dict[type, int] = {}
+
+
+def bump(*models: type):
+    """컬렉션 버전 증가 (이 컬렉션을 읽는 응답의 ETag 무효화)"""
+    for model in models:
+        _versions[model] = _versions.get(model, 0) + 1
+
+
+def version(model: type) -> int:
+    """현재 컬렉션 버전 (쓰기마다 증가, 메모리 캐시 무효화 기준으로도 사용)"""
+    return _versions.get(model, 0)
+
+
+def _on_write(doc):
+    bump(type(doc))
+
+
+def register(models: List[type]):
+    """init_beanie 다음에 호출 (init_beanie 가 모델별 이벤트 액션을 새로 만들기 때문)"""
+    for model in models:
+        ActionRegistry.add_action(model, WRITE_EVENTS, ActionDirections.AFTER, _on_write)
+
+
+def models_for(path: str, query: str = "") -> Optional[List[type]]:
+    if path.endswith(EXCLUDED_SUFFIXES):
+        return None
+    prefix = "/".join(path.split("/")[:3])  # /api/liquor/123 → /api/liquor
+    models = ROUTE_MODELS.get(prefix)
+    if models is not None and "resolve=" in query:
+        models = models + RESOLVE_MODELS
+    return models
+
+
+def make_etag(path: str, query: str, models: List[type]) -> str:
+    versions = ",".join(str(_versions.get(model, 0)) for model in models)
+    return '"{}"'.format(hashlib.md5(f"{_epoch}|{path}?{query}|{versions}".encode()).hexdigest())
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    return etag in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+
+
+class ConditionalGetMiddleware:
+    """목록/상세 GET 에 ETag 를 붙이고, 변경이 없으면 엔드포인트 호출 없이 304"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+        query = scope.get("query_string", b"").decode("latin-1")
+        models = models_for(scope["path"], query)
+        if models is None:
+            await self.app(scope, receive, send)
+            return
+
+        etag = make_etag(scope["path"], query, models)
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        if if_none_match and etag_matches(if_none_match, etag):
+            await Response(status_code=304, headers=headers)(scope, receive, send)
+            return
+
+        async def send_with_etag(message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                response_headers = MutableHeaders(scope=message)
+                # JSON 응답만 (자체 ETag 가 있는 ICS 피드, 스트림 등은 그대로)
+                if "etag" not in response_headers and \
+                        response_headers.get("content-type", "").startswith("application/json"):
+                    response_headers["ETag"] = etag
+                    # 엔드포인트가 정한 캐시 정책(예: 버전 지정 공통 코드)은 유지
+                    response_headers.setdefault("Cache-Control", "no-cache")
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
@@ -0,0 +1,146 @@
+"""
+가족 구성원 등록/삭제의 연쇄 처리 (일괄 쿼리 + 트랜잭션).
+
+멤버마다 get/set/delete 를 따로 보내지 않고, 연결 정리를 컬렉션 단위 update_many/delete_many 로 처리한다.
+DB 명령 수가 가족 수와 무관하게 고정되고, 트랜잭션(services.transaction)으로 묶여 중간에 실패해도
+반쯤 삭제된 상태가 남지 않는다.
+
+- 등록: insert + 배우자 역연결 (상대의 spouse_id 가 비어 있을 때만) → 명령 2개
+- 삭제: 대상 삭제 + 대상을 가리키는 parent_id / spouse_id 해제 → 명령 3개
+  본인 세대(generation 0) 삭제는 그 side 전체가 대상 (_id 목록 조회 1개 추가)
+- 일괄 쿼리는 문서 이벤트가 없으므로 끝난 뒤 etag.bump(FamilyMember) (조건부 GET, 트리 캐시 무효화)
+
+python -m services.family_cascade : 가족 규모별 연쇄 처리 DB 명령 수 점검 (MONGODB_URL 필요, 임시 DB 사용 후 삭제)
+"""
+
+import sys
+from typing import Dict, List
+
+from bson import ObjectId
+
+from models.family import FamilyMember
+from services import etag
+from services.transaction import run_transaction
+
+EMPTY = [None, ""]
+
+
+def _collection():
+    return FamilyMember.get_pymongo_collection()
+
+
+async def add_member(member: FamilyMember):
+    """등록 + 배우자 역연결 (상대에게 이미 배우자가 있으면 그대로 둠)"""
+    async def operations(session):
+        await member.insert(session=session)
+        if member.spouse_id and ObjectId.is_valid(member.spouse_id):
+            await _collection().update_one(
+                {"_id": ObjectId(member.spouse_id), "spouse_id": {"$in": EMPTY}},
+                {"$set": {"spouse_id": str(member.id)}},
+                session=session,
+            )
+
+    await run_transaction(_collection().database.client, operations)
+    etag.bump(FamilyMember)
+
+
+async def delete_member(member: FamilyMember) -> int:
+    """삭제 + 연결 해제. 삭제한 멤버 수를 반환"""
+    async def operations(session):
+        collection = _collection()
+        if member.generation == 0:
+            # 본인 세대 삭제: 해당 side 가족 전체
+            target = {"side": member.side}
+            ids = [str(_id) for _id in await collection.distinct("_id", target, session=session)]
+        else:
+            target = {"_id": member.id}
+            ids = [str(member.id)]
+        result = await collection.delete_many(target, session=session)
+        # 남은 멤버 중 삭제된 멤버를 부모/배우자로 가리키던 연결 해제 (다른 side 포함)
+        await collection.update_many({"parent_id": {"$in": ids}}, {"$set": {"parent_id": None}}, session=session)
+        await collection.update_many({"spouse_id": {"$in": ids}}, {"$set": {"spouse_id": None}}, session=session)
+        return result.deleted_count
+
+    deleted = await run_transaction(_collection().database.client, operations)
+    etag.bump(FamilyMember)
+    return deleted
+
+
+async def _seed(size: int) -> Dict[str, FamilyMember]:
+    """본인 + 부모 + 형제/자녀 size 명 + 외가 배우자로 된 가족"""
+    def person(name: str, side: str = "husband", generation: int = 0, **links) -> FamilyMember:
+        return FamilyMember(name=name, gender="male", side=side, relation_type=name, generation=generation, **links)
+
+    me = person("본인")
+    await add_member(me)
+    father = person("부", generation=1)
+    await add_member(father)
+    await _collection().update_one({"_id": me.id}, {"$set": {"parent_id": str(father.id)}})
+    for i in range(size):
+        await add_member(person(f"형제{i}", sibling_of=str(me.id)))
+        await add_member(person(f"자녀{i}", generation=-1, parent_id=str(me.id)))
+    spouse = person("배우자", side="wife", spouse_id=str(me.id))
+    await add_member(spouse)
+    return {"me": me, "father": father, "spouse": spouse}
+
+
+async def _main() -> int:
+    import os
+
+    from beanie import init_beanie
+    from motor.motor_asyncio import AsyncIOMotorClient
+    from pymongo import monitoring
+
+    class CommandCounter(monitoring.CommandListener):
+        IGNORED = {"hello", "isMaster", "ismaster", "ping", "endSessions"}
+
+        def __init__(self):
+            self.commands: List[str] = []
+
+        def started(self, event):
+            if event.command_name not in self.IGNORED:
+                self.commands.append(event.command_name)
+
+        def succeeded(self, event):
+            pass
+
+        def failed(self, event):
+            pass
+
+    counter = CommandCounter()
+    client = AsyncIOMotorClient(os.getenv("MONGODB_URL", "mongodb://localhost:27017"), event_listeners=[counter])
+    db_name = f"{os.getenv('DB_NAME', 'sweethome')}_cascade_check"
+    await init_beanie(database=client[db_name], document_models=[FamilyMember])
+
+    async def count(label: str, size: int, action) -> int:
+        counter.commands.clear()
+        await action()
+        print(f"  {label} (가족 {size}명 규모): {len(counter.commands)}개 {counter.commands}")
+        return len(counter.commands)
+
+    results: Dict[str, set] = {}
+    try:
+        for size in (5, 50):
+            await client.drop_database(db_name)
+            family = await _seed(size)
+            newcomer = FamilyMember(name="새 배우자", gender="female", side="wife", relation_type="처",
+                                    generation=1, spouse_id=str(family["father"].id))
+            cascades = [
+                ("등록 (배우자 연결)", lambda: add_member(newcomer)),
+                ("부모 삭제 (자녀/배우자 연결 해제)", lambda: delete_member(family["father"])),
+                ("본인 세대 삭제 (side 전체)", lambda: delete_member(family["me"])),
+            ]
+            for label, action in cascades:
+                results.setdefault(label, set()).add(await count(label, size, action))
+    finally:
+        await client.drop_database(db_name)
+
+    fixed = all(len(values) == 1 for values in results.values())
+    print("✅ 가족 규모와 무관하게 명령 수 고정" if fixed else "❌ 가족 규모에 따라 명령 수가 늘어남")
+    return 0 if fixed else 1
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    sys.exit(asyncio.run(_main()))
@@ -0,0 +1,190 @@
+"""
+가족 트리 (서버에서 조립).
+
+parent_id / sibling_of / spouse_id 연결로 side 별 중첩 트리를 만든다.
+
+- 연결 색인(부모 → 자녀, 배우자)을 한 번에 만들고 루트부터 한 번씩만 방문 (구성원 수에 비례)
+- sibling_of 만 있는 형제는 기준 멤버와 같은 부모 아래 (기준 멤버도 부모가 없으면 기준 멤버 옆 루트)
+- 배우자 연결은 한쪽에만 spouse_id 가 있어도 양방향으로 봄
+- 부모가 없는 배우자(혼인으로 들어온 사람)는 별도 루트가 아니라 상대 노드의 spouse 로, 두 사람의 자녀는 한 노드 아래로
+- 세대는 저장된 generation 대신 트리 깊이로 계산: 본인(relation_type=본인) 0, 위로 +1, 아래로 -1
+  본인이 없는 갈래는 루트의 저장된 generation 을 기준으로
+- 다른 side 에 있는 부모/배우자는 연결하지 않음 (spouse 는 null, 원본 spouse_id 는 그대로)
+- 부모 연결이 순환하는 잘못된 데이터는 방문하지 못한 멤버를 루트로 꺼내 끊음
+
+결과(JSON)는 FamilyMember 컬렉션 버전(services.etag)이 바뀔 때까지 side 별로 메모리에 보관.
+"""
+
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from models.family import FamilyMember
+from services import etag
+from services.serialization import adapter_for, dumps
+
+SELF_RELATION = "본인"
+CACHE_MAX_KEYS = 8  # side 값 종류 (쿼리로 임의 값이 와도 캐시가 커지지 않게)
+
+_cache: Dict[Optional[str], Tuple[int, bytes]] = {}  # side → (컬렉션 버전, 응답 JSON)
+
+
+def _birth_key(row: dict):
+    return (row.get("birth_date") is None, row.get("birth_date") or "", row["_id"])
+
+
+def _effective_parents(rows: Dict[str, dict]) -> Dict[str, Optional[str]]:
+    """멤버별 부모 ID (같은 트리 안의 부모만, sibling_of 는 기준 멤버의 부모를 따름)"""
+    parents: Dict[str, Optional[str]] = {}
+    for member_id in rows:
+        chain: List[str] = []  # sibling_of 로 이어진, 아직 부모를 모르는 멤버들
+        current = member_id
+        parent: Optional[str] = None
+        while True:
+            if current in parents:
+                parent = parents[current]
+                break
+            if current in chain:  # sibling_of 순환
+                break
+            chain.append(current)
+            row = rows[current]
+            if row.get("parent_id") in rows and row["parent_id"] != current:
+                parent = row["parent_id"]
+                break
+            if row.get("sibling_of") not in rows:
+                break
+            current = row["sibling_of"]
+        for linked_id in chain:
+            parents[linked_id] = parent
+    return parents
+
+
+def build_side(rows: List[dict]) -> dict:
+    """같은 side 의 멤버 dict 목록 → {"roots": [노드], "generations": {세대: [ID]}}"""
+    by_id = {row["_id"]: row for row in rows}
+    parents = _effective_parents(by_id)
+
+    children: Dict[str, List[str]] = defaultdict(list)
+    for row in sorted(rows, key=_birth_key):
+        parent = parents[row["_id"]]
+        if parent is not None:
+            children[parent].append(row["_id"])
+
+    # 배우자 연결은 양방향으로 (한쪽에만 spouse_id 가 있는 예전 데이터 포함, 자기 연결이 우선)
+    spouses: Dict[str, str] = {}
+    for row in rows:
+        spouse_id = row.get("spouse_id")
+        if spouse_id in by_id and spouse_id != row["_id"]:
+            spouses[row["_id"]] = spouse_id
+    for row in rows:
+        if row["_id"] in spouses:
+            spouses.setdefault(spouses[row["_id"]], row["_id"])
+
+    def spouse_of(member_id: str) -> Optional[str]:
+        return spouses.get(member_id)
+
+    # 부모 없는 배우자는 상대 노드에 붙임 (둘 다 부모가 없으면 자녀가 더 많은 쪽, 같으면 먼저 온 쪽이 주 노드)
+    attached = set()
+    for row in sorted(rows, key=_birth_key):
+        member_id = row["_id"]
+        spouse_id = spouse_of(member_id)
+        if spouse_id is None or member_id in attached or spouse_id in attached or parents[spouse_id] is not None:
+            continue
+        if parents[member_id] is None and len(children[spouse_id]) > len(children[member_id]):
+            continue
+        attached.add(spouse_id)
+
+    visited = set()
+    depths: Dict[str, int] = {}
+    root_of: Dict[str, str] = {}
+
+    def visit(root_id: str) -> dict:
+        # 재귀 대신 명시적 스택 (세대가 깊어도 안전)
+        root = {"_id": root_id}
+        stack = [(root_id, 0, root)]
+        while stack:
+            member_id, depth, node = stack.pop()
+            visited.add(member_id)
+            depths[member_id], root_of[member_id] = depth, root_id
+            spouse_id = spouse_of(member_id)
+            if spouse_id in attached and spouse_id not in visited:
+                visited.add(spouse_id)
+                depths[spouse_id], root_of[spouse_id] = depth, root_id
+            else:
+                spouse_id = None
+            node["spouse_id"] = spouse_id
+            node["children"] = []
+            for child_id in children[member_id] + (children[spouse_id] if spouse_id else []):
+                if child_id in visited or child_id in attached:
+                    continue
+                visited.add(child_id)
+                child = {"_id": child_id}
+                node["children"].append(child)
+                stack.append((child_id, depth + 1, child))
+        return root
+
+    roots = []
+    ordered = sorted(rows, key=lambda row: (-row.get("generation", 0), _birth_key(row)))
+    for row in ordered:
+        if parents[row["_id"]] is None and row["_id"] not in attached and row["_id"] not in visited:
+            roots.append(visit(row["_id"]))
+    for row in ordered:  # 순환 연결로 닿지 못한 멤버
+        if row["_id"] not in visited:
+            roots.append(visit(row["_id"]))
+
+    # 세대 계산: 갈래(루트)마다 기준 멤버의 세대 + 깊이
+    anchors: Dict[str, int] = {}
+    for row in ordered:
+        member_id = row["_id"]
+        if row.get("relation_type") == SELF_RELATION and member_id in depths:
+            anchors.setdefault(root_of[member_id], depths[member_id])
+    generations: Dict[str, int] = {}
+    for member_id, depth in depths.items():
+        root_id = root_of[member_id]
+        base = anchors[root_id] if root_id in anchors else by_id[root_id].get("generation", 0)
+        generations[member_id] = base - depth
+
+    def expand(node: dict) -> dict:
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            member_id, spouse_id = current.pop("_id"), current.pop("spouse_id")
+            current["member"] = by_id[member_id]
+            current["spouse"] = by_id[spouse_id] if spouse_id else None
+            current["generation"] = generations[member_id]
+            stack.extend(current["children"])
+        return node
+
+    by_generation: Dict[int, List[str]] = defaultdict(list)
+    for member_id in by_id:
+        by_generation[generations[member_id]].append(member_id)
+    return {
+        "roots": [expand(root) for root in roots],
+        "generations": {gen: by_generation[gen] for gen in sorted(by_generation, reverse=True)},
+    }
+
+
+def build_tree(members: List[FamilyMember]) -> dict:
+    """멤버 목록 → {"sides": {side: build_side 결과}}"""
+    adapter = adapter_for(FamilyMember)
+    by_side: Dict[str, List[dict]] = defaultdict(list)
+    for member in members:
+        row = adapter.dump_python(member, mode="json", by_alias=True)
+        by_side[row["side"]].append(row)
+    return {"sides": {side: build_side(rows) for side, rows in by_side.items()}}
+
+
+async def get_tree_json(side: Optional[str] = None) -> bytes:
+    """트리 응답 JSON (FamilyMember 쓰기가 없으면 캐시 사용)"""
+    version = etag.version(FamilyMember)
+    cached = _cache.get(side)
+    if cached and cached[0] == version:
+        return cached[1]
+    if side:
+        members = await FamilyMember.find(FamilyMember.side == side).to_list()
+    else:
+        members = await FamilyMember.find_all().to_list()
+    body = dumps(build_tree(members))
+    if len(_cache) >= CACHE_MAX_KEYS:
+        _cache.clear()
+    _cache[side] = (version, body)
+    return body
@@ -0,0 +1,145 @@
+"""
+한국 공휴일 계산 (연도별 메모이즈).
+
+연도별 결과는 한 번만 계산해 LRU 캐시에 보관한다. (최근 HOLIDAY_CACHE_SIZE 개 연도)
+대체공휴일 규칙:
+  - 설날/추석 연휴: 일요일 또는 다른 공휴일과 겹치면 연휴 다음 첫 평일 (2014~)
+  - 어린이날: 토/일요일 또는 다른 공휴일과 겹치면 다음 첫 평일 (2014~)
+  - 삼일절/광복절/개천절/한글날: 위와 동일 (2021~)
+  - 석가탄신일/크리스마스: 위와 동일 (2023~)
+  - 신정/현충일: 대체공휴일 없음
+"""
+
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import List, Tuple
+
+from pydantic import BaseModel
+
+from services import lunar
+
+HOLIDAY_CACHE_SIZE = 64
+
+# (월, 일, 이름)
+FIXED_HOLIDAYS = [
+    (1, 1, "신정"),
+    (3, 1, "삼일절"),
+    (5, 5, "어린이날"),
+    (6, 6, "현충일"),
+    (8, 15, "광복절"),
+    (10, 3, "개천절"),
+    (10, 9, "한글날"),
+    (12, 25, "크리스마스"),
+]
+
+# (음력 월, 음력 일, 이름, 전날/다음날 연휴 여부)
+LUNAR_HOLIDAYS = [
+    (1, 1, "설날", True),
+    (4, 8, "석가탄신일", False),
+    (8, 15, "추석", True),
+]
+
+# 이름 → 대체공휴일 적용 시작 연도
+SUBSTITUTE_SINCE = {
+    "설날": 2014,
+    "추석": 2014,
+    "어린이날": 2014,
+    "삼일절": 2021,
+    "광복절": 2021,
+    "개천절": 2021,
+    "한글날": 2021,
+    "석가탄신일": 2023,
+    "크리스마스": 2023,
+}
+
+SATURDAY, SUNDAY = 5, 6
+
+
+class Holiday(BaseModel):
+    date: str
+    name: str
+    is_lunar: bool = False
+
+
+def _next_workday(after: date, taken: set) -> date:
+    day = after + timedelta(days=1)
+    while day.weekday() in (SATURDAY, SUNDAY) or day in taken:
+        day += timedelta(days=1)
+    return day
+
+
+@lru_cache(maxsize=HOLIDAY_CACHE_SIZE)
+def _build_year(year: int) -> Tuple[Holiday, ...]:
+    # (이름, 기간 날짜들, 음력 여부)
+    groups: List[Tuple[str, List[date], bool]] = []
+
+    for month, day, name in FIXED_HOLIDAYS:
+        groups.append((name, [date(year, month, day)], False))
+
+    for lunar_month, lunar_day, name, with_eve in LUNAR_HOLIDAYS:
+        solar = lunar.lunar_to_solar(year, lunar_month, lunar_day)
+        if not solar:
+            continue
+        # 설날 전날은 음력으로 전년도 12월 말이므로 양력 날짜로 계산
+        days = [solar - timedelta(days=1), solar, solar + timedelta(days=1)] if with_eve else [solar]
+        groups.append((name, days, True))
+
+    # 날짜별로 몇 개의 공휴일이 잡혀 있는지 (겹침 판단용)
+    count_by_date: dict = {}
+    for _, days, _ in groups:
+        for d in days:
+            count_by_date[d] = count_by_date.get(d, 0) + 1
+    taken = set(count_by_date)
+
+    # 대체공휴일 발생 기준일 (기간의 마지막 날). 같은 날 겹친 공휴일은 하나만 대체
+    periods = [g for g in groups if len(g[1]) > 1]
+    singles = [g for g in groups if len(g[1]) == 1]
+    covered = {d for _, days, _ in periods for d in days}
+    anchors = set()
+    for name, days, _ in periods + singles:
+        since = SUBSTITUTE_SINCE.get(name)
+        if since is None or year < since:
+            continue
+        is_period = len(days) > 1
+        # 설날/추석 연휴와 겹친 단일 공휴일은 연휴 쪽 대체공휴일로 처리
+        if not is_period and days[0] in covered:
+            continue
+        lost = any(
+            d.weekday() == SUNDAY
+            or (d.weekday() == SATURDAY and not is_period)
+            or count_by_date[d] > 1
+            for d in days
+        )
+        if lost:
+            anchors.add(days[-1])
+
+    holidays = []
+    for name, days, is_lunar in groups:
+        if len(days) == 3:
+            labels = [f"{name} 연휴", name, f"{name} 연휴"]
+        else:
+            labels = [name]
+        for d, label in zip(days, labels):
+            holidays.append(Holiday(date=d.strftime('%Y-%m-%d'), name=label, is_lunar=is_lunar))
+
+    for anchor in sorted(anchors):
+        substitute = _next_workday(anchor, taken)
+        taken.add(substitute)
+        holidays.append(Holiday(date=substitute.strftime('%Y-%m-%d'), name="대체공휴일", is_lunar=False))
+
+    # 날짜순 정렬 (연도 경계의 설날 연휴 포함)
+    holidays.sort(key=lambda h: h.date)
+    return tuple(holidays)
+
+
+def get_year_holidays(year: int) -> List[Holiday]:
+    """해당 연도의 공휴일 목록 (캐시)"""
+    return list(_build_year(year))
+
+
+def get_range_holidays(year_from: int, year_to: int) -> List[Holiday]:
+    """여러 연도의 공휴일을 한 번에 반환 (연도별 캐시 재사용)"""
+    result: List[Holiday] = []
+    for year in range(year_from, year_to + 1):
+        result.extend(_build_year(year))
+    return result
@@ -0,0 +1,135 @@
+"""
+인덱스 점검: 라우터가 실제로 보내는 대표 조회(필터 + 정렬)를 explain 해서
+선택된 실행 계획에 COLLSCAN(컬렉션 전체 스캔)이 있는지 확인한다.
+
+- 모델의 Settings.indexes 는 init_db(init_beanie) 에서 생성되고, 여기서는 그 인덱스가 실제로 쓰이는지만 본다
+- python -m services.index_check : 점검 결과 출력, COLLSCAN 이 하나라도 있으면 종료 코드 1 (MONGODB_URL 필요)
+- DB_VERIFY_INDEXES=1 이면 서버 시작 시에도 점검해 경고를 출력
+- 라우터 조회를 바꾸거나 새 목록 API 를 만들면 build_checks 에도 같은 조회를 추가할 것
+"""
+
+import sys
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple
+
+from bson import ObjectId
+
+from services.pagination import sort_spec
+
+from models.ai_job import AIJob
+from models.bucket import BucketList
+from models.calendar import CalendarEvent, CalendarOccurrence
+from models.cooking import Recipe
+from models.culture import CultureReview
+from models.diary import Diary
+from models.family import FamilyMember
+from models.knitting import KnittingRecord
+from models.liquor import LiquorReview
+from models.review import Review
+from models.search import SearchEntry
+from models.system.common_code import CommonCode
+from models.travel import Travel
+from models.user import User
+
+
+@dataclass
+class IndexCheck:
+    label: str
+    model: type
+    query: dict
+    sort: Optional[List[Tuple[str, int]]] = None
+
+
+def _calendar_month_query() -> dict:
+    from routers.calendar import build_range_query
+    return build_range_query(2025, 1, 2025, 1)
+
+
+def build_checks() -> List[IndexCheck]:
+    some_id = ObjectId()
+    return [
+        # 목록 API (커서 페이지네이션 정렬 그대로)
+        IndexCheck("liquor 목록", LiquorReview, {}, sort_spec(["-visit_date", "-created_at"])),
+        IndexCheck("liquor 종류 필터", LiquorReview, {"category": "WINE"}, sort_spec(["-visit_date", "-created_at"])),
+        IndexCheck("liquor AI 복구", LiquorReview, {"ai_note.status": "PENDING"}),
+        IndexCheck("culture 목록", CultureReview, {}, sort_spec(["-visit_date", "-created_at"])),
+        IndexCheck("culture 종류 필터", CultureReview, {"category": "MOVIE"}, sort_spec(["-visit_date", "-created_at"])),
+        IndexCheck("diary 목록", Diary, {}, sort_spec(["-date", "-created_at"])),
+        IndexCheck("diary 작성자 필터", Diary, {"created_by": some_id}, sort_spec(["-date", "-created_at"])),
+        IndexCheck("bucket 목록", BucketList, {}, sort_spec(["-created_at"])),
+        IndexCheck("bucket 상태 필터", BucketList, {"status": "active"}, sort_spec(["-created_at"])),
+        IndexCheck("bucket 분류 필터", BucketList, {"category": "travel"}, sort_spec(["-created_at"])),
+        IndexCheck("knitting 최근순", KnittingRecord, {}, sort_spec(["-created_at"])),
+        IndexCheck("knitting 시작일순", KnittingRecord, {}, sort_spec(["+start_date"])),
+        IndexCheck("knitting 이름순", KnittingRecord, {}, sort_spec(["+name"])),
+        IndexCheck("knitting 상태 필터", KnittingRecord, {"status": "WIP"}, sort_spec(["-created_at"])),
+        IndexCheck("knitting 분류 필터", KnittingRecord, {"category": "SWEATER"}, sort_spec(["-created_at"])),
+        IndexCheck("cooking 목록", Recipe, {}, sort_spec(["+_id"])),
+        IndexCheck("cooking 종류 필터", Recipe, {"cooking_type": "한식"}, sort_spec(["+_id"])),
+        IndexCheck("cooking 작성자 필터", Recipe, {"created_by": some_id}, sort_spec(["+_id"])),
+        IndexCheck("review 목록", Review, {}, sort_spec(["+_id"])),
+        IndexCheck("travel 최근순", Travel, {}, sort_spec(["-created_at"])),
+        IndexCheck("travel 시작일순", Travel, {}, sort_spec(["-start_date", "-created_at"])),
+        # 단건/연결 조회
+        IndexCheck("user 로그인", User, {"username": "someone"}),
+        IndexCheck("family side", FamilyMember, {"side": "husband"}),
+        IndexCheck("family 자녀", FamilyMember, {"parent_id": str(some_id)}),
+        IndexCheck("family 배우자", FamilyMember, {"spouse_id": str(some_id)}),
+        IndexCheck("code 그룹", CommonCode, {"group_code": "SUL", "use_yn": "Y"}, [("sort_order", 1)]),
+        IndexCheck("code 전체", CommonCode, {}, [("group_code", 1), ("sort_order", 1)]),
+        IndexCheck("calendar 월 후보", CalendarEvent, _calendar_month_query()),
+        IndexCheck("calendar 피드", CalendarEvent, {}, [("updated_at", -1)]),
+        IndexCheck("calendar 월별 표시", CalendarOccurrence, {"month": {"$in": ["2025-01"]}}, [("month", 1), ("event_id", 1)]),
+        IndexCheck("search 종류별", SearchEntry, {"kind": "liquor"}),
+        IndexCheck("ai 작업 큐", AIJob, {"status": "PENDING"}, [("next_run_at", 1)]),
+    ]
+
+
+def _stages(plan) -> Iterator[str]:
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            yield plan["stage"]
+        for value in plan.values():
+            yield from _stages(value)
+    elif isinstance(plan, list):
+        for value in plan:
+            yield from _stages(value)
+
+
+async def explain_stages(check: IndexCheck) -> List[str]:
+    cursor = check.model.get_pymongo_collection().find(check.query)
+    if check.sort:
+        cursor = cursor.sort(check.sort)
+    explained = await cursor.explain()
+    return list(_stages(explained["queryPlanner"]["winningPlan"]))
+
+
+async def find_collscans() -> List[str]:
+    """COLLSCAN 을 쓰는 점검 항목 이름 목록 (비어 있으면 통과)"""
+    failures = []
+    for check in build_checks():
+        if "COLLSCAN" in await explain_stages(check):
+            failures.append(check.label)
+    return failures
+
+
+async def _main() -> int:
+    from database import init_db
+
+    await init_db()
+    checks = build_checks()
+    failures = []
+    for check in checks:
+        stages = await explain_stages(check)
+        ok = "COLLSCAN" not in stages
+        if not ok:
+            failures.append(check.label)
+        print(f"{'✅' if ok else '❌'} {check.label}: {' > '.join(stages)}")
+    print(f"점검 {len(checks)}건, COLLSCAN {len(failures)}건")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    sys.exit(asyncio.run(_main()))
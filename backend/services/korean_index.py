@@ -0,0 +1,160 @@
+"""
+이름/제목용 한국어 n-gram + 초성 역색인 (프로세스 메모리).
+
+- 공백을 빼고 소문자로 바꾼 제목의 2-gram 과, 초성 문자열의 1-gram·2-gram 을 posting 으로 유지
+- "막걸" 같은 부분 문자열, "ㅁㄱㄹ" 같은 초성, "막거" 처럼 받침을 치기 전인 마지막 글자도 찾음
+- posting 교집합으로 후보를 좁힌 뒤 글자 단위로 한 번 더 확인
+- services.search 가 서버 시작 시 채우고, 등록/수정/삭제 때 add/remove 를 호출
+"""
+
+import time
+import unicodedata
+from collections import defaultdict
+from typing import Dict, Set
+
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+HANGUL_FIRST, HANGUL_LAST = 0xAC00, 0xD7A3
+JUNG_JONG = 21 * 28  # 초성 하나당 음절 수
+
+
+def normalize(text: str) -> str:
+    text = unicodedata.normalize("NFC", text or "").casefold()
+    return "".join(text.split())
+
+
+def _is_syllable(ch: str) -> bool:
+    return HANGUL_FIRST <= ord(ch) <= HANGUL_LAST
+
+
+def initial_of(ch: str) -> str:
+    """완성형 한글이면 초성, 아니면 그대로"""
+    if _is_syllable(ch):
+        return CHOSEONG[(ord(ch) - HANGUL_FIRST) // JUNG_JONG]
+    return ch
+
+
+def initials(text: str) -> str:
+    return "".join(initial_of(ch) for ch in text)
+
+
+def _grams(text: str) -> Set[str]:
+    """1글자면 1-gram, 그 이상이면 2-gram"""
+    if len(text) == 1:
+        return {text}
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def _initial_grams(text: str) -> Set[str]:
+    """색인용 초성 1-gram + 2-gram (1글자 검색도 posting 으로 처리)"""
+    chars = initials(text)
+    return set(chars) | _grams(chars) if chars else set()
+
+
+def _is_open_syllable(ch: str) -> bool:
+    """받침 없는 음절 (입력 중이면 받침이 붙을 수 있음)"""
+    return _is_syllable(ch) and (ord(ch) - HANGUL_FIRST) % 28 == 0
+
+
+def _char_matches(query_ch: str, text_ch: str, is_last: bool) -> bool:
+    if query_ch == text_ch:
+        return True
+    if query_ch in CHOSEONG:
+        return initial_of(text_ch) == query_ch
+    if is_last and _is_open_syllable(query_ch) and _is_syllable(text_ch):
+        # "거" → "걸", "걷" … (초성+중성이 같으면 일치)
+        return (ord(text_ch) - HANGUL_FIRST) // 28 == (ord(query_ch) - HANGUL_FIRST) // 28
+    return False
+
+
+def matches(query: str, text: str) -> bool:
+    """정규화된 query 가 정규화된 text 의 어느 위치에서든 일치하는지"""
+    last = len(query) - 1
+    for start in range(len(text) - len(query) + 1):
+        if all(_char_matches(q, text[start + i], i == last) for i, q in enumerate(query)):
+            return True
+    return False
+
+
+class KoreanIndex:
+    def __init__(self):
+        self.texts: Dict[str, str] = {}
+        self.initial_postings: Dict[str, Set[str]] = defaultdict(set)
+        self.text_postings: Dict[str, Set[str]] = defaultdict(set)
+        self.ready = False
+
+    def add(self, doc_id: str, text: str):
+        self.remove(doc_id)
+        norm = normalize(text)
+        self.texts[doc_id] = norm
+        for gram in _initial_grams(norm):
+            self.initial_postings[gram].add(doc_id)
+        for gram in _grams(norm) if len(norm) > 1 else ():
+            self.text_postings[gram].add(doc_id)
+
+    def remove(self, doc_id: str):
+        norm = self.texts.pop(doc_id, None)
+        if norm is None:
+            return
+        for postings, grams in ((self.initial_postings, _initial_grams(norm)),
+                                (self.text_postings, _grams(norm) if len(norm) > 1 else ())):
+            for gram in grams:
+                ids = postings.get(gram)
+                if ids is not None:
+                    ids.discard(doc_id)
+                    if not ids:
+                        del postings[gram]
+
+    def search(self, query: str) -> Set[str]:
+        """query 와 일치하는 문서 id 집합"""
+        norm = normalize(query)
+        if not norm:
+            return set(self.texts)
+
+        # 초성은 어떤 글자든 (초성 입력, 입력 중인 음절 포함) 반드시 일치하므로 항상 후보 조건으로 사용하고,
+        # 완성된 글자 부분은 2-gram 으로 더 좁힘 (초성 / 입력 중인 마지막 글자 제외)
+        exact = norm[:-1] if _is_open_syllable(norm[-1]) else norm
+        postings = [self.initial_postings.get(gram, set()) for gram in _grams(initials(norm))]
+        postings += [self.text_postings.get(gram, set()) for gram in _grams(exact)
+                     if len(gram) == 2 and not any(ch in CHOSEONG for ch in gram)]
+
+        # 작은 posting 부터 교집합
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for ids in postings[1:]:
+            if not candidates:
+                break
+            candidates &= ids
+
+        return {doc_id for doc_id in candidates if matches(norm, self.texts[doc_id])}
+
+
+def _benchmark(docs: int = 20000, rounds: int = 1000):
+    """python -m services.korean_index : 색인 검색 vs 전체 순회 비교"""
+    import random
+    import re
+
+    random.seed(0)
+    syllables = [chr(HANGUL_FIRST + random.randrange(HANGUL_LAST - HANGUL_FIRST)) for _ in range(300)]
+    texts = {str(i): "".join(random.choices(syllables, k=random.randint(3, 12))) for i in range(docs)}
+    index = KoreanIndex()
+    started = time.perf_counter()
+    for doc_id, text in texts.items():
+        index.add(doc_id, text)
+    print(f"색인 생성: {docs}건 {(time.perf_counter() - started) * 1000:.0f}ms")
+
+    queries = [text[1:3] for text in random.sample(list(texts.values()), rounds)]
+    started = time.perf_counter()
+    for q in queries:
+        index.search(q)
+    indexed = (time.perf_counter() - started) / rounds * 1e6
+
+    started = time.perf_counter()
+    for q in queries:
+        pattern = re.compile(re.escape(q), re.IGNORECASE)
+        [doc_id for doc_id, text in texts.items() if pattern.search(text)]
+    scanned = (time.perf_counter() - started) / rounds * 1e6
+    print(f"검색 1회: 색인 {indexed:.1f}µs / 전체 순회 정규식 {scanned:.1f}µs")
+
+
+if __name__ == "__main__":
+    _benchmark()
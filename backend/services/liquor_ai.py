@@ -0,0 +1,245 @@
+"""
+주류 AI 소믈리에 분석 (Gemini).
+
+analyze_liquor 는 캐시 조회 → 모델 호출 → 응답 파싱만 담당하고 실패 시 예외를 던진다.
+재시도/상태 관리는 services.ai_queue 가 맡는다.
+
+같은 술을 다시 사는 경우가 많아, 분석 결과는 정규화된 이름 + 프롬프트 버전 기준으로
+ai_note_cache 에 보관한다. (TTL: AI_CACHE_TTL_DAYS) 프롬프트를 바꾸면 PROMPT_VERSION 을 올릴 것.
+
+대기 작업이 많을 때는 analyze_liquors 로 최대 AI_BATCH_SIZE 개 이름을 한 프롬프트에 묶어
+JSON 배열로 받는다. 파싱되지 않은 항목은 호출한 쪽에서 개별 분석으로 다시 처리한다.
+
+모델 호출은 services.ai_client 의 공유 클라이언트(데드라인, 서킷 브레이커, 지표)를 거친다.
+"""
+
+import hashlib
+import json
+import os
+import re
+import unicodedata
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from beanie import PydanticObjectId
+from pymongo.errors import DuplicateKeyError
+
+from models.liquor import LiquorReview, AINote
+from models.ai_cache import AINoteCache
+from services import pubsub, ai_client
+
+PROMPT_VERSION = "v1"
+BATCH_SIZE = max(1, int(os.getenv("AI_BATCH_SIZE", "5")))
+NOTE_KEYS = ("description", "taste", "aroma", "variety", "pairing")
+
+# 프로세스 단위 캐시 적중 통계
+cache_stats = {"hits": 0, "misses": 0}
+
+
+def is_available() -> bool:
+    return ai_client.is_available()
+
+
+def build_prompt(liquor_name: str) -> str:
+    return f"""
+        당신은 전문 소믈리에입니다. 다음 술에 대한 정보를 분석해주세요.
+        술 이름: {liquor_name}
+        
+        다음 5가지 항목을 JSON 형식으로만 답해주세요. 다른 말은 절대 하지 말고 오직 JSON 객체만 반환하세요.
+        키 이름: description, taste, aroma, variety, pairing
+        
+        {{
+            "description": "이 술에 대한 흥미로운 1~2문장 소개 (한국어)",
+            "taste": "맛의 특징 (단맛, 쓴맛, 바디감 등)",
+            "aroma": "향의 특징 (과일, 오크, 바닐라 등)",
+            "variety": "품종 또는 원료 (모르면 '정보 없음'이라 적으세요)",
+            "pairing": "잘 어울리는 음식 추천 1~2개"
+        }}
+        """
+
+
+def build_batch_prompt(liquor_names: List[str]) -> str:
+    numbered = "\n".join(f"        {i}. {name}" for i, name in enumerate(liquor_names, start=1))
+    return f"""
+        당신은 전문 소믈리에입니다. 다음 {len(liquor_names)}개 술에 대한 정보를 각각 분석해주세요.
+{numbered}
+        
+        위 순서 그대로 JSON 배열로만 답해주세요. 다른 말은 절대 하지 말고 오직 JSON 배열만 반환하세요.
+        각 원소의 키 이름: name, description, taste, aroma, variety, pairing (name 은 위 술 이름을 그대로)
+        
+        [
+            {{
+                "name": "술 이름",
+                "description": "이 술에 대한 흥미로운 1~2문장 소개 (한국어)",
+                "taste": "맛의 특징 (단맛, 쓴맛, 바디감 등)",
+                "aroma": "향의 특징 (과일, 오크, 바닐라 등)",
+                "variety": "품종 또는 원료 (모르면 '정보 없음'이라 적으세요)",
+                "pairing": "잘 어울리는 음식 추천 1~2개"
+            }}
+        ]
+        """
+
+
+def normalize_name(liquor_name: str) -> str:
+    """캐시 키용 이름 정규화 (전각/반각, 대소문자, 공백 차이 무시)"""
+    text = unicodedata.normalize("NFKC", liquor_name or "").casefold()
+    return " ".join(text.split())
+
+
+def cache_key(liquor_name: str) -> str:
+    return hashlib.sha256(f"{PROMPT_VERSION}|{normalize_name(liquor_name)}".encode("utf-8")).hexdigest()
+
+
+async def get_cached_note(liquor_name: str, count_miss: bool = True) -> Optional[AINote]:
+    """캐시된 분석 결과 (없으면 None). 등록 직전 확인처럼 뒤이어 분석이 다시 조회하는 경우 count_miss=False"""
+    if not normalize_name(liquor_name):
+        return None
+    cached = await AINoteCache.find_one(AINoteCache.key == cache_key(liquor_name))
+    if not cached:
+        if count_miss:
+            cache_stats["misses"] += 1
+        return None
+    cache_stats["hits"] += 1
+    await cached.inc({AINoteCache.hits: 1})
+    return cached.note.model_copy(update={"status": "COMPLETED"})
+
+
+async def store_cached_note(liquor_name: str, note: AINote):
+    key = cache_key(liquor_name)
+    # 조회 후 삽입이 아닌 한 번의 upsert (같은 이름 작업이 동시에 끝나도 안전)
+    try:
+        await AINoteCache.get_pymongo_collection().update_one(
+            {"key": key},
+            {
+                "$set": {"note": note.model_dump(), "created_at": datetime.now()},
+                "$setOnInsert": {"name": normalize_name(liquor_name), "prompt_version": PROMPT_VERSION, "hits": 0},
+            },
+            upsert=True,
+        )
+    except DuplicateKeyError:
+        pass  # 동시에 먼저 저장된 결과가 있음 (캐시 적중과 같음, 모델 호출은 이미 성공)
+
+
+def extract_json(raw_text: str) -> Optional[dict]:
+    """모델 응답에서 JSON 부분만 추출 (실패 시 None)"""
+    # [핵심] 정규식으로 JSON 부분({ ... })만 추출
+    # re.DOTALL: 줄바꿈이 포함되어 있어도 매칭되도록 함
+    json_match = re.search(r'\{.*\}', raw_text, re.DOTALL)
+
+    if json_match:
+        json_str = json_match.group()
+    else:
+        # 매칭 실패 시 수동 정제 시도
+        json_str = raw_text.replace("``````", "").strip()
+
+    try:
+        data = json.loads(json_str)
+    except json.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def extract_json_array(raw_text: str) -> List[Optional[dict]]:
+    """배치 응답에서 JSON 배열 추출 (실패 시 빈 목록, 원소가 객체가 아니면 None)"""
+    json_match = re.search(r'\[.*\]', raw_text, re.DOTALL)
+    if not json_match:
+        return []
+    try:
+        data = json.loads(json_match.group())
+    except json.JSONDecodeError:
+        return []
+    if not isinstance(data, list):
+        return []
+    return [item if isinstance(item, dict) else None for item in data]
+
+
+def note_from_data(data: dict) -> AINote:
+    return AINote(
+        status="COMPLETED",
+        description=data.get("description", ""),
+        taste=data.get("taste", ""),
+        aroma=data.get("aroma", ""),
+        variety=data.get("variety", ""),
+        pairing=data.get("pairing", "")
+    )
+
+
+def fallback_note(raw_text: str) -> AINote:
+    """파싱 실패 시 원본 텍스트라도 description에 넣어서 저장 (캐시하지 않음)"""
+    print(f"⚠️ JSON 파싱 실패. 원본: {raw_text}")
+    return note_from_data({
+        "description": raw_text[:300],  # 너무 길면 자름
+        "taste": "-", "aroma": "-", "variety": "-", "pairing": "-"
+    })
+
+
+async def analyze_liquor(liquor_name: str) -> AINote:
+    """술 정보를 분석해 AINote 반환. 캐시에 있으면 모델을 호출하지 않음"""
+    cached = await get_cached_note(liquor_name)
+    if cached:
+        return cached
+
+    raw_text = await ai_client.get_client().generate(build_prompt(liquor_name))
+
+    data = extract_json(raw_text)
+    if data is None:
+        return fallback_note(raw_text)
+    note = note_from_data(data)
+    await store_cached_note(liquor_name, note)
+    return note
+
+
+async def analyze_liquors(liquor_names: List[str]) -> Dict[str, AINote]:
+    """여러 술을 한 번의 호출로 분석. 캐시 적중분은 호출에서 제외.
+    결과를 얻지 못한 이름은 반환값에 빠지며, 호출한 쪽이 개별 분석으로 처리한다."""
+    notes: Dict[str, AINote] = {}
+    pending: List[str] = []
+    for name in dict.fromkeys(liquor_names):  # 순서 유지 중복 제거
+        cached = await get_cached_note(name)
+        if cached:
+            notes[name] = cached
+        else:
+            pending.append(name)
+    if not pending:
+        return notes
+
+    raw_text = await ai_client.get_client().generate(build_batch_prompt(pending))
+
+    items = extract_json_array(raw_text)
+    by_name = {normalize_name(item.get("name", "")): item for item in items if item}
+    for index, name in enumerate(pending):
+        # 이름으로 먼저 찾고, 없으면 같은 순서의 원소 사용
+        item = by_name.get(normalize_name(name))
+        if item is None and index < len(items) and items[index] and not items[index].get("name"):
+            item = items[index]
+        if not item or not all(isinstance(item.get(key), str) for key in NOTE_KEYS):
+            continue
+        note = note_from_data(item)
+        await store_cached_note(name, note)
+        notes[name] = note
+    return notes
+
+
+async def apply_note(liquor_id: PydanticObjectId, liquor_name: str, note: AINote) -> bool:
+    """분석 결과 저장. 그 사이 이름이 바뀌었으면(새 분석 대기 중) 저장하지 않음"""
+    liquor = await LiquorReview.get(liquor_id)
+    if not liquor or liquor.name != liquor_name:
+        return False
+    liquor.ai_note = note
+    await liquor.save()
+    pubsub.publish(status_topic(liquor_id), liquor.ai_note)
+    print(f"✅ AI Analysis Completed for {liquor_name} (Model: {ai_client.MODEL_NAME})")
+    return True
+
+
+async def mark_failed(liquor_id: PydanticObjectId, liquor_name: str):
+    liquor = await LiquorReview.get(liquor_id)
+    if liquor and liquor.name == liquor_name:
+        liquor.ai_note.status = "FAILED"
+        await liquor.save()
+        pubsub.publish(status_topic(liquor_id), liquor.ai_note)
+
+
+def status_topic(liquor_id: PydanticObjectId) -> str:
+    """ai_note 상태 변경 알림 토픽 (SSE 스트림이 구독)"""
+    return f"liquor:{liquor_id}:ai_note"
@@ -0,0 +1,142 @@
+"""
+음력 ↔ 양력 변환 테이블.
+
+korean_lunar_calendar 는 변환할 때마다 객체를 새로 만들고 기준 연도부터 일수를 누적 계산한다.
+지원 범위(음력 1900~2049년)의 모든 날짜를 서버 시작 시 한 번 배열로 펼쳐 두고,
+양방향 모두 인덱스 계산만으로 변환한다. (메모리: 약 55,000일 × 4byte ≈ 220KB)
+
+벤치마크:
+    cd backend
+    python -m services.lunar
+"""
+
+from array import array
+from datetime import date
+from typing import Optional, Tuple
+
+LUNAR_MIN_YEAR = 1900
+LUNAR_MAX_YEAR = 2049          # 라이브러리 데이터가 음력 2050-11-18 까지라 온전한 마지막 해
+MONTH_SLOTS = 13               # 평달 12 + 윤달 1 (윤달은 한 해에 최대 한 번)
+LEAP_SLOT = 12
+
+
+def _slot(year: int, month: int, is_leap: bool) -> int:
+    return (year - LUNAR_MIN_YEAR) * MONTH_SLOTS + (LEAP_SLOT if is_leap else month - 1)
+
+
+def _pack(year: int, month: int, day: int, is_leap: bool) -> int:
+    return (year << 10) | (month << 6) | (day << 1) | int(is_leap)
+
+
+class LunarTable:
+    """음력 월별 시작 오프셋 + 일자별 음력 값을 담은 배열 테이블"""
+
+    def __init__(self):
+        from korean_lunar_calendar import KoreanLunarCalendar
+
+        calendar = KoreanLunarCalendar()
+        calendar.setLunarDate(LUNAR_MIN_YEAR, 1, 1, False)
+        # 테이블 0번 = 음력 LUNAR_MIN_YEAR-01-01 의 양력 날짜
+        self.base_ordinal = date(calendar.solarYear, calendar.solarMonth, calendar.solarDay).toordinal()
+
+        year_count = LUNAR_MAX_YEAR - LUNAR_MIN_YEAR + 1
+        self.month_start = array('i', [-1]) * (year_count * MONTH_SLOTS)  # 월 시작 오프셋 (-1: 없는 윤달)
+        self.month_days = array('B', [0]) * (year_count * MONTH_SLOTS)    # 월 일수 (29/30)
+        self.lunar_by_offset = array('I')                                  # 오프셋 → 음력 (packed)
+
+        offset = 0
+        for year in range(LUNAR_MIN_YEAR, LUNAR_MAX_YEAR + 1):
+            for month in range(1, 13):
+                for is_leap in (False, True):
+                    # 윤달은 해당 연도의 윤달 번호와 일치할 때만 유효
+                    if is_leap and not calendar.setLunarDate(year, month, 1, True):
+                        continue
+                    days = 30 if calendar.setLunarDate(year, month, 30, is_leap) else 29
+                    slot = _slot(year, month, is_leap)
+                    self.month_start[slot] = offset
+                    self.month_days[slot] = days
+                    self.lunar_by_offset.extend(_pack(year, month, day, is_leap) for day in range(1, days + 1))
+                    offset += days
+
+    def to_solar(self, year: int, month: int, day: int, is_leap: bool = False) -> Optional[date]:
+        """음력 → 양력. 범위 밖이거나 없는 날짜(예: 작은달 30일)면 None"""
+        if not (LUNAR_MIN_YEAR <= year <= LUNAR_MAX_YEAR) or not (1 <= month <= 12):
+            return None
+        slot = _slot(year, month, is_leap)
+        if self.month_start[slot] < 0 or not (1 <= day <= self.month_days[slot]):
+            return None
+        return date.fromordinal(self.base_ordinal + self.month_start[slot] + day - 1)
+
+    def to_lunar(self, solar: date) -> Optional[Tuple[int, int, int, bool]]:
+        """양력 → 음력 (연, 월, 일, 윤달 여부). 범위 밖이면 None"""
+        offset = solar.toordinal() - self.base_ordinal
+        if not (0 <= offset < len(self.lunar_by_offset)):
+            return None
+        packed = self.lunar_by_offset[offset]
+        return (packed >> 10, (packed >> 6) & 0x0F, (packed >> 1) & 0x1F, bool(packed & 1))
+
+
+_table: Optional[LunarTable] = None
+
+
+def load_table() -> LunarTable:
+    """테이블을 한 번만 생성 (서버 시작 시 호출, 이후 재사용)"""
+    global _table
+    if _table is None:
+        _table = LunarTable()
+    return _table
+
+
+def lunar_to_solar(year: int, month: int, day: int, is_leap: bool = False) -> Optional[date]:
+    return load_table().to_solar(year, month, day, is_leap)
+
+
+def solar_to_lunar(year: int, month: int, day: int) -> Optional[Tuple[int, int, int, bool]]:
+    try:
+        solar = date(year, month, day)
+    except ValueError:
+        return None
+    return load_table().to_lunar(solar)
+
+
+def _benchmark(rounds: int = 2000):
+    import random
+    import time
+    from korean_lunar_calendar import KoreanLunarCalendar
+
+    def library_lunar_to_solar(y, m, d):
+        calendar = KoreanLunarCalendar()
+        calendar.setLunarDate(y, m, d, False)
+        return date(calendar.solarYear, calendar.solarMonth, calendar.solarDay)
+
+    def library_solar_to_lunar(y, m, d):
+        calendar = KoreanLunarCalendar()
+        calendar.setSolarDate(y, m, d)
+        return (calendar.lunarYear, calendar.lunarMonth, calendar.lunarDay)
+
+    started = time.perf_counter()
+    load_table()
+    print(f"테이블 생성: {(time.perf_counter() - started) * 1000:.1f}ms")
+
+    rng = random.Random(0)
+    samples = [(rng.randint(1950, 2045), rng.randint(1, 12), rng.randint(1, 28)) for _ in range(rounds)]
+    cases = [
+        ("음력→양력", library_lunar_to_solar, lunar_to_solar),
+        ("양력→음력", library_solar_to_lunar, solar_to_lunar),
+    ]
+    for label, library_fn, table_fn in cases:
+        started = time.perf_counter()
+        for y, m, d in samples:
+            library_fn(y, m, d)
+        library_us = (time.perf_counter() - started) / rounds * 1e6
+
+        started = time.perf_counter()
+        for y, m, d in samples:
+            table_fn(y, m, d)
+        table_us = (time.perf_counter() - started) / rounds * 1e6
+
+        print(f"{label}: 라이브러리 {library_us:.2f}µs / 테이블 {table_us:.2f}µs (x{library_us / table_us:.0f})")
+
+
+if __name__ == "__main__":
+    _benchmark()
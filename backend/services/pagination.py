@@ -0,0 +1,110 @@
+"""
+목록 API 키셋(커서) 페이지네이션.
+
+각 목록의 정렬 키 튜플 (예: -visit_date, -created_at, _id) 에서 마지막 행의 값을 불투명한 커서로 내려주고,
+다음 요청은 "그 행 이후" 조건으로 이어서 조회한다. skip 없이 정렬 인덱스 범위만 읽는다.
+
+- limit 이 없으면 기존처럼 전체 목록 (기존 호출 호환)
+- 다음 커서는 응답 헤더 X-Next-Cursor 로 반환 (없으면 마지막 페이지), 본문은 기존 배열 그대로
+- 정렬 키 끝에는 항상 _id 를 붙여 순서를 하나로 고정
+"""
+
+import base64
+from typing import Any, List, Optional, Tuple
+
+from beanie import Document
+from bson import json_util
+from fastapi import HTTPException, Query, Response
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+MAX_LIMIT = 100
+
+# 목록 API 공통 파라미터
+LimitQuery = Query(None, ge=1, le=MAX_LIMIT, description="한 번에 가져올 개수 (없으면 전체)")
+CursorQuery = Query(None, description="이전 응답의 X-Next-Cursor 값")
+
+
+def sort_spec(keys: List[str]) -> List[Tuple[str, int]]:
+    """["-visit_date", "+name"] → [("visit_date", -1), ("name", 1), ("_id", ±1)]"""
+    spec = []
+    for key in keys:
+        direction = -1 if key.startswith("-") else 1
+        spec.append((key.lstrip("+-"), direction))
+    if not any(field == "_id" for field, _ in spec):
+        spec.append(("_id", spec[0][1] if spec else 1))
+    return spec
+
+
+def encode_cursor(values: List[Any]) -> str:
+    return base64.urlsafe_b64encode(json_util.dumps(values).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, length: int) -> List[Any]:
+    try:
+        values = json_util.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except Exception:
+        values = None
+    if not isinstance(values, list) or len(values) != length:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+    return values
+
+
+def _after(field: str, direction: int, value: Any) -> dict:
+    """정렬상 value 다음에 오는 값 조건. null(없음)은 Mongo 정렬에서 가장 작은 값"""
+    if value is None:
+        # 오름차순: null 다음은 값이 있는 행 / 내림차순: null 다음은 없음
+        return {field: {"$ne": None}} if direction > 0 else {field: {"$in": []}}
+    if direction > 0:
+        return {field: {"$gt": value}}
+    return {"$or": [{field: {"$lt": value}}, {field: None}]}
+
+
+def after_condition(spec: List[Tuple[str, int]], values: List[Any]) -> dict:
+    """(a, b, _id) > (va, vb, vid) 를 $or 사다리로 표현"""
+    branches = []
+    for i, (field, direction) in enumerate(spec):
+        branch = [{prev_field: values[j]} for j, (prev_field, _) in enumerate(spec[:i])]
+        branch.append(_after(field, direction, values[i]))
+        branches.append({"$and": branch} if len(branch) > 1 else branch[0])
+    return {"$or": branches}
+
+
+def _sort_value(item: Any, field: str) -> Any:
+    if isinstance(item, dict):  # 프로젝션 조회 결과 (원본 dict)
+        return item.get(field)
+    return item.id if field == "_id" else getattr(item, field, None)
+
+
+async def paginate(
+    model: type,
+    query: dict,
+    sort: List[str],
+    limit: Optional[int],
+    cursor: Optional[str],
+    response: Response,
+    projection: Optional[dict] = None,
+) -> list:
+    """query 를 sort 순서로 조회. limit 이 있으면 한 페이지만 읽고 다음 커서를 헤더에 기록
+
+    projection 이 있으면 Document 로 만들지 않고 필요한 필드만 담긴 dict 목록을 반환
+    (응답은 services.serialization.fast_response 가 검증 없이 바로 인코딩)
+    """
+    spec = sort_spec(sort)
+    if cursor:
+        after = after_condition(spec, decode_cursor(cursor, len(spec)))
+        query = {"$and": [query, after]} if query else after
+
+    find = model.find(query)
+    if projection is not None:
+        # 커서 값을 만들 수 있도록 정렬 필드는 항상 조회
+        projection = {**{field: 1 for field, _ in spec}, **projection}
+        find = model.get_pymongo_collection().find(find.get_filter_query(), projection)
+    find = find.sort(spec)
+    if limit is not None:
+        find = find.limit(limit + 1)
+    items = await find.to_list(length=None) if projection is not None else await find.to_list()
+
+    if limit is not None and len(items) > limit:
+        items = items[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor([_sort_value(items[-1], f) for f, _ in spec])
+    return items
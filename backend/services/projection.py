@@ -0,0 +1,65 @@
+"""
+목록 API 필드 프로젝션 (fields= 파라미터).
+
+- fields 없음: 엔드포인트별 요약 프로젝션 (목록 화면에 필요한 필드만, 이미지는 첫 장만)
+- fields=*: 전체 문서
+- fields=a,b,c: 지정한 필드만 (모델의 필수 필드는 응답 검증을 위해 항상 포함)
+
+프로젝션은 Mongo 조회 단계에서 적용되어 전송량과 BSON 디코딩 비용을 함께 줄인다.
+조회한 dict 는 services.serialization 이 그대로 인코딩하므로 응답에는 조회한 필드만 담긴다.
+"""
+
+from typing import Any, Dict, Optional
+
+from fastapi import HTTPException, Query
+
+ALL_FIELDS = "*"
+
+FieldsQuery = Query(None, description="응답 필드 (쉼표 구분, *: 전체, 없으면 요약)")
+
+# 자주 쓰는 요약 표현식
+FIRST_IMAGE = {"$slice": 1}
+COMMENT_COUNT = {"$size": {"$ifNull": ["$comments", []]}}
+
+
+def preview(field: str, length: int) -> dict:
+    """문자열 앞부분만 (MongoDB 4.4+ find 프로젝션 표현식)"""
+    return {"$substrCP": [{"$ifNull": [f"${field}", ""]}, 0, length]}
+
+
+def build_projection(
+    model: type,
+    fields: Optional[str],
+    summary: Dict[str, Any],
+    computed: Optional[Dict[str, Any]] = None,
+) -> Optional[dict]:
+    """fields 파라미터를 Mongo 프로젝션으로 변환 (None 이면 전체 문서)
+
+    computed: 저장 필드가 아니라 조회 시 계산하는 필드 (예: comment_count)
+    """
+    computed = computed or {}
+    if fields and fields.strip() == ALL_FIELDS:
+        return None
+
+    if not fields:
+        projection = dict(summary)
+    else:
+        projection = {}
+        unknown = []
+        for name in (f.strip() for f in fields.split(",")):
+            if not name or name in ("_id", "id"):
+                continue
+            if name in computed:
+                projection[name] = computed[name]
+            elif name in model.model_fields:
+                projection[name] = 1
+            else:
+                unknown.append(name)
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"알 수 없는 필드: {', '.join(unknown)}")
+
+    # 필수 필드는 항상 포함 (응답 모델 검증)
+    for name, field in model.model_fields.items():
+        if field.is_required() and name not in projection:
+            projection[name] = 1
+    return projection
@@ -0,0 +1,32 @@
+"""
+프로세스 내부 pub/sub (asyncio.Queue 기반).
+
+백그라운드 작업이 끝났을 때 대기 중인 요청(SSE 등)에 바로 알리기 위한 용도.
+구독자가 없으면 발행은 아무 일도 하지 않는다.
+"""
+
+import asyncio
+from collections import defaultdict
+from typing import Any, Dict, Set
+
+_subscribers: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+
+
+def subscribe(topic: str) -> asyncio.Queue:
+    queue: asyncio.Queue = asyncio.Queue()
+    _subscribers[topic].add(queue)
+    return queue
+
+
+def unsubscribe(topic: str, queue: asyncio.Queue):
+    queues = _subscribers.get(topic)
+    if queues is None:
+        return
+    queues.discard(queue)
+    if not queues:
+        del _subscribers[topic]
+
+
+def publish(topic: str, message: Any):
+    for queue in list(_subscribers.get(topic, ())):
+        queue.put_nowait(message)
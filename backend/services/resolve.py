@@ -0,0 +1,124 @@
+"""
+응답에 이름 붙이기 (resolve= 파라미터, 선택).
+
+- resolve=codes: 코드값 필드마다 {필드}_name 으로 코드명을 붙임 (공통 코드 메모리 레지스트리 사용, DB 조회 없음)
+  목록 필드(예: techniques)는 이름도 목록으로, 없는 코드는 코드값 그대로
+- resolve=users: created_by 마다 created_by_nickname 을 붙임 (문서와 안에 든 댓글 comments[] 모두)
+  응답 하나당 캐시에 없는 작성자만 $in 으로 한 번 조회, 닉네임이 비어 있으면 username, 없는 사용자는 None
+- 프로젝션으로 빠진 필드에는 붙이지 않음
+
+화면이 코드 그룹을 따로 받아 조인하지 않아도 되게 하는 용도. 지정하지 않으면 응답은 그대로.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from bson import ObjectId
+from fastapi import HTTPException, Query
+from pydantic import BaseModel
+
+from models.user import User
+from services import code_registry
+from services.serialization import adapter_for, list_adapter_for
+
+RESOLVE_OPTIONS = {"codes", "users"}
+NICKNAME_CACHE_MAX = 1000
+
+ResolveQuery = Query(None, description="응답에 붙일 이름 (쉼표 구분, codes: 코드명, users: 작성자 닉네임)")
+
+_nicknames: Dict[str, Optional[str]] = {}  # user_id → 표시 이름 (없는 사용자는 None)
+_nicknames_generation = 0  # 무효화 횟수 (조회 중에 바뀐 사용자를 옛 이름으로 다시 캐시하지 않기 위함)
+
+
+def parse_resolve(resolve: Optional[str]) -> Set[str]:
+    if not resolve:
+        return set()
+    options = {option.strip() for option in resolve.split(",") if option.strip()}
+    unknown = options - RESOLVE_OPTIONS
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"알 수 없는 resolve 값: {', '.join(sorted(unknown))}")
+    return options
+
+
+def to_rows(content: Any, model: type) -> Any:
+    """Document(들)은 응답과 같은 모양의 dict 로 (원본 dict 는 그대로)"""
+    if isinstance(content, BaseModel):
+        return adapter_for(model).dump_python(content, mode="json", by_alias=True)
+    if isinstance(content, list) and content and isinstance(content[0], BaseModel):
+        return list_adapter_for(model).dump_python(content, mode="json", by_alias=True)
+    return content
+
+
+async def attach_code_names(content: Any, model: type, code_fields: Dict[str, str]) -> Any:
+    """code_fields: {필드: 그룹 코드}. 이름을 붙인 dict (목록) 을 반환"""
+    content = to_rows(content, model)
+    rows: List[dict] = content if isinstance(content, list) else [content]
+    names = {field: await code_registry.names(group) for field, group in code_fields.items()}
+    for row in rows:
+        for field, group_names in names.items():
+            if field not in row or row[field] is None:
+                continue
+            value = row[field]
+            if isinstance(value, list):
+                row[f"{field}_name"] = [group_names.get(code, code) for code in value]
+            else:
+                row[f"{field}_name"] = group_names.get(value, value)
+    return content
+
+
+def forget_nickname(user_id: Any):
+    """사용자 닉네임 변경/삭제 시 호출"""
+    global _nicknames_generation
+    _nicknames_generation += 1
+    _nicknames.pop(str(user_id), None)
+
+
+async def nicknames(user_ids: Iterable[str]) -> Dict[str, Optional[str]]:
+    """user_id → 표시 이름. 캐시에 없는 것만 한 번에 조회"""
+    user_ids = set(user_ids)
+    missing = [user_id for user_id in user_ids if user_id not in _nicknames and ObjectId.is_valid(user_id)]
+    found: Dict[str, Optional[str]] = {}
+    if missing:
+        generation = _nicknames_generation
+        found = {user_id: None for user_id in missing}
+        cursor = User.get_pymongo_collection().find(
+            {"_id": {"$in": [ObjectId(user_id) for user_id in missing]}},
+            {"username": 1, "nickname": 1},
+        )
+        for raw in await cursor.to_list(length=None):
+            found[str(raw["_id"])] = raw.get("nickname") or raw.get("username")
+        if generation == _nicknames_generation:
+            if len(_nicknames) + len(found) > NICKNAME_CACHE_MAX:
+                _nicknames.clear()
+            _nicknames.update(found)
+    return {user_id: found[user_id] if user_id in found else _nicknames.get(user_id) for user_id in user_ids}
+
+
+def _authored(rows: List[dict]) -> List[dict]:
+    """created_by 가 있는 dict: 문서와 그 안의 댓글"""
+    authored = []
+    for row in rows:
+        if row.get("created_by"):
+            authored.append(row)
+        for comment in row.get("comments") or []:
+            if isinstance(comment, dict) and comment.get("created_by"):
+                authored.append(comment)
+    return authored
+
+
+async def attach_nicknames(content: Any, model: type) -> Any:
+    content = to_rows(content, model)
+    rows: List[dict] = content if isinstance(content, list) else [content]
+    authored = _authored(rows)
+    names = await nicknames(str(item["created_by"]) for item in authored)
+    for item in authored:
+        item["created_by_nickname"] = names.get(str(item["created_by"]))
+    return content
+
+
+async def resolve_names(content: Any, model: type, options: Set[str], code_fields: Optional[Dict[str, str]] = None) -> Any:
+    """parse_resolve 결과에 따라 이름을 붙임 (옵션이 없으면 content 그대로)"""
+    if "codes" in options and code_fields:
+        content = await attach_code_names(content, model, code_fields)
+    if "users" in options:
+        content = await attach_nicknames(content, model)
+    return content
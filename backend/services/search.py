@@ -0,0 +1,183 @@
+"""
+통합 검색 (search_entries 컬렉션 + text 인덱스).
+
+각 기록이 등록/수정/삭제될 때 index_document / remove_document 로 검색 문서를 갱신하고,
+/api/search 는 text 인덱스 한 번의 조회로 모든 종류의 결과를 점수순으로 돌려준다.
+서버 시작 시 sync_all() 이 원본과 개수가 맞지 않는 종류만 다시 색인한다. (SEARCH_REINDEX=1 이면 전체)
+
+이름/제목은 services.korean_index 메모리 색인에도 올려, 목록 API 의 name/title/q 검색이
+부분 글자·초성으로도 빠르게 찾도록 한다. (title_condition)
+"""
+
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from beanie import Document, PydanticObjectId
+
+from services import etag
+from services.korean_index import KoreanIndex
+
+from models.bucket import BucketList
+from models.cooking import Recipe
+from models.culture import CultureReview
+from models.diary import Diary
+from models.knitting import KnittingRecord
+from models.liquor import LiquorReview
+from models.review import Review
+from models.search import SearchEntry
+from models.travel import Travel
+
+SNIPPET_LENGTH = 80
+
+
+def _join(*parts) -> str:
+    """문자열/문자열 목록을 공백으로 이어 붙임 (빈 값 제외)"""
+    values = []
+    for part in parts:
+        if isinstance(part, (list, tuple)):
+            values.extend(str(p) for p in part if p)
+        elif part:
+            values.append(str(part))
+    return " ".join(values)
+
+
+@dataclass
+class SearchSource:
+    model: type
+    title_field: str                     # 이름/제목 필드
+    body: Callable[[Document], str]
+    path: str                            # 프론트엔드 상세 화면 경로
+    title_index: bool = False            # 이름/제목 메모리 색인 대상
+
+    def title(self, doc: Document) -> str:
+        return getattr(doc, self.title_field) or ""
+
+
+SOURCES: Dict[str, SearchSource] = {
+    "liquor": SearchSource(
+        LiquorReview, "name",
+        lambda d: _join(d.comment_husband, d.comment_wife, d.purchase_place, d.pairing_foods), "/liquor", True),
+    "diary": SearchSource(Diary, "title", lambda d: _join(d.content), "/diary", True),
+    "bucket": SearchSource(BucketList, "title", lambda d: _join(d.description), "/bucket"),
+    "knitting": SearchSource(
+        KnittingRecord, "name",
+        lambda d: _join(d.pattern.name, [y.name for y in d.yarns], d.tags, d.wife_comment, d.husband_comment),
+        "/knitting", True),
+    "culture": SearchSource(
+        CultureReview, "title", lambda d: _join(d.location, d.comment_husband, d.comment_wife), "/culture", True),
+    "recipe": SearchSource(Recipe, "name", lambda d: _join(d.description), "/cooking", True),
+    "review": SearchSource(
+        Review, "restaurant_name", lambda d: _join(d.location, d.husbandcomment, d.wifecomment), "/review", True),
+    "travel": SearchSource(Travel, "title", lambda d: _join(d.destination, d.description), "/travel"),
+}
+
+# 이름/제목 메모리 색인 (종류별)
+title_indexes: Dict[str, KoreanIndex] = {kind: KoreanIndex() for kind, source in SOURCES.items() if source.title_index}
+
+
+def build_entry(kind: str, doc: Document) -> SearchEntry:
+    source = SOURCES[kind]
+    return SearchEntry(kind=kind, ref_id=doc.id, title=source.title(doc), body=source.body(doc),
+                       updated_at=datetime.now())
+
+
+async def index_document(kind: str, doc: Document):
+    """등록/수정 후 호출. 색인 실패는 원본 저장을 막지 않음 (다음 시작 시 sync_all 이 보정)"""
+    if kind in title_indexes:
+        title_indexes[kind].add(str(doc.id), SOURCES[kind].title(doc))
+    try:
+        entry = build_entry(kind, doc)
+        await SearchEntry.find_one(SearchEntry.kind == kind, SearchEntry.ref_id == doc.id).upsert(
+            {"$set": {"title": entry.title, "body": entry.body, "updated_at": entry.updated_at}},
+            on_insert=entry,
+        )
+    except Exception as e:
+        print(f"⚠️ 검색 색인 실패 ({kind} {doc.id}): {e}")
+    # 검색 문서/이름 색인은 원본 저장보다 늦게 바뀌므로 여기서 한 번 더 ETag 무효화
+    etag.bump(SearchEntry, SOURCES[kind].model)
+
+
+async def remove_document(kind: str, ref_id: PydanticObjectId):
+    if kind in title_indexes:
+        title_indexes[kind].remove(str(ref_id))
+    try:
+        await SearchEntry.find(SearchEntry.kind == kind, SearchEntry.ref_id == ref_id).delete()
+    except Exception as e:
+        print(f"⚠️ 검색 색인 삭제 실패 ({kind} {ref_id}): {e}")
+    etag.bump(SearchEntry, SOURCES[kind].model)
+
+
+async def reindex_kind(kind: str) -> int:
+    model = SOURCES[kind].model
+    await SearchEntry.find(SearchEntry.kind == kind).delete()
+    entries = [build_entry(kind, doc) for doc in await model.find_all().to_list()]
+    if entries:
+        await SearchEntry.insert_many(entries)
+    etag.bump(SearchEntry)
+    return len(entries)
+
+
+async def sync_all():
+    """서버 시작 시 호출: 원본 문서 수와 색인 수가 다른 종류만 다시 색인"""
+    force = os.getenv("SEARCH_REINDEX") == "1"
+    for kind, source in SOURCES.items():
+        if not force and await source.model.count() == await SearchEntry.find(SearchEntry.kind == kind).count():
+            continue
+        count = await reindex_kind(kind)
+        print(f"🔎 검색 색인 갱신: {kind} {count}건")
+
+
+async def build_title_indexes():
+    """서버 시작 시 호출: 이름/제목만 읽어 메모리 색인 생성"""
+    for kind, index in title_indexes.items():
+        source = SOURCES[kind]
+        cursor = source.model.get_pymongo_collection().find({}, {source.title_field: 1})
+        for raw in await cursor.to_list(length=None):
+            index.add(str(raw["_id"]), raw.get(source.title_field) or "")
+        index.ready = True
+    print(f"🔤 이름/제목 검색 색인 생성: {', '.join(f'{k} {len(i.texts)}건' for k, i in title_indexes.items())}")
+
+
+def title_condition(kind: str, q: str) -> dict:
+    """목록 API 의 이름/제목 검색 조건. 색인이 준비되지 않았으면 기존 정규식 검색"""
+    index = title_indexes[kind]
+    if not index.ready:
+        return {SOURCES[kind].title_field: {"$regex": q, "$options": "i"}}
+    return {"_id": {"$in": [PydanticObjectId(doc_id) for doc_id in index.search(q)]}}
+
+
+def make_snippet(text: str, q: str, length: int = SNIPPET_LENGTH) -> str:
+    """검색어가 처음 나오는 위치 주변을 잘라 반환 (없으면 앞부분)"""
+    text = " ".join((text or "").split())
+    if len(text) <= length:
+        return text
+    lowered = text.lower()
+    positions = [lowered.find(term) for term in q.lower().split() if term]
+    positions = [p for p in positions if p >= 0]
+    start = max(0, min(positions) - length // 4) if positions else 0
+    snippet = text[start:start + length]
+    return ("…" if start > 0 else "") + snippet + ("…" if start + length < len(text) else "")
+
+
+async def search(q: str, kinds: Optional[List[str]] = None, limit: int = 20) -> List[dict]:
+    """text 인덱스 한 번 조회로 점수순 결과 반환"""
+    query: dict = {"$text": {"$search": q}}
+    if kinds:
+        query["kind"] = {"$in": kinds}
+    cursor = SearchEntry.get_pymongo_collection().find(
+        query, {"kind": 1, "ref_id": 1, "title": 1, "body": 1, "score": {"$meta": "textScore"}},
+    ).sort([("score", {"$meta": "textScore"})]).limit(limit)
+
+    hits = []
+    for raw in await cursor.to_list(length=limit):
+        hits.append({
+            "kind": raw["kind"],
+            "id": str(raw["ref_id"]),
+            "title": raw.get("title", ""),
+            "snippet": make_snippet(raw.get("body", ""), q),  # 제목에만 걸리면 본문 앞부분
+            "score": round(raw.get("score", 0.0), 3),
+            "path": f"{SOURCES[raw['kind']].path}/{raw['ref_id']}",
+        })
+    return hits
@@ -0,0 +1,115 @@
+"""
+API 응답 직렬화 빠른 경로.
+
+response_model 이 있는 엔드포인트는 반환값을 FastAPI 가 응답 모델로 한 번 더 검증한 뒤 직렬화한다.
+DB 에서 읽은 신뢰할 수 있는 결과는 fast_response 로 그 단계를 건너뛴다.
+
+- Document(들): 모델별로 미리 만든 TypeAdapter 의 dump_json (검증 없이 바로 JSON)
+- 프로젝션 조회 결과(원본 dict): 모델 객체로 만들지 않고 orjson 으로 바로 인코딩
+- ObjectId/PydanticObjectId → 문자열, datetime → ISO 문자열 (기존 응답과 같은 모양)
+
+response_model 은 OpenAPI 문서용으로 데코레이터에 그대로 둔다.
+"""
+
+import time
+from functools import lru_cache
+from typing import Any, List, Optional
+
+import orjson
+from bson import ObjectId
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, ObjectId):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+@lru_cache(maxsize=None)
+def adapter_for(model: type) -> TypeAdapter:
+    return TypeAdapter(model)
+
+
+@lru_cache(maxsize=None)
+def list_adapter_for(model: type) -> TypeAdapter:
+    return TypeAdapter(List[model])
+
+
+def warm_up(models: List[type]):
+    """서버 시작 시 호출: 모델별 TypeAdapter 를 미리 생성"""
+    for model in models:
+        adapter_for(model)
+        list_adapter_for(model)
+
+
+def render(content: Any, model: type) -> bytes:
+    """Document / Document 목록 / 원본 dict (목록) 을 검증 없이 JSON 으로"""
+    if isinstance(content, BaseModel):
+        return adapter_for(model).dump_json(content, by_alias=True)
+    if isinstance(content, list) and content and isinstance(content[0], BaseModel):
+        return list_adapter_for(model).dump_json(content, by_alias=True)
+    return dumps(content)
+
+
+def fast_response(content: Any, model: type, response: Optional[Response] = None) -> Response:
+    """검증 없이 바로 JSON 응답. response 로 설정한 헤더(X-Next-Cursor 등)는 옮겨 담음"""
+    result = Response(content=render(content, model), media_type="application/json")
+    if response is not None:
+        for key, value in response.headers.items():
+            if key != "content-length":
+                result.headers[key] = value
+    return result
+
+
+async def _benchmark(rows: int = 2000, rounds: int = 20):
+    """python -m services.serialization : FastAPI 기본 경로(응답 검증 + 직렬화) vs 빠른 경로 (MONGODB_URL 필요)"""
+    from datetime import datetime
+    from fastapi.routing import serialize_response
+    from fastapi.utils import create_model_field
+
+    from beanie import PydanticObjectId
+    from database import init_db
+    from models.liquor import LiquorReview
+
+    await init_db()
+    docs = [
+        LiquorReview(
+            id=PydanticObjectId(), name=f"술{i}", category="WINE", price=10000 + i, visit_date="2024-01-01",
+            pairing_foods=["치즈", "스테이크"], image_urls=["https://example.com/a.jpg"],
+            rating_husband=4.5, rating_wife=4.0, comment_husband="맛있다" * 10, comment_wife="향이 좋다" * 10,
+            created_at=datetime.now(), created_by=PydanticObjectId(),
+        )
+        for i in range(rows)
+    ]
+    # 요약 프로젝션 조회 결과와 같은 모양의 원본 dict
+    raw_rows = [{"_id": d.id, **d.model_dump(include={"name", "category", "price", "visit_date", "rating",
+                                                       "image_urls", "created_at"})} for d in docs]
+    field = create_model_field("Response_get_liquors", List[LiquorReview], mode="serialization")
+    warm_up([LiquorReview])
+
+    for label, content, exclude_unset in (("Document", docs, False), ("프로젝션 dict", raw_rows, True)):
+        started = time.perf_counter()
+        for _ in range(rounds):
+            body = await serialize_response(field=field, response_content=content,
+                                            exclude_unset=exclude_unset, dump_json=True)
+        default_ms = (time.perf_counter() - started) / rounds * 1000
+
+        started = time.perf_counter()
+        for _ in range(rounds):
+            fast_body = fast_response(content, LiquorReview).body
+        fast_ms = (time.perf_counter() - started) / rounds * 1000
+
+        same = orjson.loads(fast_body) == orjson.loads(body)
+        print(f"{label} {rows}건: 기본 {default_ms:.1f}ms / 빠른 경로 {fast_ms:.1f}ms (응답 동일: {same})")
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    asyncio.run(_benchmark())
@@ -0,0 +1,36 @@
+"""
+MongoDB 트랜잭션 실행.
+
+- 레플리카셋/mongos (Atlas 등): 세션 트랜잭션으로 묶어 전부 반영되거나 전부 취소
+  일시적 오류(TransientTransactionError 등)는 드라이버 with_transaction 이 재시도
+- 단독 서버(로컬 mongod 등)는 트랜잭션을 지원하지 않으므로, 첫 실패를 보고 이후 세션 없이 실행 (경고 한 번)
+- DB_TRANSACTIONS=0 이면 항상 세션 없이 실행
+
+operations 는 세션(또는 None)을 받아 모든 DB 호출에 session= 으로 넘겨야 한다.
+재시도될 수 있으므로 DB 밖의 부수 효과(캐시 무효화 등)는 run_transaction 이 끝난 뒤에 할 것.
+"""
+
+import os
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from pymongo.errors import OperationFailure
+
+T = TypeVar("T")
+
+ILLEGAL_OPERATION = 20  # 단독 서버에서 트랜잭션을 쓰면 나는 오류 코드
+
+_supported = os.getenv("DB_TRANSACTIONS", "1") != "0"
+
+
+async def run_transaction(client: Any, operations: Callable[[Optional[Any]], Awaitable[T]]) -> T:
+    global _supported
+    if _supported:
+        try:
+            async with await client.start_session() as session:
+                return await session.with_transaction(operations)
+        except OperationFailure as e:
+            if e.code != ILLEGAL_OPERATION:
+                raise
+            _supported = False
+            print("⚠️ MongoDB 가 트랜잭션을 지원하지 않아(레플리카셋 아님) 세션 없이 실행합니다.")
+    return await operations(None)
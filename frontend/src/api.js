@@ -9,3 +9,21 @@ const apiClient = axios.create({
 });
 
 export default apiClient;
+
+// 공통 코드 여러 그룹 한 번에 조회: { 그룹코드: [코드...] }
+// 서버가 준 코드 버전(X-Code-Version)을 v 로 붙이면 브라우저가 응답을 오래 캐시함
+let codeVersion = null;
+
+export const fetchCodeGroups = async (groupCodes) => {
+  const params = { g: groupCodes.join(',') };
+  if (codeVersion) params.v = codeVersion;
+  const res = await apiClient.get('/code/groups', { params });
+  codeVersion = res.headers['x-code-version'] || codeVersion;
+  return res.data;
+};
+
+// 코드 등록/수정/삭제 후에는 버전을 잊고 다시 받아옴 (캐시된 옛 버전 사용 방지)
+apiClient.interceptors.response.use((res) => {
+  if (res.config.method !== 'get' && res.config.url?.startsWith('/code')) codeVersion = null;
+  return res;
+});
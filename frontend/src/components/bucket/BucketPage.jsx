@@ -4,6 +4,8 @@ import apiClient from '../../api';
 import useBucketCodes from '../../hooks/useBucketCodes';
 import { useAuth } from '../../context/AuthContext';
 import { useToast } from '../common/Toast';
+import useInfiniteList from '../../hooks/useInfiniteList';
+import ListSentinel from '../common/ListSentinel';
 import './Bucket.scss';
 
 const BucketPage = () => {
@@ -11,7 +13,9 @@ const BucketPage = () => {
   const { getAuthorName } = useAuth();
   const toast = useToast();
   const { categories, statuses, loading: codesLoading, getCategoryLabel } = useBucketCodes();
-  const [buckets, setBuckets] = useState([]);
+  const { items: buckets, loadingMore, hasMore, load, sentinelRef } = useInfiniteList('/bucket', {
+    onError: () => toast.error('버킷리스트를 불러오지 못했습니다.')
+  });
   const [stats, setStats] = useState({ total: 0, not_started: 0, active: 0, completed: 0, rate: 0 });
   const [keyword, setKeyword] = useState('');
   const [category, setCategory] = useState('');
@@ -24,11 +28,11 @@ const BucketPage = () => {
       if (category) params.category = category;
       if (status !== 'all') params.status = status;
 
-      const [bucketsRes, statsRes] = await Promise.all([
-        apiClient.get('/bucket', { params }),
+      // 목록은 첫 페이지만 (이후 페이지는 스크롤 시 이어서)
+      const [, statsRes] = await Promise.all([
+        load(params),
         apiClient.get('/bucket/stats')
       ]);
-      setBuckets(bucketsRes.data);
       setStats(statsRes.data);
     } catch (err) {
       console.error(err);
@@ -151,7 +155,7 @@ const BucketPage = () => {
                   <span>📅 {bucket.target_date || '미정'}</span>
                 )}
                 <span>👤 {getAuthorName(bucket.created_by)}</span>
-                <span>💬 {bucket.comments?.length || 0}</span>
+                <span>💬 {bucket.comment_count ?? bucket.comments?.length ?? 0}</span>
               </div>
             </div>
             <div className="progress-bar">
@@ -162,6 +166,7 @@ const BucketPage = () => {
         {buckets.length === 0 && (
           <div className="empty-message">버킷리스트가 없습니다. 새로 추가해보세요!</div>
         )}
+        <ListSentinel hasMore={hasMore} loadingMore={loadingMore} sentinelRef={sentinelRef} />
       </div>
     </div>
   );
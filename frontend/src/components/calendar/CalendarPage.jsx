@@ -12,6 +12,7 @@ const CalendarPage = () => {
   const [currentMonth, setCurrentMonth] = useState(today.getMonth() + 1);
   const [events, setEvents] = useState([]);
   const [holidays, setHolidays] = useState([]);
+  const holidayYearsRef = useRef(new Set()); // 이미 받아온 공휴일 연도
   const [selectedDate, setSelectedDate] = useState(null);
   const calendarWrapperRef = useRef(null);
   const [calendarScale, setCalendarScale] = useState(1);
@@ -30,11 +31,18 @@ const CalendarPage = () => {
     return () => window.removeEventListener('resize', updateScale);
   }, []);
 
-  // 공휴일 조회
+  // 공휴일 조회 (전년도~다음 해를 한 번에 받아두고, 이미 받은 연도는 다시 요청하지 않음)
   const fetchHolidays = async () => {
+    if (holidayYearsRef.current.has(currentYear)) return;
+    const from = currentYear - 1;
+    const to = currentYear + 1;
     try {
-      const res = await apiClient.get(`/calendar/holidays/${currentYear}`);
-      setHolidays(res.data);
+      const res = await apiClient.get('/calendar/holidays', { params: { from, to } });
+      for (let y = from; y <= to; y++) holidayYearsRef.current.add(y);
+      setHolidays(prev => {
+        const known = new Set(prev.map(h => `${h.date}|${h.name}`));
+        return [...prev, ...res.data.filter(h => !known.has(`${h.date}|${h.name}`))];
+      });
     } catch (err) {
       console.error(err);
     }
@@ -57,7 +65,7 @@ const CalendarPage = () => {
     setSelectedDate(null);
   }, [currentYear, currentMonth]);
 
-  // 연도 변경 시 공휴일 새로 조회
+  // 연도 변경 시 공휴일 조회 (캐시에 없을 때만)
   useEffect(() => {
     fetchHolidays();
   }, [currentYear]);
@@ -0,0 +1,12 @@
+import './ListSentinel.scss';
+
+// 무한 스크롤 목록 끝 표시 (useInfiniteList 의 sentinelRef 연결)
+// 불러오는 동안 관찰을 끊었다가 다시 연결 → 끝이 아직 화면 안이면 바로 다음 페이지를 이어서 조회
+export default function ListSentinel({ hasMore, loadingMore, sentinelRef }) {
+  if (!hasMore) return null;
+  return (
+    <div ref={loadingMore ? null : sentinelRef} className="list-sentinel">
+      {loadingMore ? '불러오는 중...' : ''}
+    </div>
+  );
+}
@@ -3,14 +3,17 @@ import { useNavigate } from 'react-router-dom';
 import apiClient from '../../api';
 import { useAuth } from '../../context/AuthContext';
 import { useToast } from '../common/Toast';
+import useInfiniteList from '../../hooks/useInfiniteList';
+import ListSentinel from '../common/ListSentinel';
 import './Cooking.scss';
 
 function CookingPage() {
   const navigate = useNavigate();
   const { userMap, getAuthorName } = useAuth();
   const toast = useToast();
-  const [recipes, setRecipes] = useState([]);
-  const [loading, setLoading] = useState(true);
+  const { items: recipes, loading, loadingMore, hasMore, load, sentinelRef } = useInfiniteList('/cooking', {
+    onError: () => toast.error('요리 목록을 불러오지 못했습니다.')
+  });
 
   const [filters, setFilters] = useState({
     created_by: 'all',
@@ -37,23 +40,14 @@ function CookingPage() {
     } catch (err) { console.error(err); }
   };
 
-  const fetchRecipes = async () => {
-    setLoading(true);
-    try {
-      const params = {};
-      if (filters.created_by && filters.created_by !== 'all') params.created_by = filters.created_by;
-      if (filters.cooking_type && filters.cooking_type !== '전체') params.cooking_type = filters.cooking_type;
-      if (filters.name) params.name = filters.name;
-      if (filters.description) params.description = filters.description;
-
-      const res = await apiClient.get('/cooking', { params });
-      setRecipes(res.data);
-    } catch (err) {
-      console.error(err);
-      toast.error('요리 목록을 불러오지 못했습니다.');
-    } finally {
-      setLoading(false);
-    }
+  // 조건이 바뀌면 첫 페이지부터 다시 조회 (이후 페이지는 스크롤 시 이어서)
+  const fetchRecipes = () => {
+    const params = {};
+    if (filters.created_by && filters.created_by !== 'all') params.created_by = filters.created_by;
+    if (filters.cooking_type && filters.cooking_type !== '전체') params.cooking_type = filters.cooking_type;
+    if (filters.name) params.name = filters.name;
+    if (filters.description) params.description = filters.description;
+    return load(params);
   };
 
   const handleFilterChange = (e) => {
@@ -176,6 +170,7 @@ function CookingPage() {
         {!loading && recipes.length === 0 && (
           <div className="empty-message">검색 결과가 없습니다.</div>
         )}
+        {!loading && <ListSentinel hasMore={hasMore} loadingMore={loadingMore} sentinelRef={sentinelRef} />}
       </div>
     </div>
   );
@@ -2,14 +2,17 @@ import { useState, useEffect } from 'react'
 import { useNavigate } from 'react-router-dom'
 import apiClient from '../../api'
 import { useToast } from '../common/Toast'
+import useInfiniteList from '../../hooks/useInfiniteList'
+import ListSentinel from '../common/ListSentinel'
 import './Culture.scss'
 
 function CulturePage() {
-  const [cultures, setCultures] = useState([])
   const [categories, setCategories] = useState([])
-  const [loading, setLoading] = useState(true)
   const navigate = useNavigate()
   const toast = useToast()
+  const { items: cultures, loading, loadingMore, hasMore, load, sentinelRef } = useInfiniteList('/culture', {
+    onError: () => toast.error('문화생활 목록을 불러오지 못했습니다.')
+  })
 
   const [filters, setFilters] = useState({
     title: '', category: '', location: '', comment: '',
@@ -28,23 +31,14 @@ function CulturePage() {
     catch (err) { console.error(err) }
   }
 
-  const fetchCultures = async (overrideFilters = null) => {
-    setLoading(true)
-    try {
-      const current = overrideFilters || filters
-      const params = {}
-      Object.keys(current).forEach(key => {
-        if (current[key] !== '' && current[key] !== null) params[key] = current[key]
-      })
-      const res = await apiClient.get('/culture', { params })
-      setCultures(res.data)
-    } catch (err) {
-      console.error(err)
-      setCultures([])
-      toast.error('문화생활 목록을 불러오지 못했습니다.')
-    } finally {
-      setLoading(false)
-    }
+  // 조건이 바뀌면 첫 페이지부터 다시 조회 (이후 페이지는 스크롤 시 이어서)
+  const fetchCultures = (overrideFilters = null) => {
+    const current = overrideFilters || filters
+    const params = {}
+    Object.keys(current).forEach(key => {
+      if (current[key] !== '' && current[key] !== null) params[key] = current[key]
+    })
+    return load(params)
   }
 
   const handleChange = (e) => {
@@ -166,6 +160,7 @@ function CulturePage() {
           )
         })}
         {!loading && cultures.length === 0 && <div className="empty-message">검색 결과가 없습니다.</div>}
+        {!loading && <ListSentinel hasMore={hasMore} loadingMore={loadingMore} sentinelRef={sentinelRef} />}
       </div>
     </div>
   )
@@ -1,34 +1,31 @@
 import { useState, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
-import apiClient from '../../api';
 import { useAuth } from '../../context/AuthContext';
 import { useToast } from '../common/Toast';
+import useInfiniteList from '../../hooks/useInfiniteList';
+import ListSentinel from '../common/ListSentinel';
 import './Diary.scss';
 
 const DiaryPage = () => {
   const navigate = useNavigate();
   const { userMap, getAuthorName } = useAuth();
   const toast = useToast();
-  const [diaries, setDiaries] = useState([]);
+  const { items: diaries, loadingMore, hasMore, load, sentinelRef } = useInfiniteList('/diary', {
+    onError: () => toast.error('글 목록을 불러오지 못했습니다.')
+  });
   const [keyword, setKeyword] = useState('');
   const [author, setAuthor] = useState('');
   const [dateFrom, setDateFrom] = useState('');
   const [dateTo, setDateTo] = useState('');
 
-  const fetchData = async () => {
-    try {
-      const params = {};
-      if (keyword) params.keyword = keyword;
-      if (author) params.created_by = author;
-      if (dateFrom) params.date_from = dateFrom;
-      if (dateTo) params.date_to = dateTo;
-
-      const res = await apiClient.get('/diary', { params });
-      setDiaries(res.data);
-    } catch (err) {
-      console.error(err);
-      toast.error('글 목록을 불러오지 못했습니다.');
-    }
+  // 조건이 바뀌면 첫 페이지부터 다시 조회 (이후 페이지는 스크롤 시 이어서)
+  const fetchData = () => {
+    const params = {};
+    if (keyword) params.keyword = keyword;
+    if (author) params.created_by = author;
+    if (dateFrom) params.date_from = dateFrom;
+    if (dateTo) params.date_to = dateTo;
+    return load(params);
   };
 
   useEffect(() => {
@@ -135,7 +132,7 @@ const DiaryPage = () => {
               <div className="diary-preview">{diary.content?.slice(0, 100)}...</div>
               <div className="diary-meta">
                 <span className="author-tag">👤 {getAuthorName(diary.created_by)}</span>
-                <span>💬 {diary.comments?.length || 0}</span>
+                <span>💬 {diary.comment_count ?? diary.comments?.length ?? 0}</span>
               </div>
             </div>
           </div>
@@ -143,6 +140,7 @@ const DiaryPage = () => {
         {diaries.length === 0 && (
           <div className="empty-message">아직 작성된 글이 없어요. 먼저 한마디 남겨보세요!</div>
         )}
+        <ListSentinel hasMore={hasMore} loadingMore={loadingMore} sentinelRef={sentinelRef} />
       </div>
     </div>
   );
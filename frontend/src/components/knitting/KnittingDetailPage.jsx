@@ -1,6 +1,6 @@
 import React, { useEffect, useState } from 'react';
 import { useNavigate, useParams } from 'react-router-dom';
-import apiClient from '../../api';
+import apiClient, { fetchCodeGroups } from '../../api';
 import { useAuth } from '../../context/AuthContext';
 import './Knitting.scss';
 
@@ -54,10 +54,10 @@ function KnittingDetailPage() {
       ['YARN_UNIT',          'unit'],
       ['CURRENCY',           'currency'],
     ];
-    Promise.all(groups.map(([g]) => apiClient.get(`/code/group/${g}`)))
-      .then(results => {
+    fetchCodeGroups(groups.map(([g]) => g))
+      .then(data => {
         const next = {};
-        results.forEach((res, i) => { next[groups[i][1]] = res.data; });
+        groups.forEach(([g, key]) => { next[key] = data[g] || []; });
         setCodes(next);
       });
   }, [id]);
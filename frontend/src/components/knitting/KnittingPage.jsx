@@ -2,6 +2,8 @@ import React, { useState, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
 import apiClient from '../../api';
 import { useAuth } from '../../context/AuthContext';
+import useInfiniteList from '../../hooks/useInfiniteList';
+import ListSentinel from '../common/ListSentinel';
 import './Knitting.scss';
 
 const STATUS_LABEL = { WAIT: '대기', CO: 'CO', WIP: 'WIP', FO: 'FO' };
@@ -9,7 +11,7 @@ const STATUS_LABEL = { WAIT: '대기', CO: 'CO', WIP: 'WIP', FO: 'FO' };
 function KnittingPage() {
   const navigate = useNavigate();
   const { getAuthorName } = useAuth();
-  const [records, setRecords] = useState([]);
+  const { items: records, loadingMore, hasMore, load, sentinelRef } = useInfiniteList('/knitting');
   const [categories, setCategories] = useState([]);
   const [filters, setFilters] = useState({ q: '', status: '', category: '', sort: 'recent' });
 
@@ -25,19 +27,14 @@ function KnittingPage() {
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [filters.status, filters.category, filters.sort]);
 
-  const fetchRecords = async () => {
-    try {
-      const params = {};
-      if (filters.q) params.q = filters.q;
-      if (filters.status) params.status = filters.status;
-      if (filters.category) params.category = filters.category;
-      if (filters.sort) params.sort = filters.sort;
-
-      const res = await apiClient.get('/knitting', { params });
-      setRecords(res.data);
-    } catch (err) {
-      console.error(err);
-    }
+  // 조건이 바뀌면 첫 페이지부터 다시 조회 (이후 페이지는 스크롤 시 이어서)
+  const fetchRecords = () => {
+    const params = {};
+    if (filters.q) params.q = filters.q;
+    if (filters.status) params.status = filters.status;
+    if (filters.category) params.category = filters.category;
+    if (filters.sort) params.sort = filters.sort;
+    return load(params);
   };
 
   const handleChange = (e) => {
@@ -119,6 +116,7 @@ function KnittingPage() {
         {records.length === 0 && (
           <div className="empty-message">검색 결과가 없습니다.</div>
         )}
+        <ListSentinel hasMore={hasMore} loadingMore={loadingMore} sentinelRef={sentinelRef} />
       </div>
     </div>
   );
@@ -1,6 +1,6 @@
 import { useState, useEffect } from 'react'
 import { useParams, useNavigate } from 'react-router-dom'
-import apiClient from '../../api'
+import apiClient, { fetchCodeGroups } from '../../api'
 import { useToast } from '../common/Toast'
 import { useConfirm } from '../common/ConfirmDialog'
 import './Liquor.scss'
@@ -23,23 +23,31 @@ function LiquorDetailPage() {
   const [submitting, setSubmitting] = useState(false)
 
   useEffect(() => {
-    fetchCategories()
-    fetchWineTypes()
+    fetchCodes()
     fetchLiquor()
-
-    const interval = setInterval(() => {
-      setLiquor(prev => {
-        if (prev && prev.ai_note && prev.ai_note.status === 'PENDING') {
-          fetchLiquor(true)
-        }
-        return prev
-      })
-    }, 5000)
-    return () => clearInterval(interval)
   }, [id])
 
-  const fetchCategories = async () => { try { const res = await apiClient.get('/code/group/SUL'); setCategories(res.data) } catch (err) { console.error(err) } }
-  const fetchWineTypes = async () => { try { const res = await apiClient.get('/code/group/WINE_C'); setWineTypes(res.data) } catch (err) { console.error(err) } }
+  // AI 분석 대기 중이면 서버가 결과를 밀어줄 때까지 SSE 구독 (폴링 대신)
+  const aiPending = liquor?.ai_note?.status === 'PENDING'
+  useEffect(() => {
+    if (!aiPending) return
+    const source = new EventSource(`${apiClient.defaults.baseURL}/liquor/${id}/ai-status/stream`)
+    source.addEventListener('ai_note', (e) => {
+      const aiNote = JSON.parse(e.data)
+      setLiquor(prev => (prev ? { ...prev, ai_note: aiNote } : prev))
+      setEditData(prev => (prev ? { ...prev, ai_note: aiNote } : prev))
+      source.close()
+    })
+    return () => source.close()
+  }, [id, aiPending])
+
+  const fetchCodes = async () => {
+    try {
+      const codes = await fetchCodeGroups(['SUL', 'WINE_C'])
+      setCategories(codes.SUL)
+      setWineTypes(codes.WINE_C)
+    } catch (err) { console.error(err) }
+  }
 
   const fetchLiquor = async (silent = false) => {
     try {
@@ -1,6 +1,6 @@
 import { useState, useEffect } from 'react'
 import { useNavigate } from 'react-router-dom'
-import apiClient from '../../api'
+import apiClient, { fetchCodeGroups } from '../../api'
 import { useToast } from '../common/Toast'
 import './Liquor.scss'
 
@@ -21,25 +21,20 @@ function LiquorInsertPage() {
   })
 
   useEffect(() => {
-    fetchCategories()
-    fetchWineTypes()
+    fetchCodes()
   }, [])
 
-  const fetchCategories = async () => {
+  const fetchCodes = async () => {
     try {
-      const res = await apiClient.get('/code/group/SUL')
-      setCategories(res.data)
-      if (res.data.length > 0 && !formData.category) {
-        setFormData(prev => ({ ...prev, category: res.data[0].code_id }))
+      const codes = await fetchCodeGroups(['SUL', 'WINE_C'])
+      setCategories(codes.SUL)
+      setWineTypes(codes.WINE_C)
+      if (codes.SUL.length > 0 && !formData.category) {
+        setFormData(prev => ({ ...prev, category: codes.SUL[0].code_id }))
       }
     } catch (err) { console.error(err) }
   }
 
-  const fetchWineTypes = async () => {
-    try { const res = await apiClient.get('/code/group/WINE_C'); setWineTypes(res.data) }
-    catch (err) { console.error(err) }
-  }
-
   const handleChange = (e) => {
     const { name, value } = e.target
     setFormData({ ...formData, [name]: value })
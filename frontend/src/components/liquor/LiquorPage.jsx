@@ -1,16 +1,19 @@
 import { useState, useEffect } from 'react'
 import { useNavigate } from 'react-router-dom'
-import apiClient from '../../api'
+import { fetchCodeGroups } from '../../api'
 import { useToast } from '../common/Toast'
+import useInfiniteList from '../../hooks/useInfiniteList'
+import ListSentinel from '../common/ListSentinel'
 import './Liquor.scss'
 
 function LiquorPage() {
-  const [liquors, setLiquors] = useState([])
   const [categories, setCategories] = useState([])
   const [wineTypes, setWineTypes] = useState([])
-  const [loading, setLoading] = useState(true)
   const navigate = useNavigate()
   const toast = useToast()
+  const { items: liquors, loading, loadingMore, hasMore, load, sentinelRef } = useInfiniteList('/liquor', {
+    onError: () => toast.error('주류 목록을 불러오지 못했습니다.')
+  })
 
   const [filters, setFilters] = useState({
     name: '', category: '', wine_type: '', purchase_place: '', pairing_food: '', comment: '',
@@ -21,38 +24,26 @@ function LiquorPage() {
   const [showFilter, setShowFilter] = useState(true)
 
   useEffect(() => {
-    fetchCategories()
-    fetchWineTypes()
+    fetchCodes()
     fetchLiquors()
   }, [])
 
-  const fetchCategories = async () => {
-    try { const res = await apiClient.get('/code/group/SUL'); setCategories(res.data) }
-    catch (err) { console.error(err) }
-  }
-
-  const fetchWineTypes = async () => {
-    try { const res = await apiClient.get('/code/group/WINE_C'); setWineTypes(res.data) }
-    catch (err) { console.error(err) }
+  const fetchCodes = async () => {
+    try {
+      const codes = await fetchCodeGroups(['SUL', 'WINE_C'])
+      setCategories(codes.SUL)
+      setWineTypes(codes.WINE_C)
+    } catch (err) { console.error(err) }
   }
 
-  const fetchLiquors = async (overrideFilters = null) => {
-    setLoading(true)
-    try {
-      const current = overrideFilters || filters
-      const params = {}
-      Object.keys(current).forEach(key => {
-        if (current[key] !== '' && current[key] !== null) params[key] = current[key]
-      })
-      const res = await apiClient.get('/liquor', { params })
-      setLiquors(res.data)
-    } catch (err) {
-      console.error(err)
-      setLiquors([])
-      toast.error('주류 목록을 불러오지 못했습니다.')
-    } finally {
-      setLoading(false)
-    }
+  // 조건이 바뀌면 첫 페이지부터 다시 조회 (이후 페이지는 스크롤 시 이어서)
+  const fetchLiquors = (overrideFilters = null) => {
+    const current = overrideFilters || filters
+    const params = {}
+    Object.keys(current).forEach(key => {
+      if (current[key] !== '' && current[key] !== null) params[key] = current[key]
+    })
+    return load(params)
   }
 
   const handleChange = (e) => {
@@ -201,6 +192,7 @@ function LiquorPage() {
           )
         })}
         {!loading && liquors.length === 0 && <div className="empty-message">검색 결과가 없습니다.</div>}
+        {!loading && <ListSentinel hasMore={hasMore} loadingMore={loadingMore} sentinelRef={sentinelRef} />}
       </div>
     </div>
   )
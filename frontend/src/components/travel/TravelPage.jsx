@@ -1,35 +1,22 @@
-import { useState, useEffect } from 'react'
+import { useEffect } from 'react'
 import { useNavigate } from 'react-router-dom'
-import apiClient from '../../api';
 import { useToast } from '../common/Toast'
+import useInfiniteList from '../../hooks/useInfiniteList'
+import ListSentinel from '../common/ListSentinel'
 
 function TravelPage() {
-  const [travels, setTravels] = useState([])
-  const [loading, setLoading] = useState(true)
   const navigate = useNavigate()
   const toast = useToast()
+  const { items: travels, loading, loadingMore, hasMore, load, sentinelRef } = useInfiniteList('/travel/', {
+    onError: () => toast.error('여행 목록을 불러오지 못했습니다.')
+  })
 
   useEffect(() => {
     fetchTravels()
   }, [])
 
-  const fetchTravels = async () => {
-    setLoading(true)
-    try {
-      const response = await apiClient.get('/travel/');
-      // 날짜순 정렬 (최신순)
-      const sortedData = response.data.sort((a, b) =>
-        new Date(b.start_date) - new Date(a.start_date)
-      )
-      setTravels(sortedData)
-    } catch (error) {
-      console.error('여행 목록 로딩 실패:', error)
-      setTravels([])
-      toast.error('여행 목록을 불러오지 못했습니다.')
-    } finally {
-      setLoading(false)
-    }
-  }
+  // 출발일 최신순 (서버 정렬, 이후 페이지는 스크롤 시 이어서)
+  const fetchTravels = () => load({ sort: 'start_date' })
 
   // D-Day 계산
   const getDDay = (startDate) => {
@@ -178,6 +165,7 @@ function TravelPage() {
           )
         })}
       </div>
+      <ListSentinel hasMore={hasMore} loadingMore={loadingMore} sentinelRef={sentinelRef} />
 
       {travels.length === 0 && (
         <div style={{textAlign:'center', padding:'60px', color:'#999'}}>
@@ -0,0 +1,94 @@
+import { useState, useRef, useCallback, useEffect } from 'react';
+import apiClient from '../api';
+
+const PAGE_SIZE = 20;
+
+// 커서 기반 목록 조회 + 무한 스크롤 커스텀 훅
+// - load(params): 조건을 바꿔 첫 페이지부터 다시 조회
+// - sentinelRef: 목록 끝 요소에 달면 화면에 보일 때 다음 페이지(X-Next-Cursor)를 이어서 조회
+const useInfiniteList = (path, { pageSize = PAGE_SIZE, onError } = {}) => {
+  const [items, setItems] = useState([]);
+  const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [nextCursor, setNextCursor] = useState(null);
+
+  const paramsRef = useRef({});
+  const requestRef = useRef(0);     // 조건이 바뀌면 이전 요청 응답은 버림
+  const loadingMoreRef = useRef(false);
+  const onErrorRef = useRef(onError);
+  onErrorRef.current = onError;
+
+  const fetchPage = async (params, cursor) => {
+    const res = await apiClient.get(path, {
+      params: { ...params, limit: pageSize, ...(cursor ? { cursor } : {}) }
+    });
+    return { data: res.data, next: res.headers['x-next-cursor'] || null };
+  };
+
+  const load = useCallback(async (params = {}) => {
+    const requestId = ++requestRef.current;
+    paramsRef.current = params;
+    setLoading(true);
+    try {
+      const { data, next } = await fetchPage(params, null);
+      if (requestId !== requestRef.current) return;
+      setItems(data);
+      setNextCursor(next);
+    } catch (err) {
+      if (requestId !== requestRef.current) return;
+      console.error(err);
+      setItems([]);
+      setNextCursor(null);
+      onErrorRef.current?.(err);
+    } finally {
+      if (requestId === requestRef.current) setLoading(false);
+    }
+  }, [path, pageSize]);
+
+  const loadMore = async () => {
+    if (!nextCursor || loadingMoreRef.current) return;
+    const requestId = requestRef.current;
+    loadingMoreRef.current = true;
+    setLoadingMore(true);
+    try {
+      const { data, next } = await fetchPage(paramsRef.current, nextCursor);
+      if (requestId !== requestRef.current) return;
+      setItems(prev => [...prev, ...data]);
+      setNextCursor(next);
+    } catch (err) {
+      console.error(err);
+      onErrorRef.current?.(err);
+    } finally {
+      loadingMoreRef.current = false;
+      setLoadingMore(false);
+    }
+  };
+
+  // 관찰 콜백이 항상 최신 loadMore 를 부르도록
+  const loadMoreRef = useRef(loadMore);
+  loadMoreRef.current = loadMore;
+
+  const observerRef = useRef(null);
+  const sentinelRef = useCallback((node) => {
+    observerRef.current?.disconnect();
+    if (!node) return;
+    observerRef.current = new IntersectionObserver((entries) => {
+      if (entries[0].isIntersecting) loadMoreRef.current();
+    }, { rootMargin: '300px' });
+    observerRef.current.observe(node);
+  }, []);
+
+  useEffect(() => () => observerRef.current?.disconnect(), []);
+
+  return {
+    items,
+    setItems,
+    loading,
+    loadingMore,
+    hasMore: !!nextCursor,
+    load,
+    sentinelRef
+  };
+};
+
+export default useInfiniteList;